@@ -80,6 +80,7 @@ from .elevenlabs_client import (
     ElevenLabsAPIError,
     VoiceSettings,
     SynthesisResult,
+    TTSCache,
     UsageStats,
     create_client,
     quick_synthesize,
@@ -108,6 +109,7 @@ from .chapters import (
     ChapterList,
     ChapterType,
     embed_chapters,
+    embed_chapters_batch,
     export_chapters_json,
     export_chapters_podlove,
     export_chapters_webvtt,
@@ -133,6 +135,7 @@ from .deepgram_client import (
     DeepgramAPIError,
     TranscriptResult,
     WordInfo,
+    WordTimings,
     VADResult,
     create_client as create_deepgram_client,
     quick_transcribe,
@@ -307,6 +310,7 @@ __all__ = [
     "ElevenLabsAPIError",
     "VoiceSettings",
     "SynthesisResult",
+    "TTSCache",
     "UsageStats",
     "create_client",
     "quick_synthesize",
@@ -329,6 +333,7 @@ __all__ = [
     "ChapterList",
     "ChapterType",
     "embed_chapters",
+    "embed_chapters_batch",
     "export_chapters_json",
     "export_chapters_podlove",
     "export_chapters_webvtt",
@@ -348,6 +353,7 @@ __all__ = [
     "DeepgramAPIError",
     "TranscriptResult",
     "WordInfo",
+    "WordTimings",
     "VADResult",
     "create_deepgram_client",
     "quick_transcribe",
@@ -23,10 +23,22 @@ Usage:
     # Assemble episode from script
     audio = await assembler.assemble_episode(script, episode_number=3)
     audio.export("episode_03.mp3", format="mp3")
+
+    # Or stream the mix straight to disk (lower peak memory)
+    await assembler.assemble_and_export(script, "episode_03.mp3", episode_number=3)
 """
 
 import os
+import re
+import asyncio
 import logging
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
@@ -35,7 +47,26 @@ import io
 
 import numpy as np
 from pydub import AudioSegment
-from pydub.effects import normalize, compress_dynamic_range
+from pydub.effects import compress_dynamic_range
+from pydub.exceptions import CouldntEncodeError
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.ndimage import maximum_filter1d
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
 
 from .models import DialogueScript, DialogueSegment, SegmentType
 from .chapters import (
@@ -43,20 +74,174 @@ from .chapters import (
     ChapterList,
     ChapterType,
     embed_chapters,
+    export_chapters_ffmetadata,
     export_chapters_json,
     export_chapters_podlove,
     export_chapters_webvtt,
     generate_episode_chapters,
+    format_event_title,
     format_phase_title,
 )
 
 logger = logging.getLogger(__name__)
 
+# Segment event types that get their own chapter marker
+_CHAPTER_EVENT_TYPES = frozenset({"MURDER", "BANISHMENT", "ROLE_REVEAL", "VOTE_TALLY"})
+
 
 # =============================================================================
 # SIDECHAIN COMPRESSOR (DYNAMIC MIXING)
 # =============================================================================
 
+@njit(cache=True, fastmath=True, nogil=True)
+def _envelope_follower_kernel(
+    envelope_db: np.ndarray,
+    attack_coeff: float,
+    release_coeff: float,
+    hold_samples: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Attack/hold/release envelope follower (JIT-compiled when numba is available)."""
+    current_level = envelope_db[0]
+    hold_counter = 0
+
+    for i in range(len(envelope_db)):
+        input_level = envelope_db[i]
+
+        if input_level > current_level:
+            # Attack: input is louder, move up quickly
+            current_level = attack_coeff * current_level + (1 - attack_coeff) * input_level
+            hold_counter = hold_samples
+        elif hold_counter > 0:
+            hold_counter -= 1
+        else:
+            # Release: input is quieter, move down slowly
+            current_level = release_coeff * current_level + (1 - release_coeff) * input_level
+
+        out[i] = current_level
+
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _gain_curve_kernel(
+    level_db: np.ndarray,
+    threshold: float,
+    ratio: float,
+    knee: float,
+    range_limit: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Soft-knee compressor transfer curve; ``out`` may alias ``level_db``."""
+    slope = 1.0 - 1.0 / ratio
+    knee_low = threshold - knee / 2
+    knee_high = threshold + knee / 2
+
+    for i in range(len(level_db)):
+        level = level_db[i]
+
+        if level < knee_low:
+            reduction = 0.0
+        elif level > knee_high:
+            reduction = -(level - threshold) * slope
+        elif knee > 0:
+            # Quadratic interpolation in knee region
+            x = level - knee_low
+            reduction = -(x * x) / (2 * knee) * slope
+        else:
+            reduction = 0.0
+
+        out[i] = max(reduction, range_limit)
+
+    return out
+
+
+def _zero_extend(signal: np.ndarray, length: int) -> np.ndarray:
+    """Copy signal into a zero-initialized float32 buffer of the given length.
+
+    One allocation and one copy; the tail is already zero, unlike np.pad
+    which builds the padding separately.
+    """
+    result = np.zeros(length, dtype=np.float32)
+    copy_len = min(length, len(signal))
+    result[:copy_len] = signal[:copy_len]
+    return result
+
+
+def _lookahead_max(signal: np.ndarray, window: int) -> np.ndarray:
+    """Forward-looking running maximum: out[i] = max(signal[i:i + window]).
+
+    Uses scipy's C maximum filter when available, otherwise a van Herk /
+    Gil-Werman block decomposition. Both are O(N) regardless of window size.
+    The signal is edge-extended past its end.
+
+    Args:
+        signal: Input signal
+        window: Lookahead window in samples
+
+    Returns:
+        Running maximum, same length as input
+    """
+    n = len(signal)
+    if window <= 1 or n == 0:
+        return signal
+
+    if HAS_SCIPY:
+        return maximum_filter1d(signal, window, mode="nearest", origin=-(window // 2))
+
+    # Pad to a whole number of blocks that covers every window
+    num_blocks = -(-(n + window - 1) // window)
+    padded = np.empty(num_blocks * window, dtype=signal.dtype)
+    padded[:n] = signal
+    padded[n:] = signal[-1]
+    blocks = padded.reshape(num_blocks, window)
+
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[:n], prefix[window - 1:window - 1 + n])
+
+
+def _segment_phase(segment: Any) -> Optional[str]:
+    """Get a segment's phase, falling back to metadata["phase"] when unset."""
+    phase = getattr(segment, "phase", None)
+    if phase is None:
+        metadata = getattr(segment, "metadata", None)
+        if metadata:
+            phase = metadata.get("phase")
+    return phase
+
+
+def _pattern_to_regex(pattern: str) -> Optional[str]:
+    """Translate a track-name pattern into a regex fragment.
+
+    "music" and "sfx" match their "music_"/"sfx_" prefixes, "voice" is
+    handled separately via voice_segments, anything else is a prefix match.
+    """
+    pattern_lower = pattern.lower()
+    if pattern_lower in ("music", "sfx"):
+        return rf"{pattern_lower}_.*"
+    if pattern_lower == "voice":
+        return None
+    return re.escape(pattern_lower) + ".*"
+
+
+@lru_cache(maxsize=64)
+def _compile_track_patterns(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """Compile track-name patterns into one case-insensitive alternation.
+
+    Args:
+        patterns: Track name patterns
+
+    Returns:
+        Compiled regex to fullmatch against track names, or None if no
+        pattern can match a named track
+    """
+    fragments = [f for f in map(_pattern_to_regex, patterns) if f is not None]
+    if not fragments:
+        return None
+    return re.compile("|".join(fragments), re.IGNORECASE | re.DOTALL)
+
+
 @dataclass
 class SidechainConfig:
     """Configuration for sidechain compression.
@@ -74,9 +259,11 @@ class SidechainConfig:
         release_ms: Time to recover after trigger stops (50-500ms typical)
         makeup_gain_db: Gain applied after compression
         knee_db: Soft knee width (0 = hard knee, 6+ = soft knee)
-        lookahead_ms: Delay target signal to anticipate trigger onset
+        lookahead_ms: How far ahead of the target to read the trigger (anticipates onsets)
         hold_ms: Time to hold compression after trigger falls below threshold
         range_db: Maximum gain reduction (limits ducking depth)
+        control_rate_hz: Rate the envelope/gain path runs at; the gain curve
+                         is interpolated back to audio rate (0 = audio rate)
     """
     threshold_db: float = -24.0
     ratio: float = 4.0
@@ -87,6 +274,7 @@ class SidechainConfig:
     lookahead_ms: float = 5.0
     hold_ms: float = 50.0
     range_db: float = -24.0  # Max 24dB of gain reduction
+    control_rate_hz: float = 2000.0
 
 
 class SidechainCompressor:
@@ -100,7 +288,7 @@ class SidechainCompressor:
     1. Extract RMS envelope from trigger (voice) signal
     2. Apply attack/release smoothing to create gain control signal
     3. Compute gain reduction using compressor transfer function
-    4. Apply gain to target (music) signal with optional lookahead
+    4. Apply gain to target (music) signal, looking ahead on the trigger
 
     Example:
         compressor = SidechainCompressor(SidechainConfig(
@@ -124,6 +312,8 @@ class SidechainCompressor:
             config: Compression settings (uses defaults if None)
         """
         self.config = config or SidechainConfig()
+        # Output buffer reused across process() calls, grown to the longest target
+        self._scratch: Optional[np.ndarray] = None
 
     def process(
         self,
@@ -139,7 +329,9 @@ class SidechainCompressor:
             sample_rate: Audio sample rate in Hz
 
         Returns:
-            Compressed target signal as numpy array
+            Compressed target signal as a float32 view into the compressor's
+            scratch buffer. It is overwritten by the next process() call, so
+            copy it if it needs to outlive that.
         """
         if len(trigger) == 0 or len(target) == 0:
             return target
@@ -147,35 +339,71 @@ class SidechainCompressor:
         # Ensure signals are same length (pad shorter with zeros)
         max_len = max(len(trigger), len(target))
         if len(trigger) < max_len:
-            trigger = np.pad(trigger, (0, max_len - len(trigger)))
+            trigger = _zero_extend(trigger, max_len)
         if len(target) < max_len:
-            target = np.pad(target, (0, max_len - len(target)))
+            target = _zero_extend(target, max_len)
+
+        # Attack/release times are 10-150ms, so the envelope only needs
+        # control-rate resolution. Decimate the trigger by block RMS.
+        decimation = 1
+        if self.config.control_rate_hz > 0:
+            decimation = max(1, int(sample_rate // self.config.control_rate_hz))
+        control_rate = sample_rate / decimation
+        if decimation > 1:
+            trigger = self._block_rms(trigger, decimation)
 
         # Step 1: Extract envelope from trigger signal
-        envelope_db = self._extract_envelope(trigger, sample_rate)
+        envelope_db = self._extract_envelope(trigger, control_rate)
 
-        # Step 2: Apply attack/release smoothing
-        smoothed_envelope = self._apply_attack_release(envelope_db, sample_rate)
+        # Step 2: Apply lookahead so gain reacts to upcoming trigger peaks
+        lookahead_samples = int(self.config.lookahead_ms * control_rate / 1000)
+        if lookahead_samples > 0:
+            envelope_db = _lookahead_max(envelope_db, lookahead_samples + 1)
 
-        # Step 3: Compute gain reduction
-        gain_reduction_db = self._compute_gain_reduction(smoothed_envelope)
+        # Steps 3-4: Attack/release smoothing and gain reduction in one buffer
+        gain_reduction_db = self._compute_smoothed_gain(envelope_db, control_rate)
 
-        # Step 4: Apply lookahead by delaying target
-        lookahead_samples = int(self.config.lookahead_ms * sample_rate / 1000)
-        if lookahead_samples > 0:
-            # Delay target relative to gain envelope
-            target = np.pad(target, (lookahead_samples, 0))[:max_len]
+        if decimation > 1:
+            # Back to audio rate; block centres anchor the interpolation
+            block_centres = np.arange(len(gain_reduction_db)) * decimation + decimation / 2
+            gain_reduction_db = np.interp(
+                np.arange(max_len), block_centres, gain_reduction_db,
+            ).astype(np.float32)
+
+        # Step 5: Apply gain reduction (dB -> linear in place on our own buffer)
+        gain_linear = gain_reduction_db
+        gain_linear += self.config.makeup_gain_db
+        gain_linear /= 20
+        np.power(10.0, gain_linear, out=gain_linear)
 
-        # Step 5: Apply gain reduction
-        gain_linear = self._db_to_linear(gain_reduction_db + self.config.makeup_gain_db)
-        compressed = target * gain_linear
+        if self._scratch is None or self._scratch.size < max_len:
+            self._scratch = np.empty(max_len, dtype=np.float32)
+        compressed = self._scratch[:max_len]
+        np.multiply(target, gain_linear, out=compressed)
 
         return compressed
 
+    @staticmethod
+    def _block_rms(signal: np.ndarray, block_size: int) -> np.ndarray:
+        """Decimate a signal to the RMS of consecutive fixed-size blocks.
+
+        Args:
+            signal: Input signal
+            block_size: Samples per output value (last block is zero-padded)
+
+        Returns:
+            Block RMS values, ceil(len(signal) / block_size) long
+        """
+        num_blocks = -(-len(signal) // block_size)
+        padded = np.zeros(num_blocks * block_size, dtype=np.float32)
+        padded[:len(signal)] = signal
+        blocks = padded.reshape(num_blocks, block_size)
+        return np.sqrt(np.einsum("ij,ij->i", blocks, blocks) / block_size)
+
     def _extract_envelope(
         self,
         signal: np.ndarray,
-        sample_rate: int,
+        sample_rate: float,
         window_ms: float = 10.0,
     ) -> np.ndarray:
         """Extract RMS amplitude envelope from signal.
@@ -222,7 +450,7 @@ class SidechainCompressor:
     def _apply_attack_release(
         self,
         envelope_db: np.ndarray,
-        sample_rate: int,
+        sample_rate: float,
     ) -> np.ndarray:
         """Apply attack/release smoothing to envelope.
 
@@ -238,36 +466,17 @@ class SidechainCompressor:
         Returns:
             Smoothed envelope in dB
         """
-        # Convert time constants to filter coefficients
-        attack_coeff = np.exp(-1.0 / (self.config.attack_ms * sample_rate / 1000))
-        release_coeff = np.exp(-1.0 / (self.config.release_ms * sample_rate / 1000))
-        hold_samples = int(self.config.hold_ms * sample_rate / 1000)
-
-        # Apply envelope follower with attack/release
-        smoothed = np.zeros_like(envelope_db)
-        current_level = envelope_db[0]
-        hold_counter = 0
-
-        for i in range(len(envelope_db)):
-            input_level = envelope_db[i]
-
-            if input_level > current_level:
-                # Attack: input is louder, move up quickly
-                current_level = attack_coeff * current_level + (1 - attack_coeff) * input_level
-                hold_counter = hold_samples
-            else:
-                # Check hold time
-                if hold_counter > 0:
-                    hold_counter -= 1
-                else:
-                    # Release: input is quieter, move down slowly
-                    current_level = release_coeff * current_level + (1 - release_coeff) * input_level
-
-            smoothed[i] = current_level
-
-        return smoothed
+        attack_coeff, release_coeff, hold_samples = self._time_constants(sample_rate)
+        smoothed = np.empty(len(envelope_db), dtype=np.float32)
+        return _envelope_follower_kernel(
+            np.asarray(envelope_db, dtype=np.float64), attack_coeff, release_coeff, hold_samples, smoothed,
+        )
 
-    def _compute_gain_reduction(self, envelope_db: np.ndarray) -> np.ndarray:
+    def _compute_gain_reduction(
+        self,
+        envelope_db: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """Compute gain reduction from envelope using compressor curve.
 
         Implements soft-knee compression transfer function:
@@ -277,40 +486,57 @@ class SidechainCompressor:
 
         Args:
             envelope_db: Smoothed envelope in dB
+            out: float32 buffer for the result; may be envelope_db itself
+                to compute in place
 
         Returns:
             Gain reduction in dB (negative values = attenuation)
         """
-        threshold = self.config.threshold_db
-        ratio = self.config.ratio
-        knee = self.config.knee_db
-        range_limit = self.config.range_db
+        if out is None:
+            out = np.empty(len(envelope_db), dtype=np.float32)
+            envelope_db = np.asarray(envelope_db, dtype=np.float64)
+        return _gain_curve_kernel(
+            envelope_db,
+            self.config.threshold_db,
+            self.config.ratio,
+            self.config.knee_db,
+            self.config.range_db,
+            out,
+        )
 
-        # Compute gain reduction for each sample
-        gain_reduction = np.zeros_like(envelope_db)
+    def _compute_smoothed_gain(
+        self,
+        envelope_db: np.ndarray,
+        sample_rate: float,
+    ) -> np.ndarray:
+        """Smooth the envelope and apply the gain curve in one buffer.
 
-        for i in range(len(envelope_db)):
-            level = envelope_db[i]
+        The gain curve runs in place on the smoothed envelope, so the
+        whole step allocates a single float32 array.
 
-            # Below knee region: no compression
-            if level < threshold - knee / 2:
-                reduction = 0.0
+        Args:
+            envelope_db: Raw envelope in dB
+            sample_rate: Sample rate in Hz
 
-            # Above knee region: full compression
-            elif level > threshold + knee / 2:
-                over_threshold = level - threshold
-                reduction = -over_threshold * (1 - 1 / ratio)
+        Returns:
+            Gain reduction in dB as float32 (negative values = attenuation)
+        """
+        smoothed = self._apply_attack_release(envelope_db, sample_rate)
+        return self._compute_gain_reduction(smoothed, out=smoothed)
 
-            # In knee region: soft transition
-            else:
-                # Quadratic interpolation in knee region
-                x = level - (threshold - knee / 2)
-                reduction = -(x ** 2) / (2 * knee) * (1 - 1 / ratio)
+    def _time_constants(self, sample_rate: float) -> Tuple[float, float, int]:
+        """Convert attack/release/hold times to per-sample filter constants.
 
-            # Limit gain reduction to range
-            gain_reduction[i] = max(reduction, range_limit)
+        Args:
+            sample_rate: Sample rate in Hz
 
-        return gain_reduction
+        Returns:
+            Tuple of (attack_coeff, release_coeff, hold_samples)
+        """
+        attack_coeff = float(np.exp(-1.0 / (self.config.attack_ms * sample_rate / 1000)))
+        release_coeff = float(np.exp(-1.0 / (self.config.release_ms * sample_rate / 1000)))
+        hold_samples = int(self.config.hold_ms * sample_rate / 1000)
+        return attack_coeff, release_coeff, hold_samples
 
     @staticmethod
     def _linear_to_db(linear: Union[float, np.ndarray], floor_db: float = -96.0) -> Union[float, np.ndarray]:
@@ -346,6 +572,39 @@ class SidechainCompressor:
         return 10 ** (db / 20)
 
 
+# Multiplier taking integer samples of each sample width to [-1, 1]
+_SAMPLE_SCALE = {1: 1.0 / 128.0, 2: 1.0 / 32768.0, 4: 1.0 / 2147483648.0}
+
+# NumPy dtype of pydub's raw samples for each sample width
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# ffmpeg raw PCM input format for each sample width
+_PCM_FORMATS = {1: "s8", 2: "s16le", 4: "s32le"}
+
+# Mix accumulator dtype per sample width: int32 leaves 16 bits of headroom
+# over 8/16-bit samples (65536 full-scale tracks); 32-bit audio needs int64
+_ACCUMULATOR_DTYPES = {1: np.int32, 2: np.int32, 4: np.int64}
+
+
+def _decode_mp3(source: Union[str, Path, io.BytesIO]) -> AudioSegment:
+    """Decode MP3 audio from a path or in-memory buffer.
+
+    Forcing the mp3 decoder skips pydub's ffprobe pass, which would
+    otherwise spawn a second process and re-read the whole input just to
+    pick the (always 16-bit) output sample format. BytesIO wraps the
+    response bytes without copying them.
+
+    Args:
+        source: File path or BytesIO holding MP3 data
+
+    Returns:
+        Decoded AudioSegment
+    """
+    if isinstance(source, Path):
+        source = str(source)
+    return AudioSegment.from_file(source, format="mp3", codec="mp3")
+
+
 def audio_segment_to_numpy(audio: AudioSegment) -> Tuple[np.ndarray, int]:
     """Convert AudioSegment to numpy array.
 
@@ -357,18 +616,22 @@ def audio_segment_to_numpy(audio: AudioSegment) -> Tuple[np.ndarray, int]:
     """
     # Get raw samples
     samples = np.array(audio.get_array_of_samples())
+    scale = _SAMPLE_SCALE.get(audio.sample_width)
+    if scale is None:
+        return samples, audio.frame_rate
 
-    # Convert to float and normalize
-    if audio.sample_width == 1:
-        samples = samples.astype(np.float32) / 128.0 - 1.0
-    elif audio.sample_width == 2:
-        samples = samples.astype(np.float32) / 32768.0
-    elif audio.sample_width == 4:
-        samples = samples.astype(np.float32) / 2147483648.0
-
-    # If stereo, convert to mono by averaging channels
+    # Cast to float32 exactly once, then scale in place. Stereo is summed
+    # straight into float32 (averaging folded into the scale) so the int
+    # samples are never widened to a full interleaved float copy.
     if audio.channels == 2:
-        samples = samples.reshape(-1, 2).mean(axis=1)
+        samples = samples.reshape(-1, 2).sum(axis=1, dtype=np.float32)
+        samples *= scale / 2
+    else:
+        samples = samples.astype(np.float32)
+        samples *= scale
+
+    if audio.sample_width == 1:
+        samples -= 1.0
 
     return samples, audio.frame_rate
 
@@ -390,16 +653,20 @@ def numpy_to_audio_segment(
     Returns:
         pydub AudioSegment
     """
-    # Clip to valid range
-    samples = np.clip(samples, -1.0, 1.0)
+    # Clip to valid range (into a fresh float32 buffer we can scale in place)
+    samples = np.clip(samples, -1.0, 1.0, out=np.empty(len(samples), dtype=np.float32))
 
     # Convert to integer samples
     if sample_width == 1:
-        int_samples = ((samples + 1.0) * 128).astype(np.int8)
+        samples += 1.0
+        samples *= 128
+        int_samples = samples.astype(np.int8)
     elif sample_width == 2:
-        int_samples = (samples * 32767).astype(np.int16)
+        samples *= 32767
+        int_samples = samples.astype(np.int16)
     elif sample_width == 4:
-        int_samples = (samples * 2147483647).astype(np.int32)
+        samples *= 2147483647
+        int_samples = samples.astype(np.int32)
     else:
         raise ValueError(f"Unsupported sample width: {sample_width}")
 
@@ -416,6 +683,161 @@ def numpy_to_audio_segment(
     )
 
 
+def _build_duck_envelope(
+    length: int,
+    regions: List[Tuple[int, int]],
+    duck_gain: float,
+    fade_samples: int,
+) -> np.ndarray:
+    """Build a per-frame gain envelope that ducks inside the given regions.
+
+    Args:
+        length: Envelope length in frames
+        regions: (start, end) frame offsets to duck (may extend past bounds)
+        duck_gain: Linear gain applied inside each region
+        fade_samples: Length of the linear ramp on either side of a region
+
+    Returns:
+        Float32 envelope of 1.0 outside regions and duck_gain inside them
+    """
+    envelope = np.ones(length, dtype=np.float32)
+    if fade_samples > 0:
+        ramp_down = np.linspace(1.0, duck_gain, fade_samples, endpoint=False, dtype=np.float32)
+        ramp_up = ramp_down[::-1]
+
+    for start, end in regions:
+        start = max(0, int(start))
+        end = min(length, int(end))
+        if end <= start:
+            continue
+
+        envelope[start:end] = duck_gain
+
+        if fade_samples > 0:
+            # Ramps are combined with np.minimum so a neighbouring region's
+            # fade never lifts the gain inside an already ducked span
+            lo = max(0, start - fade_samples)
+            ramp = ramp_down[fade_samples - (start - lo):]
+            np.minimum(envelope[lo:start], ramp, out=envelope[lo:start])
+
+            hi = min(length, end + fade_samples)
+            ramp = ramp_up[:hi - end]
+            np.minimum(envelope[end:hi], ramp, out=envelope[end:hi])
+
+    return envelope
+
+
+def _apply_gain_envelope(audio: AudioSegment, envelope: np.ndarray) -> AudioSegment:
+    """Multiply an AudioSegment by a per-frame gain envelope.
+
+    Works on the raw interleaved samples so sample width, channel count
+    and frame rate of the input are preserved. The gain is applied in Q15
+    fixed point (integer multiply + shift), so the track is never widened
+    to float; unity gain leaves samples bit-exact.
+
+    Args:
+        audio: Source audio
+        envelope: Linear gain per frame in [0, 1] (at least as long as the audio)
+
+    Returns:
+        New AudioSegment with the gain applied
+    """
+    samples = np.array(audio.get_array_of_samples())
+    frames = samples.reshape(-1, audio.channels)
+    if len(envelope) < len(frames):
+        # Tolerate ms -> frame rounding at the tail by holding unity gain
+        envelope = np.pad(envelope, (0, len(frames) - len(envelope)), constant_values=1.0)
+
+    # Unity is 1 << 15, which needs int32; 32-bit audio needs an int64 accumulator
+    gain_q15 = np.rint(envelope[:len(frames)] * 32768).astype(np.int32)
+    accumulator = frames.astype(np.int64 if samples.itemsize >= 4 else np.int32)
+    accumulator *= gain_q15[:, np.newaxis]
+    accumulator >>= 15
+    return audio._spawn(accumulator.astype(samples.dtype).tobytes())
+
+
+def _peak_gain(samples: np.ndarray, sample_width: int, headroom_db: float = 0.1) -> float:
+    """Linear gain that puts the peak of integer samples headroom_db below full scale.
+
+    Args:
+        samples: Integer samples (any shape)
+        sample_width: Bytes per sample of the output format
+        headroom_db: Distance of the resulting peak below full scale in dB
+
+    Returns:
+        Gain to apply, or 1.0 if the samples are silent
+    """
+    if samples.size == 0:
+        return 1.0
+
+    # max/min instead of abs() so the most negative int doesn't overflow
+    peak = max(int(samples.max()), -int(samples.min()))
+    if peak == 0:
+        return 1.0
+
+    max_possible_amplitude = 2 ** (8 * sample_width - 1)
+    return max_possible_amplitude * 10 ** (-headroom_db / 20) / peak
+
+
+def _peak_normalize(audio: AudioSegment, headroom_db: float = 0.1) -> AudioSegment:
+    """Scale audio so its peak sits headroom_db below full scale.
+
+    NumPy equivalent of pydub.effects.normalize: one min/max reduction
+    for the peak and one vectorized multiply, without pydub's audioop
+    round trip.
+
+    Args:
+        audio: Audio to normalize
+        headroom_db: Distance of the resulting peak below full scale in dB
+
+    Returns:
+        Normalized AudioSegment (the input itself if it is silent)
+    """
+    samples = np.array(audio.get_array_of_samples())
+    gain = _peak_gain(samples, audio.sample_width, headroom_db)
+    if gain == 1.0:
+        return audio
+
+    scaled = np.rint(samples * gain)
+    limits = np.iinfo(samples.dtype)
+    np.clip(scaled, limits.min, limits.max, out=scaled)
+    return audio._spawn(scaled.astype(samples.dtype).tobytes())
+
+
+def _accumulate_planar(
+    buffer: np.ndarray,
+    audio: AudioSegment,
+    start_frame: int,
+    gain_q15: Optional[np.ndarray] = None,
+) -> None:
+    """Add an AudioSegment into a planar (channels, frames) accumulator.
+
+    The audio must already share the accumulator's frame rate and sample
+    width. Mono audio is broadcast to every accumulator channel. Frames
+    past the end of the accumulator are dropped, as with pydub overlay.
+
+    Args:
+        buffer: Planar integer accumulator, modified in place
+        audio: Audio to add
+        start_frame: Frame offset into the accumulator
+        gain_q15: Optional per-frame Q15 gain (1 << 15 = unity)
+    """
+    num_frames = min(int(audio.frame_count()), buffer.shape[1] - start_frame)
+    if num_frames <= 0:
+        return
+
+    samples = np.array(audio.get_array_of_samples())
+    # (channels, frames) view of the interleaved samples
+    planar = samples.reshape(-1, audio.channels)[:num_frames].T
+
+    if gain_q15 is not None:
+        planar = planar.astype(np.int64, order="C")
+        planar *= gain_q15[np.newaxis, :num_frames]
+        planar >>= 15
+
+    buffer[:, start_frame:start_frame + num_frames] += planar
+
+
 # =============================================================================
 # ENUMS AND DATA CLASSES
 # =============================================================================
@@ -446,6 +868,10 @@ class SFXType(str, Enum):
     WHISPER = "whisper"           # Secret conversations
 
 
+# Built-in SFX IDs, for telling them apart from custom asset IDs
+_SFX_TYPE_VALUES = frozenset(t.value for t in SFXType)
+
+
 @dataclass
 class AudioCue:
     """A cue marker for audio events."""
@@ -638,9 +1064,16 @@ class MusicLibrary(SoundLibrary):
         for mood, metadata in self.DEFAULT_TRACKS.items():
             self.register_asset(mood.value, metadata)
 
+        # Unfitted track per mood; beds fitted to a duration are not kept,
+        # since exact durations rarely repeat and long beds are large
+        self._mood_tracks: Dict[MusicMood, AudioSegment] = {}
+
     def get_for_mood(self, mood: MusicMood, duration_ms: Optional[int] = None) -> AudioSegment:
         """Get music track for a specific mood.
 
+        The mood's source track is loaded once; looping/trimming to
+        duration_ms happens on each call.
+
         Args:
             mood: Desired music mood
             duration_ms: Optional duration to trim/loop to
@@ -648,11 +1081,13 @@ class MusicLibrary(SoundLibrary):
         Returns:
             AudioSegment for the mood
         """
-        audio = self.get(mood.value)
-
+        audio = self._mood_tracks.get(mood)
         if audio is None:
-            metadata = self.DEFAULT_TRACKS.get(mood, {"duration_ms": 60000})
-            audio = self._generate_placeholder(mood.value, metadata["duration_ms"])
+            audio = self.get(mood.value)
+            if audio is None:
+                metadata = self.DEFAULT_TRACKS.get(mood, {"duration_ms": 60000})
+                audio = self._generate_placeholder(mood.value, metadata["duration_ms"])
+            self._mood_tracks[mood] = audio
 
         # Adjust duration if specified
         if duration_ms:
@@ -756,16 +1191,24 @@ class AudioTimeline:
         self.cues: List[AudioCue] = []
         self._sample_rate = 44100
         self._channels = 2
+        self._cached_duration_ms: Optional[int] = None
+        # voice_segments ordered by start_ms (true unless an explicit start_ms goes backwards)
+        self._voice_sorted = True
 
     @property
     def duration_ms(self) -> int:
-        """Total timeline duration in milliseconds."""
-        max_end = 0
-        for track in self.tracks:
-            max_end = max(max_end, track.end_ms)
-        for segment in self.voice_segments:
-            max_end = max(max_end, segment.end_ms)
-        return max_end
+        """Total timeline duration in milliseconds.
+
+        Cached between calls; add_track() and add_voice_segment() invalidate it.
+        """
+        if self._cached_duration_ms is None:
+            max_end = 0
+            for track in self.tracks:
+                max_end = max(max_end, track.end_ms)
+            for segment in self.voice_segments:
+                max_end = max(max_end, segment.end_ms)
+            self._cached_duration_ms = max_end
+        return self._cached_duration_ms
 
     def add_voice_segment(
         self,
@@ -792,12 +1235,16 @@ class AudioTimeline:
             else:
                 start_ms = 0
 
+        if self.voice_segments and start_ms < self.voice_segments[-1].start_ms:
+            self._voice_sorted = False
+
         voice_audio = VoiceSegmentAudio(
             segment=segment,
             audio=audio,
             start_ms=start_ms,
         )
         self.voice_segments.append(voice_audio)
+        self._cached_duration_ms = None
 
         # Add cues from segment
         self._add_segment_cues(voice_audio)
@@ -867,6 +1314,7 @@ class AudioTimeline:
             duck_under_voice=duck_under_voice,
         )
         self.tracks.append(track)
+        self._cached_duration_ms = None
         return track
 
     def add_music_bed(
@@ -934,42 +1382,189 @@ class AudioTimeline:
     def mix(self, normalize_output: bool = True) -> AudioSegment:
         """Mix all tracks into final audio.
 
+        Tracks and voice segments are summed into a planar (channels,
+        frames) integer accumulator, so per-track gain and ducking are
+        contiguous per-channel multiplies and nothing clips until the end.
+        The output format follows pydub's overlay rules: the highest frame
+        rate, channel count and sample width among the inputs.
+
         Args:
             normalize_output: Whether to normalize the final mix
 
         Returns:
             Mixed AudioSegment
         """
+        buffer, frame_rate, sample_width = self._mix_planar()
+
+        # Normalize if requested, then clip back to the output sample width
+        if normalize_output:
+            gain = _peak_gain(buffer, sample_width)
+            if gain != 1.0:
+                buffer = np.rint(buffer * gain)
+        limits = np.iinfo(_SAMPLE_DTYPES[sample_width])
+        np.clip(buffer, limits.min, limits.max, out=buffer)
+
+        # Interleave channels for pydub
+        interleaved = buffer.T.astype(_SAMPLE_DTYPES[sample_width], order="C")
+        return AudioSegment(
+            data=interleaved.tobytes(),
+            sample_width=sample_width,
+            frame_rate=frame_rate,
+            channels=buffer.shape[0],
+        )
+
+    def mix_to_file(
+        self,
+        output_path: Union[str, Path],
+        format: str = "mp3",
+        bitrate: Optional[str] = None,
+        normalize_output: bool = True,
+        tags: Optional[Dict[str, str]] = None,
+        chunk_ms: int = 1000,
+        metadata_path: Optional[str] = None,
+    ) -> str:
+        """Mix all tracks and encode straight to a file via ffmpeg.
+
+        Produces the same mix as mix(), but normalization, clipping and
+        interleaving happen one chunk at a time while PCM is piped to
+        ffmpeg, so no full-length AudioSegment (or pydub's intermediate
+        WAV) is ever built.
+
+        Args:
+            output_path: Output file path
+            format: ffmpeg output format (e.g. "mp3", "ipod", "wav")
+            bitrate: Optional audio bitrate (e.g. "192k")
+            normalize_output: Whether to normalize the final mix
+            tags: Optional metadata tags
+            chunk_ms: Amount of audio written to ffmpeg per chunk
+            metadata_path: Optional FFMETADATA file (e.g. chapters) to mux in
+                           during the same encode
+
+        Returns:
+            Path to the encoded file
+
+        Raises:
+            CouldntEncodeError: If ffmpeg fails
+        """
+        buffer, frame_rate, sample_width = self._mix_planar()
+        channels, total_frames = buffer.shape
+
+        gain = _peak_gain(buffer, sample_width) if normalize_output else 1.0
+        dtype = _SAMPLE_DTYPES[sample_width]
+        limits = np.iinfo(dtype)
+
+        command = [
+            AudioSegment.converter, "-y", "-loglevel", "error",
+            "-f", _PCM_FORMATS[sample_width],
+            "-ar", str(frame_rate),
+            "-ac", str(channels),
+            "-i", "pipe:0",
+        ]
+        if metadata_path:
+            command.extend(["-i", metadata_path, "-map", "0:a", "-map_metadata", "1"])
+        command.extend(["-f", format])
+        if bitrate:
+            command.extend(["-b:a", bitrate])
+        for key, value in (tags or {}).items():
+            command.extend(["-metadata", f"{key}={value}"])
+        if tags and format == "mp3":
+            command.extend(["-id3v2_version", "4"])
+        command.append(str(output_path))
+
+        chunk_frames = max(1, int(frame_rate * chunk_ms / 1000))
+
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+            )
+            try:
+                for start in range(0, total_frames, chunk_frames):
+                    chunk = buffer[:, start:start + chunk_frames]
+                    if gain != 1.0:
+                        chunk = np.rint(chunk * gain)
+                    chunk = np.clip(chunk, limits.min, limits.max)
+                    process.stdin.write(chunk.T.astype(dtype, order="C").tobytes())
+            except BrokenPipeError:
+                # ffmpeg exited early; its stderr explains why
+                pass
+            except BaseException:
+                process.kill()
+                raise
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+                returncode = process.wait()
+
+            if returncode != 0:
+                stderr.seek(0)
+                raise CouldntEncodeError(
+                    f"Encoding {output_path} failed: "
+                    f"{stderr.read().decode(errors='replace').strip()}"
+                )
+
+        return str(output_path)
+
+    def _mix_planar(self) -> Tuple[np.ndarray, int, int]:
+        """Sum all tracks and voice segments into a planar accumulator.
+
+        Returns:
+            Tuple of (integer buffer shaped (channels, frames), frame_rate,
+            sample_width). The buffer is not normalized or clipped.
+        """
         duration = self.duration_ms
         if duration == 0:
-            return AudioSegment.silent(duration=1000)
+            # One second of silence, matching AudioSegment.silent()
+            return np.zeros((1, 11025), dtype=_ACCUMULATOR_DTYPES[2]), 11025, 2
 
-        # Create base silent track
-        mixed = AudioSegment.silent(duration=duration)
+        # Base format (pydub's silent base is 11025 Hz mono 16-bit)
+        sources = [track.audio for track in self.tracks]
+        sources.extend(voice.audio for voice in self.voice_segments)
+        frame_rate = max([11025] + [audio.frame_rate for audio in sources])
+        channels = max([1] + [audio.channels for audio in sources])
+        sample_width = max([2] + [audio.sample_width for audio in sources])
 
-        # Calculate voice regions for ducking
-        voice_regions = self._calculate_voice_regions()
+        def conform(audio: AudioSegment) -> AudioSegment:
+            return audio.set_frame_rate(frame_rate).set_sample_width(sample_width)
 
-        # Add music/SFX tracks with ducking
-        for track in self.tracks:
-            track_audio = track.audio + track.volume_db
+        total_frames = int(duration * frame_rate / 1000)
+        buffer = np.zeros((channels, total_frames), dtype=_ACCUMULATOR_DTYPES[sample_width])
 
-            # Apply ducking if needed
-            if track.duck_under_voice:
-                track_audio = self._apply_ducking(track_audio, track.start_ms, voice_regions)
+        # Add voice segments, collecting their regions for ducking in the same pass
+        regions = []
+        for voice in self.voice_segments:
+            _accumulate_planar(buffer, conform(voice.audio), int(voice.start_ms * frame_rate / 1000))
+            regions.append((voice.start_ms, voice.end_ms))
+        voice_regions = self._merge_regions(regions)
 
-            # Overlay at correct position
-            mixed = mixed.overlay(track_audio, position=track.start_ms)
+        # Ducking envelope is built once and shared by all ducked tracks
+        duck_envelope: Optional[np.ndarray] = None
 
-        # Add voice segments (always on top)
-        for voice in self.voice_segments:
-            mixed = mixed.overlay(voice.audio, position=voice.start_ms)
+        # Add music/SFX tracks with volume and ducking folded into one Q15 gain
+        for track in self.tracks:
+            track_audio = conform(track.audio)
+            start_frame = int(track.start_ms * frame_rate / 1000)
+            num_frames = int(track_audio.frame_count())
+            gain = SidechainCompressor._db_to_linear(track.volume_db)
 
-        # Normalize if requested
-        if normalize_output:
-            mixed = normalize(mixed)
+            gain_q15 = None
+            if track.duck_under_voice:
+                if duck_envelope is None:
+                    duck_envelope = self._compute_duck_envelope(
+                        sample_rate=frame_rate, voice_regions=voice_regions,
+                    )
+                envelope = duck_envelope[start_frame:start_frame + num_frames] * gain
+                gain_q15 = np.rint(envelope * 32768).astype(np.int64)
+            elif gain != 1.0:
+                gain_q15 = np.full(num_frames, round(gain * 32768), dtype=np.int64)
 
-        return mixed
+            _accumulate_planar(buffer, track_audio, start_frame, gain_q15)
+
+        return buffer, frame_rate, sample_width
 
     def _calculate_voice_regions(self) -> List[Tuple[int, int]]:
         """Calculate time regions where voice is active.
@@ -977,12 +1572,25 @@ class AudioTimeline:
         Returns:
             List of (start_ms, end_ms) tuples
         """
-        regions = []
-        for voice in self.voice_segments:
-            regions.append((voice.start_ms, voice.end_ms))
+        return self._merge_regions(
+            [(voice.start_ms, voice.end_ms) for voice in self.voice_segments]
+        )
+
+    def _merge_regions(self, regions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Merge overlapping (start_ms, end_ms) voice regions.
 
-        # Sort and merge overlapping regions
-        regions.sort(key=lambda x: x[0])
+        Args:
+            regions: Regions in voice_segments order
+
+        Returns:
+            Sorted, non-overlapping regions
+        """
+        # Segments are appended in time order in the common case, so only
+        # sort when add_voice_segment() saw an out-of-order start
+        if not self._voice_sorted:
+            regions = sorted(regions, key=lambda x: x[0])
+
+        # Merge overlapping regions in one pass
         merged = []
         for start, end in regions:
             if merged and start <= merged[-1][1]:
@@ -993,6 +1601,44 @@ class AudioTimeline:
 
         return merged
 
+    def _compute_duck_envelope(
+        self,
+        duck_db: float = -12.0,
+        fade_ms: int = 200,
+        sample_rate: Optional[int] = None,
+        voice_regions: Optional[List[Tuple[int, int]]] = None,
+    ) -> np.ndarray:
+        """Build a timeline-wide ducking envelope from the voice regions.
+
+        Ducked tracks slice their own window out of this envelope, so the
+        voice regions are walked once per mix instead of once per track.
+
+        Args:
+            duck_db: Amount to duck in dB
+            fade_ms: Fade time for ducking
+            sample_rate: Envelope resolution in Hz (timeline rate if None)
+            voice_regions: Precomputed merged regions (calculated if None)
+
+        Returns:
+            Float32 gain envelope covering the whole timeline
+        """
+        if voice_regions is None:
+            voice_regions = self._calculate_voice_regions()
+
+        sample_rate = sample_rate or self._sample_rate
+        frames_per_ms = sample_rate / 1000
+        regions = [
+            (start * frames_per_ms, end * frames_per_ms)
+            for start, end in voice_regions
+        ]
+
+        return _build_duck_envelope(
+            int(np.ceil(self.duration_ms * frames_per_ms)),
+            regions,
+            duck_gain=SidechainCompressor._db_to_linear(duck_db),
+            fade_samples=int(fade_ms * frames_per_ms),
+        )
+
     def _apply_ducking(
         self,
         audio: AudioSegment,
@@ -1001,7 +1647,7 @@ class AudioTimeline:
         duck_db: float = -12.0,
         fade_ms: int = 200,
     ) -> AudioSegment:
-        """Apply volume ducking during voice regions (simple cut-based).
+        """Apply volume ducking during voice regions (fixed gain envelope).
 
         This is the legacy ducking method that applies fixed dB reduction
         during voice regions. For smoother, more professional results,
@@ -1017,39 +1663,25 @@ class AudioTimeline:
         Returns:
             Ducked AudioSegment
         """
-        track_end = track_start + len(audio)
-
-        # Find overlapping voice regions
-        for voice_start, voice_end in voice_regions:
-            # Check for overlap
-            if voice_end < track_start or voice_start > track_end:
-                continue
-
-            # Calculate overlap in track's time frame
-            overlap_start = max(0, voice_start - track_start)
-            overlap_end = min(len(audio), voice_end - track_start)
-
-            if overlap_end <= overlap_start:
-                continue
-
-            # Extract and duck the overlapping section
-            before = audio[:max(0, overlap_start - fade_ms)]
-            duck_section = audio[overlap_start:overlap_end] + duck_db
-            after = audio[min(len(audio), overlap_end + fade_ms):]
-
-            # Add fades
-            if overlap_start > fade_ms:
-                fade_out = audio[overlap_start - fade_ms:overlap_start].fade_out(fade_ms)
-                before = before + fade_out + duck_db
-
-            if overlap_end + fade_ms < len(audio):
-                fade_in = audio[overlap_end:overlap_end + fade_ms].fade_in(fade_ms)
-                after = (fade_in + duck_db) + after
+        num_frames = int(audio.frame_count())
+        if num_frames == 0 or not voice_regions:
+            return audio
+
+        # Build one gain envelope in the track's frame domain and apply it
+        # in a single multiply instead of slicing and re-concatenating
+        frames_per_ms = audio.frame_rate / 1000
+        local_regions = [
+            ((voice_start - track_start) * frames_per_ms, (voice_end - track_start) * frames_per_ms)
+            for voice_start, voice_end in voice_regions
+        ]
+        envelope = _build_duck_envelope(
+            num_frames,
+            local_regions,
+            duck_gain=SidechainCompressor._db_to_linear(duck_db),
+            fade_samples=int(fade_ms * frames_per_ms),
+        )
 
-            # Reconstruct
-            audio = before + duck_section + after
-
-        return audio
+        return _apply_gain_envelope(audio, envelope)
 
     def apply_sidechain_compression(
         self,
@@ -1109,37 +1741,56 @@ class AudioTimeline:
                 range_db=-18.0,  # Max 18dB reduction
             )
 
-        compressor = SidechainCompressor(config)
-
         # Normalize input to lists
         if isinstance(trigger_tracks, str):
             trigger_tracks = [trigger_tracks]
         if isinstance(duck_tracks, str):
             duck_tracks = [duck_tracks]
 
+        # Find duck tracks first - nothing to build if none match
+        duck_regex = _compile_track_patterns(tuple(duck_tracks))
+        matching = [
+            track for track in self.tracks
+            if duck_regex is not None and duck_regex.fullmatch(track.name)
+        ]
+        if not matching:
+            logger.debug(f"No tracks match duck patterns {duck_tracks}")
+            return
+
         # Build combined trigger signal from matching tracks/segments
         trigger_signal = self._build_trigger_signal(trigger_tracks)
         if trigger_signal is None or len(trigger_signal) == 0:
             logger.warning("No trigger signal found for sidechain compression")
             return
 
-        # Apply compression to each matching duck track
-        for track in self.tracks:
-            if not self._track_matches_patterns(track.name, duck_tracks):
-                continue
+        # Compressor scratch and the trigger padding buffer are per worker
+        # thread, so tracks can be compressed concurrently
+        worker_state = threading.local()
+
+        def compress_track(track: AudioTrack) -> None:
+            compressor = getattr(worker_state, "compressor", None)
+            if compressor is None:
+                compressor = worker_state.compressor = SidechainCompressor(config)
 
             # Convert track audio to numpy
             target_samples, sample_rate = audio_segment_to_numpy(track.audio)
+            num_samples = len(target_samples)
+
+            aligned_buffer = getattr(worker_state, "aligned_buffer", None)
+            if aligned_buffer is None or len(aligned_buffer) < num_samples:
+                aligned_buffer = worker_state.aligned_buffer = np.empty(num_samples, dtype=np.float32)
 
             # Align trigger signal with track position
             aligned_trigger = self._align_signal_to_track(
                 trigger_signal,
                 track.start_ms,
-                len(target_samples),
-                sample_rate
+                num_samples,
+                sample_rate,
+                out=aligned_buffer[:num_samples],
             )
 
-            # Apply sidechain compression
+            # Apply sidechain compression (result is a view into the
+            # compressor's scratch buffer, consumed before the next track)
             compressed_samples = compressor.process(
                 trigger=aligned_trigger,
                 target=target_samples,
@@ -1159,6 +1810,18 @@ class AudioTimeline:
 
             logger.debug(f"Applied sidechain compression to track: {track.name}")
 
+        # Apply compression to each matching duck track
+        max_workers = min(len(matching), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # list() re-raises the first worker exception, if any
+                list(pool.map(compress_track, matching))
+        else:
+            for track in matching:
+                compress_track(track)
+
+        self._cached_duration_ms = None
+
     def _build_trigger_signal(self, patterns: List[str]) -> Optional[np.ndarray]:
         """Build combined trigger signal from matching tracks/voice segments.
 
@@ -1176,6 +1839,9 @@ class AudioTimeline:
         sample_rate = self._sample_rate
         total_samples = int(duration_ms * sample_rate / 1000)
         combined = np.zeros(total_samples, dtype=np.float32)
+        # Reused for |samples| of each segment so the max-accumulate below
+        # does no per-segment allocation
+        scratch = np.empty(total_samples, dtype=np.float32)
 
         has_content = False
 
@@ -1194,15 +1860,16 @@ class AudioTimeline:
                     end_sample = total_samples
 
                 if start_sample < total_samples and len(voice_samples) > 0:
-                    combined[start_sample:end_sample] = np.maximum(
-                        combined[start_sample:end_sample],
-                        np.abs(voice_samples[:end_sample - start_sample])
-                    )
+                    n = end_sample - start_sample
+                    window = combined[start_sample:end_sample]
+                    np.abs(voice_samples[:n], out=scratch[:n])
+                    np.maximum(window, scratch[:n], out=window)
                     has_content = True
 
         # Check for named track patterns
+        track_regex = _compile_track_patterns(tuple(patterns))
         for track in self.tracks:
-            if self._track_matches_patterns(track.name, patterns):
+            if track_regex is not None and track_regex.fullmatch(track.name):
                 track_samples, track_sr = audio_segment_to_numpy(track.audio)
 
                 start_sample = int(track.start_ms * sample_rate / 1000)
@@ -1213,10 +1880,10 @@ class AudioTimeline:
                     end_sample = total_samples
 
                 if start_sample < total_samples and len(track_samples) > 0:
-                    combined[start_sample:end_sample] = np.maximum(
-                        combined[start_sample:end_sample],
-                        np.abs(track_samples[:end_sample - start_sample])
-                    )
+                    n = end_sample - start_sample
+                    window = combined[start_sample:end_sample]
+                    np.abs(track_samples[:n], out=scratch[:n])
+                    np.maximum(window, scratch[:n], out=window)
                     has_content = True
 
         return combined if has_content else None
@@ -1227,6 +1894,7 @@ class AudioTimeline:
         track_start_ms: int,
         target_length: int,
         sample_rate: int,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Align a timeline-wide signal to a specific track's time window.
 
@@ -1235,22 +1903,29 @@ class AudioTimeline:
             track_start_ms: Track's start position in timeline
             target_length: Length of target track in samples
             sample_rate: Sample rate
+            out: Optional buffer of target_length samples, used when the
+                 window runs past the end of the signal and needs padding
 
         Returns:
-            Signal segment aligned to track's time window
+            Signal segment aligned to track's time window (a view of
+            signal when the window fits, otherwise the zero-padded buffer)
         """
         start_sample = int(track_start_ms * sample_rate / 1000)
         end_sample = start_sample + target_length
 
-        if start_sample >= len(signal):
-            return np.zeros(target_length, dtype=np.float32)
+        if end_sample <= len(signal):
+            return signal[start_sample:end_sample]
+
+        copy_len = max(0, len(signal) - start_sample)
 
-        if end_sample > len(signal):
-            # Pad with zeros at end
-            segment = signal[start_sample:]
-            return np.pad(segment, (0, target_length - len(segment)))
+        if out is None:
+            # Fresh zero-initialized buffer: only the overlap needs copying
+            return _zero_extend(signal[start_sample:start_sample + copy_len], target_length)
 
-        return signal[start_sample:end_sample]
+        # Copy what overlaps, then zero the tail in place
+        out[:copy_len] = signal[start_sample:start_sample + copy_len]
+        out[copy_len:] = 0.0
+        return out
 
     def _track_matches_patterns(self, track_name: str, patterns: List[str]) -> bool:
         """Check if a track name matches any of the given patterns.
@@ -1262,27 +1937,8 @@ class AudioTimeline:
         Returns:
             True if track matches any pattern
         """
-        track_lower = track_name.lower()
-
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-
-            # Special handling for common patterns
-            if pattern_lower == "music":
-                if track_lower.startswith("music_"):
-                    return True
-            elif pattern_lower == "sfx":
-                if track_lower.startswith("sfx_"):
-                    return True
-            elif pattern_lower == "voice":
-                # Voice is handled separately via voice_segments
-                continue
-            else:
-                # Direct match or prefix match
-                if track_lower == pattern_lower or track_lower.startswith(pattern_lower):
-                    return True
-
-        return False
+        regex = _compile_track_patterns(tuple(patterns))
+        return regex is not None and regex.fullmatch(track_name) is not None
 
     def generate_chapters(
         self,
@@ -1317,58 +1973,46 @@ class AudioTimeline:
         if not self.voice_segments:
             return chapters
 
-        # Track phase transitions
-        current_phase = None
-        phase_start_ms = 0
+        # One phase chapter per run of consecutive segments sharing a phase.
+        # Segments without a phase don't break a run.
+        phased = ((voice, _segment_phase(voice.segment)) for voice in self.voice_segments)
+        for phase, run in groupby(filter(itemgetter(1), phased), key=itemgetter(1)):
+            first_voice, _ = next(run)
+            chapters.add_phase(phase=phase, start_ms=first_voice.start_ms)
 
+        # Events and confessionals
         for voice in self.voice_segments:
             segment = voice.segment
+            start_ms = voice.start_ms
 
-            # Get phase from segment
-            phase = getattr(segment, "phase", None)
-            if phase is None and hasattr(segment, "metadata"):
-                phase = segment.metadata.get("phase")
-
-            # Phase changed - add chapter
-            if phase and phase != current_phase:
-                chapters.add_phase(
-                    phase=phase,
-                    start_ms=voice.start_ms,
-                )
-                current_phase = phase
-                phase_start_ms = voice.start_ms
+            # Read each segment attribute once up front
+            event_type = getattr(segment, "event_type", None) if include_events else None
+            speaker_name = getattr(segment, "speaker_name", None)
 
             # Check for significant events
-            if include_events:
-                event_type = getattr(segment, "event_type", None)
-                if event_type in ("MURDER", "BANISHMENT", "ROLE_REVEAL", "VOTE_TALLY"):
-                    # Get event details for better titles
-                    details = {}
-                    if hasattr(segment, "speaker_name"):
-                        if event_type == "MURDER":
-                            details["victim_name"] = segment.speaker_name
-                        elif event_type == "BANISHMENT":
-                            details["banished_name"] = segment.speaker_name
-
-                    from .chapters import format_event_title
-                    chapters.add_event(
-                        event_type=event_type,
-                        start_ms=voice.start_ms,
-                        title=format_event_title(event_type, details),
-                    )
+            if event_type in _CHAPTER_EVENT_TYPES:
+                # Get event details for better titles
+                details = {}
+                if speaker_name:
+                    if event_type == "MURDER":
+                        details["victim_name"] = speaker_name
+                    elif event_type == "BANISHMENT":
+                        details["banished_name"] = speaker_name
+
+                chapters.add_event(
+                    event_type=event_type,
+                    start_ms=start_ms,
+                    title=format_event_title(event_type, details),
+                )
 
             # Check for confessionals
-            if include_confessionals:
-                seg_type = segment.segment_type
-                if seg_type == SegmentType.CONFESSIONAL:
-                    speaker_name = getattr(segment, "speaker_name", None)
-                    speaker_id = getattr(segment, "speaker_id", None)
-                    if speaker_name:
-                        chapters.add_confessional(
-                            speaker_name=speaker_name,
-                            speaker_id=speaker_id or "unknown",
-                            start_ms=voice.start_ms,
-                        )
+            if include_confessionals and speaker_name:
+                if segment.segment_type == SegmentType.CONFESSIONAL:
+                    chapters.add_confessional(
+                        speaker_name=speaker_name,
+                        speaker_id=getattr(segment, "speaker_id", None) or "unknown",
+                        start_ms=start_ms,
+                    )
 
         # Finalize and clean up
         chapters.finalize(self.duration_ms)
@@ -1393,6 +2037,8 @@ class EpisodeAudioAssembler:
         output_bitrate: str = "192k",
         use_sidechain: bool = True,
         sidechain_config: Optional[SidechainConfig] = None,
+        tts_concurrency: int = 3,
+        mix_in_process: bool = False,
     ):
         """Initialize episode assembler.
 
@@ -1406,6 +2052,12 @@ class EpisodeAudioAssembler:
                            If False, uses legacy simple ducking.
             sidechain_config: Custom sidechain compression settings. If None, uses
                               optimized defaults for voice-over-music.
+            tts_concurrency: Maximum number of voice synthesis requests in flight
+                             at once. Match this to the ElevenLabs plan's limit.
+            mix_in_process: Run assemble_episode()'s mix in a worker process so
+                            concurrent episode builds use separate cores. The
+                            timeline's audio is pickled across, so this only
+                            pays off when several episodes are built at once.
         """
         self.client = elevenlabs_client
         self.music_library = music_library or MusicLibrary()
@@ -1415,6 +2067,9 @@ class EpisodeAudioAssembler:
         self.use_sidechain = use_sidechain
         self.sidechain_config = sidechain_config
 
+        # Concurrency limit for voice synthesis
+        self._tts_concurrency = max(1, tts_concurrency)
+
         # Timing configuration
         self.segment_gap_ms = 500       # Gap between dialogue segments
         self.phase_transition_ms = 2000  # Transition between phases
@@ -1425,32 +2080,183 @@ class EpisodeAudioAssembler:
         self._last_timeline: Optional[AudioTimeline] = None
         self._last_episode_number: int = 0
 
+        # Worker processes for mixing (created on first use)
+        self.mix_in_process = mix_in_process
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """Shut down the mixing worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     async def assemble_episode(
         self,
         script: DialogueScript,
         episode_number: int = 1,
         include_music: bool = True,
         include_sfx: bool = True,
+        normalize: bool = False,
     ) -> AudioSegment:
         """Assemble complete episode audio from script.
 
+        The mix is not peak-normalized by default, which saves a full pass
+        over the PCM buffer; use assemble_and_export() (which normalizes
+        while streaming) or pass normalize=True for the old behavior.
+
         Args:
             script: DialogueScript with all segments
             episode_number: Episode number for metadata
             include_music: Whether to include background music
             include_sfx: Whether to include sound effects
+            normalize: Whether to peak-normalize the final mix
 
         Returns:
             Complete episode AudioSegment
         """
+        timeline = await self._build_timeline(script, episode_number, include_music, include_sfx)
+
+        # Mix everything
+        if self.mix_in_process:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            mixed = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _mix_timeline, timeline, normalize,
+            )
+        else:
+            mixed = timeline.mix(normalize_output=normalize)
+
+        logger.info(f"Episode {episode_number} assembled: {len(mixed) / 1000:.1f}s")
+
+        return mixed
+
+    async def assemble_and_export(
+        self,
+        script: DialogueScript,
+        output_path: str,
+        episode_number: int = 1,
+        include_music: bool = True,
+        include_sfx: bool = True,
+        format: Optional[str] = None,
+        chapters: Optional[ChapterList] = None,
+        embed_chapters: bool = True,
+        export_chapter_files: bool = True,
+        return_audio: bool = False,
+        normalize: bool = True,
+    ) -> Union[str, Tuple[str, AudioSegment]]:
+        """Assemble an episode and encode it straight to a file.
+
+        The mix is streamed to ffmpeg chunk by chunk instead of being
+        materialized as an AudioSegment and re-encoded through pydub, which
+        roughly halves peak memory for long episodes. Chapters are embedded
+        as a post-pass on the encoded file.
+
+        Args:
+            script: DialogueScript with all segments
+            output_path: Output file path
+            episode_number: Episode number for metadata
+            include_music: Whether to include background music
+            include_sfx: Whether to include sound effects
+            format: Override output format
+            chapters: ChapterList to embed (auto-generated if None)
+            embed_chapters: Whether to embed chapters in audio file
+            export_chapter_files: Whether to export external chapter files
+            return_audio: Also return the mixed AudioSegment (uses the
+                          in-memory mix() + export_episode() path)
+            normalize: Whether to peak-normalize the mix. When streaming, the
+                       gain is applied per chunk as PCM is written, so this
+                       costs one peak scan rather than an extra buffer pass.
+
+        Returns:
+            Path to exported file, or (path, audio) if return_audio is True
+        """
+        if return_audio:
+            audio = await self.assemble_episode(
+                script, episode_number, include_music, include_sfx, normalize=normalize,
+            )
+            path = self.export_episode(
+                audio,
+                output_path,
+                format=format,
+                chapters=chapters,
+                embed_chapters=embed_chapters,
+                export_chapter_files=export_chapter_files,
+            )
+            return path, audio
+
+        timeline = await self._build_timeline(script, episode_number, include_music, include_sfx)
+
+        format = format or self.output_format
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if format == "mp3":
+            timeline.mix_to_file(
+                output_path,
+                format="mp3",
+                bitrate=self.output_bitrate,
+                normalize_output=normalize,
+                tags=self._export_tags(),
+            )
+        elif format in ("m4a", "aac"):
+            # Mux chapters in during the encode itself, so there is no
+            # temp file and no second remux pass
+            chapters = self._resolve_chapters(chapters)
+            if embed_chapters and chapters and len(chapters) > 0:
+                if not chapters.is_finalized:
+                    chapters.finalize(timeline.duration_ms)
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    metadata_path = os.path.join(temp_dir, "chapters.txt")
+                    if not export_chapters_ffmetadata(chapters, metadata_path):
+                        metadata_path = None
+                        logger.warning("Chapter embedding failed, exporting without chapters")
+                    timeline.mix_to_file(
+                        output_path,
+                        format="ipod",
+                        normalize_output=normalize,
+                        metadata_path=metadata_path,
+                    )
+                if metadata_path:
+                    logger.info(f"Embedded {len(chapters)} chapters in {output_path}")
+            else:
+                timeline.mix_to_file(output_path, format="ipod", normalize_output=normalize)
+            embed_chapters = False
+        else:
+            timeline.mix_to_file(output_path, format=format, normalize_output=normalize)
+
+        logger.info(f"Episode {episode_number} assembled: {timeline.duration_ms / 1000:.1f}s")
+
+        self._finalize_export(
+            output_path, format, chapters, embed_chapters, export_chapter_files,
+            encoded_path=output_path,
+        )
+        return str(output_path)
+
+    async def _build_timeline(
+        self,
+        script: DialogueScript,
+        episode_number: int,
+        include_music: bool,
+        include_sfx: bool,
+    ) -> AudioTimeline:
+        """Build the full multi-track timeline for an episode.
+
+        Also records it as the last assembled timeline for chapter generation.
+
+        Args:
+            script: DialogueScript with all segments
+            episode_number: Episode number for metadata
+            include_music: Whether to include background music
+            include_sfx: Whether to include sound effects
+
+        Returns:
+            AudioTimeline ready for mixing
+        """
         logger.info(f"Assembling episode {episode_number} with {len(script.segments)} segments")
 
         # Create timeline
         timeline = AudioTimeline()
 
-        # Generate voice audio for all segments
-        await self._add_voice_segments(timeline, script)
-
         # Add intro music
         if include_music:
             timeline.add_music_bed(
@@ -1461,13 +2267,10 @@ class EpisodeAudioAssembler:
                 volume_db=-6.0,  # Louder before voice starts
             )
 
-        # Add phase-specific music beds
-        if include_music:
-            self._add_phase_music(timeline, script)
-
-        # Add sound effects from cues
-        if include_sfx:
-            self._add_sfx_from_cues(timeline)
+        # Generate voice audio, then place voice, cue SFX and phase music
+        await self._add_voice_segments(
+            timeline, script, include_music=include_music, include_sfx=include_sfx,
+        )
 
         # Apply sidechain compression for dynamic mixing
         if include_music and self.use_sidechain:
@@ -1477,16 +2280,11 @@ class EpisodeAudioAssembler:
                 config=self.sidechain_config,
             )
 
-        # Mix everything
-        mixed = timeline.mix(normalize_output=True)
-
         # Store timeline for chapter generation
         self._last_timeline = timeline
         self._last_episode_number = episode_number
 
-        logger.info(f"Episode {episode_number} assembled: {len(mixed) / 1000:.1f}s")
-
-        return mixed
+        return timeline
 
     def generate_chapters(
         self,
@@ -1527,32 +2325,109 @@ class EpisodeAudioAssembler:
         self,
         timeline: AudioTimeline,
         script: DialogueScript,
+        include_music: bool = False,
+        include_sfx: bool = False,
     ) -> None:
         """Generate and add all voice segments to timeline.
 
+        Segments are synthesized concurrently (bounded by the TTS
+        concurrency limit) and then placed on the timeline in script order.
+        Segments with the same voice and tagged text are synthesized once
+        and share the resulting audio.
+
+        Placement is a single pass in start-time order: each segment's SFX
+        cues are placed as the segment is added, and phase time ranges are
+        collected along the way so phase music beds follow the loop.
+
         Args:
             timeline: AudioTimeline to add to
             script: DialogueScript with segments
+            include_music: Whether to add phase music beds
+            include_sfx: Whether to add sound effects from segment cues
         """
+        if self.client:
+            # One request per distinct (voice, tagged text)
+            unique: Dict[Tuple[str, str], DialogueSegment] = {}
+            keys = []
+            for segment in script.segments:
+                key = (segment.voice_id, segment.to_tagged_text())
+                unique.setdefault(key, segment)
+                keys.append(key)
+
+            # Created per call so it binds to the running event loop
+            sem = asyncio.Semaphore(self._tts_concurrency)
+            tasks = [
+                asyncio.create_task(self._synthesize_with_sem(segment, sem))
+                for segment in unique.values()
+            ]
+            results = dict(zip(unique, await asyncio.gather(*tasks, return_exceptions=True)))
+            audios = [results[key] for key in keys]
+        else:
+            # No client: every segment is a placeholder, so size them in one
+            # pass and share one silent AudioSegment per distinct duration
+            durations = self._placeholder_durations(script.segments)
+            silences = {d: AudioSegment.silent(duration=d) for d in set(durations)}
+            audios = [silences[d] for d in durations]
+
         current_time = self.intro_music_ms
+        # Phase -> (start, end); segments are placed in ascending start order
+        phase_bounds: Dict[str, Tuple[int, int]] = {}
 
-        for segment in script.segments:
-            # Get voice audio (synthesized or mock)
-            audio = await self._synthesize_segment(segment)
+        for segment, audio in zip(script.segments, audios):
+            if isinstance(audio, Exception):
+                logger.warning(f"Voice synthesis failed for segment: {audio}")
+                audio = self._placeholder_audio(segment)
 
             # Add to timeline
-            timeline.add_voice_segment(
+            num_cues = len(timeline.cues)
+            voice = timeline.add_voice_segment(
                 segment=segment,
                 audio=audio,
                 start_ms=current_time,
                 gap_after_ms=self.segment_gap_ms,
             )
 
+            if include_sfx:
+                for cue in timeline.cues[num_cues:]:
+                    self._add_sfx_cue(timeline, cue)
+
+            if include_music:
+                # Same phase keys as DialogueScript.group_by_phase
+                phase = segment.phase or "unknown"
+                bounds = phase_bounds.get(phase)
+                if bounds is None:
+                    phase_bounds[phase] = (voice.start_ms, voice.end_ms)
+                else:
+                    phase_bounds[phase] = (bounds[0], max(bounds[1], voice.end_ms))
+
             current_time += len(audio) + self.segment_gap_ms
 
+        if include_music:
+            self._add_phase_music(timeline, phase_bounds)
+
+    async def _synthesize_with_sem(
+        self,
+        segment: DialogueSegment,
+        sem: asyncio.Semaphore,
+    ) -> AudioSegment:
+        """Synthesize a segment while holding the TTS concurrency gate.
+
+        Args:
+            segment: DialogueSegment to synthesize
+            sem: Semaphore bounding concurrent synthesis requests
+
+        Returns:
+            AudioSegment with voice audio
+        """
+        async with sem:
+            return await self._synthesize_segment(segment)
+
     async def _synthesize_segment(self, segment: DialogueSegment) -> AudioSegment:
         """Synthesize audio for a single segment.
 
+        Reusing audio across runs is the client's job: construct it with
+        ElevenLabsClient(cache_dir=...) to serve repeats from its TTSCache.
+
         Args:
             segment: DialogueSegment to synthesize
 
@@ -1563,53 +2438,61 @@ class EpisodeAudioAssembler:
 
         if self.client:
             try:
-                # Use ElevenLabs client
-                result = await self.client.text_to_speech(
-                    text=text,
-                    voice_id=segment.voice_id,
-                )
+                # Use ElevenLabs client (it paces, retries and caches requests)
+                result = await self.client.text_to_speech(text=text, voice_id=segment.voice_id)
 
                 # Convert bytes to AudioSegment
-                audio = AudioSegment.from_mp3(io.BytesIO(result.audio_data))
+                audio = _decode_mp3(io.BytesIO(result.audio_data))
                 return audio
 
             except Exception as e:
                 logger.warning(f"Voice synthesis failed for segment: {e}")
 
-        # Generate placeholder based on text length
-        # Average speaking rate: ~150 words/min = ~750 chars/min
-        duration_ms = int((len(segment.text) / 750) * 60 * 1000)
-        duration_ms = max(500, duration_ms)  # Minimum 500ms
+        return self._placeholder_audio(segment)
 
+    @staticmethod
+    def _placeholder_audio(segment: DialogueSegment) -> AudioSegment:
+        """Create silent placeholder audio sized to the segment's text.
+
+        Args:
+            segment: DialogueSegment the placeholder stands in for
+
+        Returns:
+            Silent AudioSegment
+        """
+        duration_ms = EpisodeAudioAssembler._placeholder_durations([segment])[0]
         return AudioSegment.silent(duration=duration_ms)
 
-    def _add_phase_music(self, timeline: AudioTimeline, script: DialogueScript) -> None:
-        """Add phase-appropriate background music.
+    @staticmethod
+    def _placeholder_durations(segments: List[DialogueSegment]) -> List[int]:
+        """Estimate spoken durations for placeholder audio.
 
         Args:
-            timeline: AudioTimeline to add to
-            script: DialogueScript with phase info
-        """
-        # Group segments by phase
-        phases = script.group_by_phase()
+            segments: DialogueSegments to size
 
-        for phase, segments in phases.items():
-            if not segments:
-                continue
+        Returns:
+            Duration in ms for each segment
+        """
+        lengths = np.fromiter((len(seg.text) for seg in segments), dtype=np.float64, count=len(segments))
 
-            # Find phase time range
-            phase_start = None
-            phase_end = None
+        # Average speaking rate: ~150 words/min = ~750 chars/min
+        durations = (lengths / 750 * 60 * 1000).astype(np.int64)
+        np.maximum(durations, 500, out=durations)  # Minimum 500ms
 
-            for voice in timeline.voice_segments:
-                if voice.segment in segments:
-                    if phase_start is None:
-                        phase_start = voice.start_ms
-                    phase_end = voice.end_ms
+        return durations.tolist()
 
-            if phase_start is None:
-                continue
+    def _add_phase_music(
+        self,
+        timeline: AudioTimeline,
+        phase_bounds: Dict[str, Tuple[int, int]],
+    ) -> None:
+        """Add phase-appropriate background music.
 
+        Args:
+            timeline: AudioTimeline to add to
+            phase_bounds: Voice time range (start_ms, end_ms) per phase
+        """
+        for phase, (phase_start, phase_end) in phase_bounds.items():
             # Get appropriate music
             mood, _ = self.music_library.get_phase_music(phase)
 
@@ -1623,37 +2506,35 @@ class EpisodeAudioAssembler:
                 volume_db=-15.0,  # Quieter under voice
             )
 
-    def _add_sfx_from_cues(self, timeline: AudioTimeline) -> None:
-        """Add sound effects based on timeline cues.
+    def _add_sfx_cue(self, timeline: AudioTimeline, cue: AudioCue) -> None:
+        """Add the sound effect for one timeline cue.
 
         Args:
-            timeline: AudioTimeline with cues
+            timeline: AudioTimeline to add to
+            cue: Cue to place; non-SFX cues are ignored
         """
-        for cue in timeline.cues:
-            if cue.cue_type != "sfx":
-                continue
-
-            # Try to parse as SFXType
-            try:
-                sfx_type = SFXType(cue.asset_id)
-            except ValueError:
-                # Custom SFX ID, try to load directly
-                audio = self.sfx_library.get(cue.asset_id)
-                if audio:
-                    timeline.add_track(
-                        name=f"sfx_{cue.asset_id}",
-                        audio=audio,
-                        start_ms=cue.timestamp_ms,
-                        volume_db=cue.volume_db,
-                    )
-                continue
+        if cue.cue_type != "sfx":
+            return
 
+        if cue.asset_id in _SFX_TYPE_VALUES:
             timeline.add_sfx(
-                sfx_type=sfx_type,
+                sfx_type=SFXType(cue.asset_id),
                 sfx_library=self.sfx_library,
                 start_ms=cue.timestamp_ms,
                 volume_db=cue.volume_db,
             )
+            return
+
+        # Custom SFX ID, try to load directly
+        audio = self.sfx_library.get(cue.asset_id)
+        if not audio:
+            return
+        timeline.add_track(
+            name=f"sfx_{cue.asset_id}",
+            audio=audio,
+            start_ms=cue.timestamp_ms,
+            volume_db=cue.volume_db,
+        )
 
     def export_episode(
         self,
@@ -1685,26 +2566,73 @@ class EpisodeAudioAssembler:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Auto-generate chapters if not provided and we have a timeline
-        if chapters is None and self._last_timeline is not None:
-            try:
-                chapters = self.generate_chapters()
-            except ValueError:
-                chapters = None
-
         # Export with appropriate settings
         if format == "mp3":
             audio.export(
                 str(output_path),
                 format="mp3",
                 bitrate=self.output_bitrate,
-                tags={
-                    "artist": "TraitorSim",
-                    "album": "The Traitors AI Simulation",
-                    "track": str(self._last_episode_number) if self._last_episode_number else "1",
-                }
+                tags=self._export_tags(),
             )
+        elif format in ("m4a", "aac"):
+            audio.export(str(self._m4a_temp_path(output_path)), format="ipod")
+        else:
+            audio.export(str(output_path), format=format)
+
+        encoded_path = self._m4a_temp_path(output_path) if format in ("m4a", "aac") else output_path
+        self._finalize_export(
+            output_path, format, chapters, embed_chapters, export_chapter_files,
+            encoded_path=encoded_path,
+        )
+        return str(output_path)
+
+    def _export_tags(self) -> Dict[str, str]:
+        """Get ID3 tags for exported episodes."""
+        return {
+            "artist": "TraitorSim",
+            "album": "The Traitors AI Simulation",
+            "track": str(self._last_episode_number) if self._last_episode_number else "1",
+        }
 
+    @staticmethod
+    def _m4a_temp_path(output_path: Path) -> Path:
+        """Get the intermediate path M4A audio is encoded to before chapters."""
+        return output_path.with_suffix(".temp.m4a")
+
+    def _resolve_chapters(self, chapters: Optional[ChapterList]) -> Optional[ChapterList]:
+        """Auto-generate chapters if not provided and we have a timeline."""
+        if chapters is None and self._last_timeline is not None:
+            try:
+                chapters = self.generate_chapters()
+            except ValueError:
+                chapters = None
+        return chapters
+
+    def _finalize_export(
+        self,
+        output_path: Path,
+        format: str,
+        chapters: Optional[ChapterList],
+        embed_chapters: bool,
+        export_chapter_files: bool,
+        encoded_path: Path,
+    ) -> None:
+        """Embed chapters into an encoded episode and write chapter files.
+
+        MP3 chapters are tagged in place. M4A encoded to a separate path is
+        remuxed into output_path with chapters (or just moved into place).
+
+        Args:
+            output_path: Final output file path
+            format: Output format the audio was encoded with
+            chapters: ChapterList to embed (auto-generated if None)
+            embed_chapters: Whether to embed chapters in audio file
+            export_chapter_files: Whether to export external chapter files
+            encoded_path: Where the encoder wrote the audio
+        """
+        chapters = self._resolve_chapters(chapters)
+
+        if format == "mp3":
             # Embed chapters in MP3
             if embed_chapters and chapters and len(chapters) > 0:
                 try:
@@ -1717,10 +2645,9 @@ class EpisodeAudioAssembler:
                 except Exception as e:
                     logger.warning(f"Chapter embedding failed: {e}")
 
-        elif format in ("m4a", "aac"):
+        elif format in ("m4a", "aac") and encoded_path != output_path:
             # For M4A, we need to handle chapter embedding differently
-            temp_path = output_path.with_suffix(".temp.m4a")
-            audio.export(str(temp_path), format="ipod")
+            temp_path = encoded_path
 
             if embed_chapters and chapters and len(chapters) > 0:
                 try:
@@ -1742,15 +2669,12 @@ class EpisodeAudioAssembler:
                     logger.warning(f"Chapter embedding failed: {e}")
             else:
                 temp_path.rename(output_path)
-        else:
-            audio.export(str(output_path), format=format)
 
         # Export external chapter files
         if export_chapter_files and chapters and len(chapters) > 0:
             self._export_chapter_files(output_path, chapters)
 
         logger.info(f"Episode exported: {output_path}")
-        return str(output_path)
 
     def _export_chapter_files(
         self,
@@ -1789,6 +2713,11 @@ class EpisodeAudioAssembler:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+def _mix_timeline(timeline: AudioTimeline, normalize: bool) -> AudioSegment:
+    """Mix a timeline (module-level so it can run in a worker process)."""
+    return timeline.mix(normalize_output=normalize)
+
+
 async def assemble_episode_from_script(
     script: DialogueScript,
     elevenlabs_client: Optional[Any] = None,
@@ -1807,12 +2736,11 @@ async def assemble_episode_from_script(
         AudioSegment if no output_path, else path to exported file
     """
     assembler = EpisodeAudioAssembler(elevenlabs_client=elevenlabs_client)
-    audio = await assembler.assemble_episode(script, episode_number)
 
     if output_path:
-        return assembler.export_episode(audio, output_path)
+        return await assembler.assemble_and_export(script, output_path, episode_number)
 
-    return audio
+    return await assembler.assemble_episode(script, episode_number, normalize=True)
 
 
 def create_test_audio(duration_s: float = 10.0) -> AudioSegment:
@@ -35,14 +35,33 @@ Usage:
 import json
 import logging
 import os
+import re
 import subprocess
-import tempfile
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from datetime import timedelta
 
+import numpy as np
+
+# Optional ID3 backends for MP3 chapters (mutagen preferred)
+try:
+    import mutagen.id3  # noqa: F401
+    HAS_MUTAGEN = True
+except ImportError:
+    HAS_MUTAGEN = False
+
+try:
+    import eyed3
+    from eyed3.id3 import ID3_V2_4
+    HAS_EYED3 = True
+except ImportError:
+    HAS_EYED3 = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,10 +111,17 @@ class ChapterMarker:
     image_path: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # (time_ms, formatted) caches; rebuilt whenever the time they were built from changes
+    _id_cache: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+    _start_tc_cache: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+    _end_tc_cache: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def id(self) -> str:
         """Generate unique chapter ID."""
-        return f"chap_{self.start_ms:08d}"
+        if self._id_cache is None or self._id_cache[0] != self.start_ms:
+            self._id_cache = (self.start_ms, f"chap_{self.start_ms:08d}")
+        return self._id_cache[1]
 
     @property
     def start_seconds(self) -> float:
@@ -117,12 +143,18 @@ class ChapterMarker:
     @property
     def start_timecode(self) -> str:
         """Start time as HH:MM:SS.mmm timecode."""
-        return ms_to_timecode(self.start_ms)
+        if self._start_tc_cache is None or self._start_tc_cache[0] != self.start_ms:
+            self._start_tc_cache = (self.start_ms, ms_to_timecode(self.start_ms))
+        return self._start_tc_cache[1]
 
     @property
     def end_timecode(self) -> Optional[str]:
         """End time as HH:MM:SS.mmm timecode."""
-        return ms_to_timecode(self.end_ms) if self.end_ms else None
+        if not self.end_ms:
+            return None
+        if self._end_tc_cache is None or self._end_tc_cache[0] != self.end_ms:
+            self._end_tc_cache = (self.end_ms, ms_to_timecode(self.end_ms))
+        return self._end_tc_cache[1]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
@@ -174,9 +206,27 @@ class ChapterList:
     episode_number: Optional[int] = None
     total_duration_ms: Optional[int] = None
 
+    # Lookup indexes for get_by_phase/get_by_type; None when stale
+    _by_phase: Optional[Dict[Optional[str], ChapterMarker]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_type: Optional[Dict[ChapterType, List[ChapterMarker]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+    # Set by finalize() once every chapter has an end time; add() clears it
+    _is_finalized: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def is_finalized(self) -> bool:
+        """Whether finalize() has run and every chapter has an end time."""
+        return self._is_finalized
+
     def add(self, chapter: ChapterMarker) -> None:
         """Add a chapter marker."""
         self.chapters.append(chapter)
+        self._by_phase = None
+        self._is_finalized = False
 
     def add_phase(
         self,
@@ -300,16 +350,64 @@ class ChapterList:
                     # Last chapter ends at file end
                     chapter.end_ms = self.total_duration_ms
 
+        self.build_timecode_cache()
+        self._build_index()
+
+        # Only the last chapter can still lack an end (no total duration)
+        self._is_finalized = not self.chapters or self.chapters[-1].end_ms is not None
+
+    def build_timecode_cache(self) -> None:
+        """Prebuild every chapter's ID and start/end timecodes.
+
+        Timecodes for the whole list are computed in one vectorized pass,
+        so exporters read cached strings instead of formatting per chapter.
+        Called by finalize().
+        """
+        chapters = self.chapters
+        if not chapters:
+            return
+
+        start_tcs = _ms_array_to_timecodes(
+            np.fromiter((c.start_ms for c in chapters), dtype=np.int64, count=len(chapters))
+        )
+        end_tcs = _ms_array_to_timecodes(
+            np.fromiter((c.end_ms or 0 for c in chapters), dtype=np.int64, count=len(chapters))
+        )
+
+        for chapter, start_tc, end_tc in zip(chapters, start_tcs, end_tcs):
+            chapter._id_cache = (chapter.start_ms, f"chap_{chapter.start_ms:08d}")
+            chapter._start_tc_cache = (chapter.start_ms, start_tc)
+            if chapter.end_ms:
+                chapter._end_tc_cache = (chapter.end_ms, end_tc)
+
+    def _build_index(self) -> None:
+        """Index chapters by phase (first match) and by type."""
+        by_phase: Dict[Optional[str], ChapterMarker] = {}
+        by_type: Dict[ChapterType, List[ChapterMarker]] = {}
+
+        for chapter in self.chapters:
+            by_phase.setdefault(chapter.phase, chapter)
+            by_type.setdefault(chapter.chapter_type, []).append(chapter)
+
+        self._by_phase = by_phase
+        self._by_type = by_type
+        self._indexed_count = len(self.chapters)
+
+    def _index_is_stale(self) -> bool:
+        # The count check catches direct edits to the public chapters list
+        return self._by_phase is None or self._indexed_count != len(self.chapters)
+
     def get_by_phase(self, phase: str) -> Optional[ChapterMarker]:
         """Get chapter marker for a specific phase."""
-        for chapter in self.chapters:
-            if chapter.phase == phase:
-                return chapter
-        return None
+        if self._index_is_stale():
+            self._build_index()
+        return self._by_phase.get(phase)
 
     def get_by_type(self, chapter_type: ChapterType) -> List[ChapterMarker]:
         """Get all chapters of a specific type."""
-        return [c for c in self.chapters if c.chapter_type == chapter_type]
+        if self._index_is_stale():
+            self._build_index()
+        return list(self._by_type.get(chapter_type, ()))
 
     def merge_short_chapters(self, min_duration_ms: int = 5000) -> None:
         """Merge chapters shorter than minimum duration into previous.
@@ -317,13 +415,16 @@ class ChapterList:
         Args:
             min_duration_ms: Minimum chapter duration (default 5 seconds)
         """
-        if len(self.chapters) < 2:
+        chapters = self.chapters
+        if len(chapters) < 2:
             return
 
-        merged = [self.chapters[0]]
+        # Compact in place: chapters[:kept + 1] holds the merged result so far
+        kept = 0
 
-        for chapter in self.chapters[1:]:
-            prev = merged[-1]
+        for i in range(1, len(chapters)):
+            chapter = chapters[i]
+            prev = chapters[kept]
             duration = chapter.start_ms - prev.start_ms
 
             if duration < min_duration_ms:
@@ -333,9 +434,11 @@ class ChapterList:
                 if chapter.chapter_type != prev.chapter_type:
                     prev.title = f"{prev.title} / {chapter.title}"
             else:
-                merged.append(chapter)
+                kept += 1
+                chapters[kept] = chapter
 
-        self.chapters = merged
+        del chapters[kept + 1:]
+        self._by_phase = None
 
     def __len__(self) -> int:
         return len(self.chapters)
@@ -377,16 +480,29 @@ def ms_to_timecode(ms: int) -> str:
     Returns:
         Formatted timecode string
     """
-    total_seconds = ms // 1000
-    milliseconds = ms % 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
-
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-    else:
-        return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+    total_seconds, milliseconds = divmod(ms, 1000)
+    total_minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+def _ms_array_to_timecodes(ms: np.ndarray) -> List[str]:
+    """Vectorized ms_to_timecode over an array of millisecond values."""
+    ms = np.asarray(ms, dtype=np.int64)
+    total_seconds, milliseconds = np.divmod(ms, 1000)
+    hours, rest = np.divmod(total_seconds, 3600)
+    minutes, seconds = np.divmod(rest, 60)
+
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}.{f:03d}"
+        for h, m, s, f in zip(
+            hours.tolist(), minutes.tolist(), seconds.tolist(), milliseconds.tolist()
+        )
+    ]
+
+
+# [HH:]MM:SS[.mmm], with "," accepted as the decimal separator (SRT style)
+_TIMECODE_RE = re.compile(r"(?:(\d+):)?(\d+):(\d+)(?:[.,](\d*))?")
 
 
 def timecode_to_ms(timecode: str) -> int:
@@ -398,31 +514,47 @@ def timecode_to_ms(timecode: str) -> int:
     Returns:
         Time in milliseconds
     """
-    parts = timecode.replace(",", ".").split(":")
-
-    if len(parts) == 3:
-        hours, minutes, seconds = parts
-        hours = int(hours)
-    elif len(parts) == 2:
-        hours = 0
-        minutes, seconds = parts
-    else:
+    match = _TIMECODE_RE.fullmatch(timecode.strip())
+    if match is None:
         raise ValueError(f"Invalid timecode format: {timecode}")
 
-    minutes = int(minutes)
-
-    if "." in seconds:
-        sec_parts = seconds.split(".")
-        seconds = int(sec_parts[0])
-        # Handle variable precision (e.g., .5 vs .500)
-        ms_str = sec_parts[1].ljust(3, "0")[:3]
-        milliseconds = int(ms_str)
-    else:
-        seconds = int(seconds)
-        milliseconds = 0
-
-    total_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + milliseconds
-    return total_ms
+    hours, minutes, seconds, fraction = match.groups()
+
+    # Handle variable precision (e.g., .5 vs .500)
+    milliseconds = int(fraction[:3].ljust(3, "0")) if fraction else 0
+
+    return (int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)) * 1000 + milliseconds
+
+
+_PHASE_TITLES = {
+    "intro": "Introduction",
+    "cold_open": "Previously On...",
+    "breakfast": "Breakfast",
+    "mission": "The Mission",
+    "mission_briefing": "Mission Briefing",
+    "mission_execution": "Mission",
+    "social": "Social Phase",
+    "roundtable": "Round Table",
+    "round_table": "Round Table",
+    "voting": "The Vote",
+    "turret": "The Turret",
+    "murder": "Murder Selection",
+    "finale": "The Finale",
+    "outro": "Next Time...",
+}
+
+_EVENT_TITLES = {
+    "MURDER": "Murder Revealed",
+    "BANISHMENT": "Banishment",
+    "VOTE_TALLY": "The Votes Are In",
+    "ROLE_REVEAL": "Role Revealed",
+    "RECRUITMENT": "A New Traitor",
+    "SHIELD_USE": "Shield Activated",
+    "MISSION_COMPLETE": "Mission Complete",
+    "MISSION_FAILED": "Mission Failed",
+    "FINALE_START": "The Final Round",
+    "WINNER": "The Winner",
+}
 
 
 def format_phase_title(phase: str) -> str:
@@ -434,25 +566,14 @@ def format_phase_title(phase: str) -> str:
     Returns:
         Formatted title (e.g., "Breakfast", "Round Table")
     """
-    PHASE_TITLES = {
-        "intro": "Introduction",
-        "cold_open": "Previously On...",
-        "breakfast": "Breakfast",
-        "mission": "The Mission",
-        "mission_briefing": "Mission Briefing",
-        "mission_execution": "Mission",
-        "social": "Social Phase",
-        "roundtable": "Round Table",
-        "round_table": "Round Table",
-        "voting": "The Vote",
-        "turret": "The Turret",
-        "murder": "Murder Selection",
-        "finale": "The Finale",
-        "outro": "Next Time...",
-    }
+    # Game data already uses lowercase snake_case, so try the raw name first
+    title = _PHASE_TITLES.get(phase)
+    if title is not None:
+        return title
 
     phase_lower = phase.lower().replace(" ", "_")
-    return PHASE_TITLES.get(phase_lower, phase.replace("_", " ").title())
+    # Unknown phases recur once per chapter; intern so they share one string
+    return _PHASE_TITLES.get(phase_lower) or sys.intern(phase.replace("_", " ").title())
 
 
 def format_event_title(event_type: str, details: Optional[Dict] = None) -> str:
@@ -465,21 +586,6 @@ def format_event_title(event_type: str, details: Optional[Dict] = None) -> str:
     Returns:
         Formatted title
     """
-    EVENT_TITLES = {
-        "MURDER": "Murder Revealed",
-        "BANISHMENT": "Banishment",
-        "VOTE_TALLY": "The Votes Are In",
-        "ROLE_REVEAL": "Role Revealed",
-        "RECRUITMENT": "A New Traitor",
-        "SHIELD_USE": "Shield Activated",
-        "MISSION_COMPLETE": "Mission Complete",
-        "MISSION_FAILED": "Mission Failed",
-        "FINALE_START": "The Final Round",
-        "WINNER": "The Winner",
-    }
-
-    base_title = EVENT_TITLES.get(event_type, event_type.replace("_", " ").title())
-
     # Add details if available
     if details:
         if "victim_name" in details and event_type == "MURDER":
@@ -491,7 +597,8 @@ def format_event_title(event_type: str, details: Optional[Dict] = None) -> str:
             name = details.get("player_name", "Unknown")
             return f"{name} Was {role}"
 
-    return base_title
+    # Detail titles above are per-player, so only the bounded set is interned
+    return _EVENT_TITLES.get(event_type) or sys.intern(event_type.replace("_", " ").title())
 
 
 # =============================================================================
@@ -501,8 +608,9 @@ def format_event_title(event_type: str, details: Optional[Dict] = None) -> str:
 def embed_chapters_mp3(filepath: str, chapters: ChapterList) -> bool:
     """Embed ID3v2 chapter markers in MP3 file.
 
-    Uses the CHAP and CTOC frames as specified in ID3v2.4.
-    Requires the 'eyed3' library.
+    Uses the CHAP and CTOC frames as specified in ID3v2.4. The tag is
+    rewritten in place; the audio is never re-encoded. Uses 'mutagen' if
+    installed (it only parses the ID3 header), otherwise 'eyed3'.
 
     Args:
         filepath: Path to MP3 file
@@ -511,11 +619,11 @@ def embed_chapters_mp3(filepath: str, chapters: ChapterList) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        import eyed3
-        from eyed3.id3 import ID3_V2_4
-    except ImportError:
-        logger.warning("eyed3 not installed. Install with: pip install eyed3")
+    if HAS_MUTAGEN:
+        return _embed_chapters_mp3_mutagen(filepath, chapters)
+
+    if not HAS_EYED3:
+        logger.warning("mutagen or eyed3 not installed. Install with: pip install mutagen")
         return False
 
     try:
@@ -531,15 +639,11 @@ def embed_chapters_mp3(filepath: str, chapters: ChapterList) -> bool:
             # Ensure we're using ID3v2.4 for chapter support
             audiofile.tag.version = ID3_V2_4
 
-        # Remove existing chapters
-        existing_chapters = list(audiofile.tag.chapters)
-        for chapter in existing_chapters:
-            audiofile.tag.chapters.remove(chapter.element_id)
-
-        # Remove existing TOC
-        existing_tocs = list(audiofile.tag.table_of_contents)
-        for toc in existing_tocs:
-            audiofile.tag.table_of_contents.remove(toc.element_id)
+        # Remove existing chapters and TOC. The chapter/TOC accessors read
+        # straight from the frame set, so dropping the frame lists clears
+        # them in one step (accessor remove() rescans the list per ID)
+        audiofile.tag.frame_set.pop(b"CHAP", None)
+        audiofile.tag.frame_set.pop(b"CTOC", None)
 
         # Add new chapters
         chapter_ids = []
@@ -580,6 +684,63 @@ def embed_chapters_mp3(filepath: str, chapters: ChapterList) -> bool:
         return False
 
 
+def _embed_chapters_mp3_mutagen(filepath: str, chapters: ChapterList) -> bool:
+    """Embed ID3v2.4 CHAP/CTOC frames in place using mutagen.
+
+    Args:
+        filepath: Path to MP3 file
+        chapters: ChapterList to embed
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from mutagen.id3 import ID3, CHAP, CTOC, CTOCFlags, TIT2, TIT3, ID3NoHeaderError
+
+    try:
+        try:
+            tag = ID3(filepath)
+        except ID3NoHeaderError:
+            tag = ID3()
+
+        # Remove existing chapters and TOC
+        tag.delall("CHAP")
+        tag.delall("CTOC")
+
+        # Add new chapters
+        chapter_ids = []
+        for chapter in chapters:
+            sub_frames = [TIT2(encoding=3, text=[chapter.title])]
+            if chapter.description:
+                sub_frames.append(TIT3(encoding=3, text=[chapter.description]))
+
+            tag.add(CHAP(
+                element_id=chapter.id,
+                start_time=chapter.start_ms,
+                end_time=chapter.end_ms or chapter.start_ms,
+                start_offset=0xFFFFFFFF,  # Offsets unused; times are authoritative
+                end_offset=0xFFFFFFFF,
+                sub_frames=sub_frames,
+            ))
+            chapter_ids.append(chapter.id)
+
+        # Add table of contents
+        if chapter_ids:
+            tag.add(CTOC(
+                element_id="toc",
+                flags=CTOCFlags.TOP_LEVEL | CTOCFlags.ORDERED,
+                child_element_ids=chapter_ids,
+                sub_frames=[],
+            ))
+
+        tag.save(filepath, v2_version=4)
+        logger.info(f"Embedded {len(chapters)} chapters in {filepath}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to embed chapters in MP3: {e}")
+        return False
+
+
 def read_chapters_mp3(filepath: str) -> Optional[ChapterList]:
     """Read chapter markers from MP3 file.
 
@@ -589,10 +750,11 @@ def read_chapters_mp3(filepath: str) -> Optional[ChapterList]:
     Returns:
         ChapterList or None if no chapters found
     """
-    try:
-        import eyed3
-    except ImportError:
-        logger.warning("eyed3 not installed")
+    if HAS_MUTAGEN:
+        return _read_chapters_mp3_mutagen(filepath)
+
+    if not HAS_EYED3:
+        logger.warning("mutagen or eyed3 not installed")
         return None
 
     try:
@@ -641,10 +803,107 @@ def read_chapters_mp3(filepath: str) -> Optional[ChapterList]:
         return None
 
 
+def _read_chapters_mp3_mutagen(filepath: str) -> Optional[ChapterList]:
+    """Read ID3v2 chapter markers using mutagen.
+
+    Args:
+        filepath: Path to MP3 file
+
+    Returns:
+        ChapterList or None if no chapters found
+    """
+    from mutagen.mp3 import MP3
+
+    try:
+        audiofile = MP3(filepath)
+        if audiofile.tags is None:
+            return None
+
+        chapters = ChapterList()
+
+        # Frames come back in tag-key order, not playback order
+        for chap in sorted(audiofile.tags.getall("CHAP"), key=lambda c: c.start_time):
+            tit2 = chap.sub_frames.get("TIT2")
+            tit3 = chap.sub_frames.get("TIT3")
+
+            chapters.add(ChapterMarker(
+                title=str(tit2) if tit2 else "Untitled",
+                start_ms=chap.start_time,
+                end_ms=chap.end_time if chap.end_time != chap.start_time else None,
+                description=str(tit3) if tit3 else None,
+            ))
+
+        if len(chapters) > 0:
+            chapters.total_duration_ms = int(audiofile.info.length * 1000)
+            return chapters
+
+        return None
+
+    except Exception as e:
+        logger.error(f"Failed to read chapters from MP3: {e}")
+        return None
+
+
 # =============================================================================
 # CHAPTER EMBEDDING - M4A/AAC (FFmpeg)
 # =============================================================================
 
+# Result of the `ffmpeg -version` probe, checked once per process
+_FFMPEG_AVAILABLE: Optional[bool] = None
+
+
+def _ffmpeg_available() -> bool:
+    """Check (once) whether an ffmpeg binary can be run."""
+    global _FFMPEG_AVAILABLE
+    if _FFMPEG_AVAILABLE is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            _FFMPEG_AVAILABLE = result.returncode == 0
+        except FileNotFoundError:
+            _FFMPEG_AVAILABLE = False
+    return _FFMPEG_AVAILABLE
+
+
+# FFmetadata values must backslash-escape '=', ';', '#', '\\' and newlines
+_FFMETADATA_ESCAPES = str.maketrans({
+    "=": "\\=",
+    ";": "\\;",
+    "#": "\\#",
+    "\\": "\\\\",
+    "\n": "\\\n",
+})
+
+
+def _ffmetadata_chapter_lines(chapters: ChapterList) -> List[str]:
+    """Build the FFmetadata [CHAPTER] blocks for every chapter.
+
+    Chapters without an end time end at their start, as FFmpeg requires
+    an END for each chapter.
+    """
+    num_chapters = len(chapters)
+    starts = np.fromiter((c.start_ms for c in chapters), dtype=np.int64, count=num_chapters)
+    ends = np.fromiter((c.end_ms or -1 for c in chapters), dtype=np.int64, count=num_chapters)
+    ends = np.where(ends < 0, starts, ends)
+
+    lines: List[str] = []
+    for chapter, start_ms, end_ms in zip(chapters, starts.tolist(), ends.tolist()):
+        # FFmpeg uses timebase, convert ms to proper format
+        lines.extend((
+            "",
+            "[CHAPTER]",
+            "TIMEBASE=1/1000",
+            f"START={start_ms}",
+            f"END={end_ms}",
+            # Escape special characters in title
+            f"title={chapter.title.translate(_FFMETADATA_ESCAPES)}",
+        ))
+    return lines
+
+
 def embed_chapters_m4a(
     input_path: str,
     output_path: str,
@@ -664,72 +923,42 @@ def embed_chapters_m4a(
         True if successful, False otherwise
     """
     # Check for FFmpeg
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            logger.error("FFmpeg not available")
-            return False
-    except FileNotFoundError:
-        logger.error("FFmpeg not installed")
+    if not _ffmpeg_available():
+        logger.error("FFmpeg not available")
         return False
 
     try:
-        # Create FFmpeg metadata file
-        metadata_content = ";FFMETADATA1\n"
-
-        for chapter in chapters:
-            end_ms = chapter.end_ms or chapter.start_ms
-            # FFmpeg uses timebase, convert ms to proper format
-            metadata_content += f"\n[CHAPTER]\n"
-            metadata_content += f"TIMEBASE=1/1000\n"
-            metadata_content += f"START={chapter.start_ms}\n"
-            metadata_content += f"END={end_ms}\n"
-            # Escape special characters in title
-            safe_title = chapter.title.replace("=", "\\=").replace(";", "\\;")
-            metadata_content += f"title={safe_title}\n"
-
-        # Write metadata to temp file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".txt",
-            delete=False,
-            encoding="utf-8",
-        ) as metadata_file:
-            metadata_file.write(metadata_content)
-            metadata_path = metadata_file.name
+        # Build FFmpeg metadata
+        lines = [";FFMETADATA1"]
+        lines.extend(_ffmetadata_chapter_lines(chapters))
 
-        try:
-            # Run FFmpeg to add chapters
-            cmd = [
-                "ffmpeg",
-                "-y",  # Overwrite output
-                "-i", input_path,
-                "-i", metadata_path,
-                "-map_metadata", "1",
-                "-codec", "copy",
-                output_path,
-            ]
+        metadata_content = "\n".join(lines) + "\n"
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-            )
+        # Run FFmpeg to add chapters, feeding the metadata on stdin
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            "-i", input_path,
+            "-f", "ffmetadata",
+            "-i", "pipe:0",
+            "-map_metadata", "1",
+            "-codec", "copy",
+            output_path,
+        ]
 
-            if result.returncode != 0:
-                logger.error(f"FFmpeg failed: {result.stderr}")
-                return False
+        result = subprocess.run(
+            cmd,
+            input=metadata_content.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
 
-            logger.info(f"Embedded {len(chapters)} chapters in {output_path}")
-            return True
+        if result.returncode != 0:
+            logger.error(f"FFmpeg failed: {result.stderr.decode('utf-8', 'replace')}")
+            return False
 
-        finally:
-            # Clean up temp file
-            os.unlink(metadata_path)
+        logger.info(f"Embedded {len(chapters)} chapters in {output_path}")
+        return True
 
     except Exception as e:
         logger.error(f"Failed to embed chapters in M4A: {e}")
@@ -754,11 +983,11 @@ def read_chapters_m4a(filepath: str) -> Optional[ChapterList]:
             filepath,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         if result.returncode != 0:
             return None
 
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout)  # UTF-8 bytes; no text decode needed
         if "chapters" not in data or not data["chapters"]:
             return None
 
@@ -810,7 +1039,7 @@ def embed_chapters(
     ext = path.suffix.lower()
 
     # Finalize chapters if not already done
-    if any(c.end_ms is None for c in chapters):
+    if not chapters.is_finalized:
         chapters.finalize()
 
     if ext == ".mp3":
@@ -831,6 +1060,63 @@ def embed_chapters(
         return False
 
 
+def embed_chapters_batch(
+    jobs: List[Tuple[str, ChapterList, Optional[str]]],
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """Embed chapters in several audio files in parallel.
+
+    Each job is (filepath, chapters, output_path) as for embed_chapters().
+    MP3 jobs run in worker processes, since ID3 tagging is pure Python and
+    holds the GIL; M4A jobs run in threads, since the work happens in an
+    FFmpeg subprocess.
+
+    Args:
+        jobs: (filepath, chapters, output_path) tuples
+        max_workers: Workers per pool (defaults to the CPU count)
+
+    Returns:
+        Success flag per job, in job order
+    """
+    # Finalize up front so callers see the same ChapterList state as with
+    # embed_chapters() (worker processes only mutate their own copy)
+    for _, chapters, _ in jobs:
+        if not chapters.is_finalized:
+            chapters.finalize()
+
+    if len(jobs) <= 1:
+        return [embed_chapters(*job) for job in jobs]
+
+    process_pool: Optional[ProcessPoolExecutor] = None
+    thread_pool: Optional[ThreadPoolExecutor] = None
+
+    try:
+        futures = []
+        for job in jobs:
+            if Path(job[0]).suffix.lower() == ".mp3":
+                if process_pool is None:
+                    process_pool = ProcessPoolExecutor(max_workers=max_workers)
+                futures.append(process_pool.submit(embed_chapters, *job))
+            else:
+                if thread_pool is None:
+                    thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+                futures.append(thread_pool.submit(embed_chapters, *job))
+
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Failed to embed chapters in {job[0]}: {e}")
+                results.append(False)
+        return results
+
+    finally:
+        for pool in (process_pool, thread_pool):
+            if pool is not None:
+                pool.shutdown()
+
+
 # =============================================================================
 # EXTERNAL FORMAT EXPORT
 # =============================================================================
@@ -842,6 +1128,8 @@ def export_chapters_json(
 ) -> bool:
     """Export chapters to JSON format.
 
+    Uses 'orjson' if installed, otherwise the stdlib json module.
+
     Args:
         chapters: ChapterList to export
         output_path: Output file path
@@ -851,13 +1139,24 @@ def export_chapters_json(
         True if successful
     """
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(
-                chapters.to_dict(),
-                f,
+        import orjson
+    except ImportError:
+        orjson = None
+
+    try:
+        data = chapters.to_dict()
+        if orjson is not None:
+            # orjson writes UTF-8 bytes directly (non-ASCII is never escaped)
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            content = json.dumps(
+                data,
                 indent=2 if pretty else None,
                 ensure_ascii=False,
-            )
+            ).encode("utf-8")
+
+        with open(output_path, "wb") as f:
+            f.write(content)
         logger.info(f"Exported {len(chapters)} chapters to {output_path}")
         return True
     except Exception as e:
@@ -884,15 +1183,19 @@ def export_chapters_podlove(chapters: ChapterList, output_path: str) -> bool:
     try:
         lines = ["# Podlove Simple Chapters", ""]
 
-        for chapter in chapters:
+        starts = _ms_array_to_timecodes(
+            np.fromiter((c.start_ms for c in chapters), dtype=np.int64, count=len(chapters))
+        )
+
+        for chapter, start in zip(chapters, starts):
             # Format: (HH:MM:SS.mmm) Title
-            line = f"({chapter.start_timecode}) {chapter.title}"
+            line = f"({start}) {chapter.title}"
             if chapter.url:
                 line += f" <{chapter.url}>"
             lines.append(line)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        with open(output_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
 
         logger.info(f"Exported {len(chapters)} chapters to Podlove format")
         return True
@@ -916,25 +1219,23 @@ def export_chapters_webvtt(chapters: ChapterList, output_path: str) -> bool:
     try:
         lines = ["WEBVTT", ""]
 
-        for i, chapter in enumerate(chapters):
-            lines.append(f"Chapter {i + 1}")
-
-            # WebVTT uses HH:MM:SS.mmm --> HH:MM:SS.mmm format
-            start = chapter.start_timecode
-            end = chapter.end_timecode or chapter.start_timecode
-
-            # Ensure HH:MM:SS format (pad if needed)
-            if start.count(":") == 1:
-                start = "00:" + start
-            if end.count(":") == 1:
-                end = "00:" + end
+        # WebVTT uses HH:MM:SS.mmm --> HH:MM:SS.mmm format
+        num_chapters = len(chapters)
+        start_ms = np.fromiter((c.start_ms for c in chapters), dtype=np.int64, count=num_chapters)
+        end_ms = np.fromiter(
+            (c.end_ms or c.start_ms for c in chapters), dtype=np.int64, count=num_chapters
+        )
+        starts = _ms_array_to_timecodes(start_ms)
+        ends = _ms_array_to_timecodes(end_ms)
 
+        for i, (chapter, start, end) in enumerate(zip(chapters, starts, ends)):
+            lines.append(f"Chapter {i + 1}")
             lines.append(f"{start} --> {end}")
             lines.append(chapter.title)
             lines.append("")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        with open(output_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
 
         logger.info(f"Exported {len(chapters)} chapters to WebVTT format")
         return True
@@ -959,21 +1260,14 @@ def export_chapters_ffmetadata(chapters: ChapterList, output_path: str) -> bool:
         lines = [";FFMETADATA1"]
 
         if chapters.episode_title:
-            lines.append(f"title={chapters.episode_title}")
+            lines.append(f"title={chapters.episode_title.translate(_FFMETADATA_ESCAPES)}")
         if chapters.episode_number:
             lines.append(f"track={chapters.episode_number}")
 
-        for chapter in chapters:
-            lines.append("")
-            lines.append("[CHAPTER]")
-            lines.append("TIMEBASE=1/1000")
-            lines.append(f"START={chapter.start_ms}")
-            lines.append(f"END={chapter.end_ms or chapter.start_ms}")
-            safe_title = chapter.title.replace("=", "\\=")
-            lines.append(f"title={safe_title}")
+        lines.extend(_ffmetadata_chapter_lines(chapters))
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        with open(output_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
 
         logger.info(f"Exported {len(chapters)} chapters to FFmetadata format")
         return True
@@ -986,6 +1280,30 @@ def export_chapters_ffmetadata(chapters: ChapterList, output_path: str) -> bool:
 # CHAPTER GENERATION FROM GAME DATA
 # =============================================================================
 
+# Segment event types that get their own chapter in generate_episode_chapters
+_EPISODE_EVENT_TYPES = frozenset({"MURDER", "BANISHMENT", "ROLE_REVEAL"})
+
+
+def _segment_phase(seg_data: Any) -> Optional[str]:
+    """Get a segment's phase, falling back to metadata["phase"] when unset."""
+    phase = getattr(seg_data, "phase", None)
+    if phase is None:
+        metadata = getattr(seg_data, "metadata", None)
+        if metadata is not None:
+            phase = metadata.get("phase")
+    return phase
+
+
+def _confessional_speaker(seg_data: Any) -> Optional[Tuple[str, Optional[str]]]:
+    """Get (speaker_name, speaker_id) for a named confessional segment."""
+    seg_type = getattr(seg_data, "segment_type", None)
+    if seg_type and str(seg_type).endswith("CONFESSIONAL"):
+        speaker_name = getattr(seg_data, "speaker_name", None)
+        if speaker_name:
+            return speaker_name, getattr(seg_data, "speaker_id", None)
+    return None
+
+
 def generate_episode_chapters(
     voice_segments: List[Any],
     script: Optional[Any] = None,
@@ -1015,52 +1333,42 @@ def generate_episode_chapters(
     if not voice_segments:
         return chapters
 
-    # Track phase changes
-    current_phase = None
-    phase_start_ms = 0
+    # Pull the fields we need out of each segment once, into parallel lists
+    starts = [segment.start_ms for segment in voice_segments]
+    seg_data = [getattr(segment, "segment", segment) for segment in voice_segments]
+    phases = [_segment_phase(data) for data in seg_data]
+    no_values = repeat(None)
 
-    for segment in voice_segments:
-        seg_data = segment.segment if hasattr(segment, "segment") else segment
+    event_types = (
+        [getattr(data, "event_type", None) for data in seg_data]
+        if include_events else no_values
+    )
+    confessionals = (
+        [_confessional_speaker(data) for data in seg_data]
+        if include_confessionals else no_values
+    )
 
-        # Get phase from segment
-        phase = getattr(seg_data, "phase", None)
-        if phase is None and hasattr(seg_data, "metadata"):
-            phase = seg_data.metadata.get("phase")
+    # Track phase changes
+    current_phase = None
 
+    for start_ms, phase, event_type, speaker in zip(starts, phases, event_types, confessionals):
         # Phase changed - add chapter
         if phase and phase != current_phase:
-            if current_phase is not None:
-                # End previous phase
-                pass
-
-            chapters.add_phase(
-                phase=phase,
-                start_ms=segment.start_ms,
-            )
+            chapters.add_phase(phase=phase, start_ms=start_ms)
             current_phase = phase
-            phase_start_ms = segment.start_ms
 
         # Check for significant events
-        if include_events:
-            event_type = getattr(seg_data, "event_type", None)
-            if event_type in ("MURDER", "BANISHMENT", "ROLE_REVEAL"):
-                chapters.add_event(
-                    event_type=event_type,
-                    start_ms=segment.start_ms,
-                )
+        if event_type in _EPISODE_EVENT_TYPES:
+            chapters.add_event(event_type=event_type, start_ms=start_ms)
 
         # Check for confessionals
-        if include_confessionals:
-            seg_type = getattr(seg_data, "segment_type", None)
-            if seg_type and str(seg_type).endswith("CONFESSIONAL"):
-                speaker_name = getattr(seg_data, "speaker_name", None)
-                speaker_id = getattr(seg_data, "speaker_id", None)
-                if speaker_name:
-                    chapters.add_confessional(
-                        speaker_name=speaker_name,
-                        speaker_id=speaker_id or "unknown",
-                        start_ms=segment.start_ms,
-                    )
+        if speaker is not None:
+            speaker_name, speaker_id = speaker
+            chapters.add_confessional(
+                speaker_name=speaker_name,
+                speaker_id=speaker_id or "unknown",
+                start_ms=start_ms,
+            )
 
     # Finalize and clean up
     chapters.finalize(total_duration_ms)
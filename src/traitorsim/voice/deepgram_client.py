@@ -34,17 +34,55 @@ import asyncio
 import aiohttp
 import logging
 import json
+import math
 import time
 import numpy as np
-from typing import Dict, List, Optional, Any, AsyncIterator, Union
-from dataclasses import dataclass, field
-from enum import Enum
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, AsyncIterator, Sequence, Tuple, Union
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from urllib.parse import urlencode
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 logger = logging.getLogger(__name__)
 
+# Parser for streamed transcript frames (orjson accepts str and bytes)
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
 
-class DeepgramModel(str, Enum):
-    """Available Deepgram models."""
+# Control messages are constant; serialize them once. They must go out as
+# text frames, since Deepgram treats every binary frame as audio.
+_KEEPALIVE_MESSAGE = json.dumps({"type": "KeepAlive"})
+_CLOSE_STREAM_MESSAGE = json.dumps({"type": "CloseStream"})
+
+# Longest a partially filled send buffer may wait for more audio (seconds)
+_SEND_FLUSH_INTERVAL_S = 0.02
+
+# Transcripts buffered between the WebSocket reader and a slow consumer
+_RESULT_QUEUE_SIZE = 64
+
+# Batch uploads larger than this are sent chunked, _UPLOAD_CHUNK_BYTES at a time
+_CHUNKED_UPLOAD_MIN_BYTES = 1024 * 1024
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+class DeepgramModel:
+    """Available Deepgram models.
+
+    Plain string constants rather than an Enum, so a model always formats
+    as its API name (str-mixin Enums format as "DeepgramModel.NOVA_3" in
+    f-strings from Python 3.12).
+    """
     NOVA_3 = "nova-3"              # Latest, most accurate (default)
     NOVA_2 = "nova-2"              # Previous generation
     NOVA_2_GENERAL = "nova-2-general"  # General purpose
@@ -61,7 +99,7 @@ class DeepgramModel(str, Enum):
     BASE = "base"                  # Legacy base model
 
 
-@dataclass
+@dataclass(slots=True)
 class WordInfo:
     """Individual word timing and confidence information."""
     word: str                      # The word text
@@ -82,18 +120,76 @@ class WordInfo:
         )
 
 
-@dataclass
+class WordTimings(Sequence):
+    """Word timings for a long transcript, stored as parallel arrays.
+
+    Behaves like a read-only list of WordInfo, but WordInfo objects are only
+    built when indexed or iterated. Consumers that just need timings can
+    read the starts/ends/confidences arrays directly.
+    """
+
+    __slots__ = ("words", "starts", "ends", "confidences", "speakers")
+
+    def __init__(
+        self,
+        words: List[str],
+        starts: np.ndarray,
+        ends: np.ndarray,
+        confidences: np.ndarray,
+        speakers: List[Optional[int]],
+    ):
+        self.words = words
+        self.starts = starts
+        self.ends = ends
+        self.confidences = confidences
+        self.speakers = speakers
+
+    @classmethod
+    def from_deepgram(cls, words_data: List[Dict[str, Any]]) -> "WordTimings":
+        """Create from a Deepgram alternative's "words" list."""
+        count = len(words_data)
+        return cls(
+            words=[w.get("word", "") for w in words_data],
+            starts=np.fromiter((w.get("start", 0.0) for w in words_data), np.float64, count),
+            ends=np.fromiter((w.get("end", 0.0) for w in words_data), np.float64, count),
+            confidences=np.fromiter(
+                (w.get("confidence", 0.0) for w in words_data), np.float64, count
+            ),
+            speakers=[w.get("speaker") for w in words_data],
+        )
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.words)))]
+        return WordInfo(
+            word=self.words[index],
+            start=float(self.starts[index]),
+            end=float(self.ends[index]),
+            confidence=float(self.confidences[index]),
+            speaker=self.speakers[index],
+        )
+
+
+# Transcripts with more words than this store them as WordTimings
+_WORD_TIMINGS_MIN_WORDS = 64
+
+
+@dataclass(slots=True)
 class TranscriptResult:
     """Result from a transcription request."""
     text: str                      # Transcribed text
     is_final: bool                 # Whether this is a final result
     confidence: float              # Overall confidence 0.0-1.0
-    words: List[WordInfo]          # Word-level timing/confidence
+    words: Sequence[WordInfo]      # Word-level timing/confidence
     start_time: float              # Transcript start time in seconds
     end_time: float                # Transcript end time in seconds
     speaker_id: Optional[int] = None  # Speaker ID (if diarization enabled)
     language: Optional[str] = None    # Detected language
     is_dry_run: bool = False       # Whether this was a simulated result
+    delta_text: Optional[str] = None  # Streaming: text after the last final result
 
     @classmethod
     def from_deepgram(cls, data: Dict[str, Any], is_final: bool = True) -> "TranscriptResult":
@@ -110,13 +206,49 @@ class TranscriptResult:
         if not alternatives:
             alternatives = [{}]
 
-        best = alternatives[0]
-        words_data = best.get("words", [])
-        words = [WordInfo.from_deepgram(w) for w in words_data]
+        return cls.from_alternative(alternatives[0], is_final, data.get("detected_language"))
 
-        # Calculate time range
-        start_time = words[0].start if words else 0.0
-        end_time = words[-1].end if words else 0.0
+    @classmethod
+    def from_alternative(
+        cls,
+        best: Dict[str, Any],
+        is_final: bool = True,
+        language: Optional[str] = None,
+        parse_words: bool = True,
+        start: float = 0.0,
+        duration: float = 0.0,
+    ) -> "TranscriptResult":
+        """Create from an already-selected Deepgram alternative.
+
+        Args:
+            best: Top entry of the channel's "alternatives" list
+            is_final: Whether this is a final transcript
+            language: Detected language, if reported
+            parse_words: Build word timings; if False, words is empty and
+                the time range comes from start/duration instead
+            start: Message start time in seconds (used without words)
+            duration: Message duration in seconds (used without words)
+
+        Returns:
+            TranscriptResult instance
+        """
+        if parse_words:
+            words_data = best.get("words", [])
+            if len(words_data) > _WORD_TIMINGS_MIN_WORDS:
+                # Long (batch) transcripts: parallel arrays, WordInfo on demand
+                words = WordTimings.from_deepgram(words_data)
+                start_time = float(words.starts[0])
+                end_time = float(words.ends[-1])
+            else:
+                words = [WordInfo.from_deepgram(w) for w in words_data]
+
+                # Calculate time range
+                start_time = words[0].start if words else 0.0
+                end_time = words[-1].end if words else 0.0
+        else:
+            words = []
+            start_time = start
+            end_time = start + duration
 
         return cls(
             text=best.get("transcript", ""),
@@ -125,11 +257,163 @@ class TranscriptResult:
             words=words,
             start_time=start_time,
             end_time=end_time,
-            language=data.get("detected_language"),
+            language=language,
+        )
+
+
+def _parse_transcript_json(
+    raw: Union[str, bytes],
+    committed_end: float = 0.0,
+) -> Optional[TranscriptResult]:
+    """Parse a streamed frame via dicts; None if it carries no transcript.
+
+    committed_end is the end time of the last final result; words before it
+    are left out of delta_text.
+    """
+    data = _json_loads(raw)
+
+    # Only "Results" frames have a channel object (UtteranceEnd and
+    # SpeechStarted send a list of channel indices instead)
+    channel = data.get("channel")
+    if not isinstance(channel, dict):
+        return None
+
+    alternatives = channel.get("alternatives")
+    if not alternatives:
+        return None
+
+    # Skip empty transcripts before building word timings
+    best = alternatives[0]
+    if not best.get("transcript", "").strip():
+        return None
+
+    # Determine if final
+    is_final = bool(data.get("is_final") or data.get("speech_final"))
+
+    # Interim frames are superseded almost immediately, so skip their
+    # per-word objects and take the time range from the message itself
+    start = data.get("start", 0.0)
+    result = TranscriptResult.from_alternative(
+        best,
+        is_final,
+        channel.get("detected_language"),
+        parse_words=is_final,
+        start=start,
+        duration=data.get("duration", 0.0),
+    )
+
+    # Only frames reaching back into committed audio need a word-level cut
+    if start < committed_end:
+        result.delta_text = " ".join(
+            w.get("punctuated_word") or w.get("word", "")
+            for w in best.get("words", ())
+            if w.get("start", 0.0) >= committed_end
+        )
+    else:
+        result.delta_text = result.text
+
+    return result
+
+
+if HAS_MSGSPEC:
+    class _WordFrame(msgspec.Struct):
+        word: str = ""
+        start: float = 0.0
+        end: float = 0.0
+        confidence: float = 0.0
+        speaker: Optional[int] = None
+        punctuated_word: Optional[str] = None
+
+    class _AlternativeFrame(msgspec.Struct):
+        transcript: str = ""
+        confidence: float = 0.0
+        words: List[_WordFrame] = []
+
+    class _ChannelFrame(msgspec.Struct):
+        alternatives: List[_AlternativeFrame] = []
+        detected_language: Optional[str] = None
+
+    class _ResultsFrame(msgspec.Struct):
+        channel: Optional[_ChannelFrame] = None
+        start: float = 0.0
+        duration: float = 0.0
+        is_final: Optional[bool] = None
+        speech_final: Optional[bool] = None
+
+    # Decodes JSON straight into the structs above, skipping unknown keys
+    _FRAME_DECODER = msgspec.json.Decoder(_ResultsFrame)
+
+    def _parse_transcript_msgspec(
+        raw: Union[str, bytes],
+        committed_end: float = 0.0,
+    ) -> Optional[TranscriptResult]:
+        """Parse a streamed frame via msgspec; None if it carries no transcript."""
+        try:
+            frame = _FRAME_DECODER.decode(raw)
+        except msgspec.ValidationError:
+            # Non-Results frames (e.g. UtteranceEnd) don't fit the schema
+            return None
+
+        channel = frame.channel
+        if channel is None or not channel.alternatives:
+            return None
+
+        best = channel.alternatives[0]
+        if not best.transcript.strip():
+            return None
+
+        is_final = bool(frame.is_final or frame.speech_final)
+        words_data = best.words
+
+        if not is_final:
+            words = []
+            start_time = frame.start
+            end_time = frame.start + frame.duration
+        elif len(words_data) > _WORD_TIMINGS_MIN_WORDS:
+            count = len(words_data)
+            words = WordTimings(
+                words=[w.word for w in words_data],
+                starts=np.fromiter((w.start for w in words_data), np.float64, count),
+                ends=np.fromiter((w.end for w in words_data), np.float64, count),
+                confidences=np.fromiter((w.confidence for w in words_data), np.float64, count),
+                speakers=[w.speaker for w in words_data],
+            )
+            start_time = float(words.starts[0])
+            end_time = float(words.ends[-1])
+        else:
+            words = [
+                WordInfo(w.word, w.start, w.end, w.confidence, w.speaker)
+                for w in words_data
+            ]
+            start_time = words[0].start if words else 0.0
+            end_time = words[-1].end if words else 0.0
+
+        if frame.start < committed_end:
+            delta_text = " ".join(
+                w.punctuated_word or w.word
+                for w in words_data
+                if w.start >= committed_end
+            )
+        else:
+            delta_text = best.transcript
+
+        return TranscriptResult(
+            text=best.transcript,
+            is_final=is_final,
+            confidence=best.confidence,
+            words=words,
+            start_time=start_time,
+            end_time=end_time,
+            language=channel.detected_language,
+            delta_text=delta_text,
         )
 
+    _parse_transcript_frame = _parse_transcript_msgspec
+else:
+    _parse_transcript_frame = _parse_transcript_json
 
-@dataclass
+
+@dataclass(slots=True)
 class VADResult:
     """Voice Activity Detection result."""
     is_speech: bool                # Whether speech was detected
@@ -149,18 +433,24 @@ class VADResult:
         Returns:
             VADResult
         """
-        # Convert bytes to numpy array
+        # View bytes as int16 samples (no copy)
         try:
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+            samples = np.frombuffer(audio_data, dtype=np.int16)
         except Exception:
             # Return no speech if we can't parse audio
             return cls(is_speech=False, confidence=0.0, duration=0.0, energy=0.0)
 
-        # Calculate energy (RMS)
-        energy = float(np.sqrt(np.mean(audio_array ** 2)))
+        if samples.size == 0:
+            return cls(is_speech=False, confidence=0.0, duration=0.0, energy=0.0)
+
+        # Calculate energy (RMS): BLAS dot product fuses square + sum with no
+        # squared temporary; the [0, 1] scale is applied once to the result
+        audio_array = samples.astype(np.float32)
+        sum_sq = float(np.dot(audio_array, audio_array))
+        energy = math.sqrt(sum_sq / samples.size) / 32768.0
 
         # Calculate duration
-        duration = len(audio_array) / sample_rate
+        duration = samples.size / sample_rate
 
         # Determine if speech
         is_speech = energy > threshold
@@ -174,37 +464,46 @@ class VADResult:
         )
 
 
-@dataclass
+# Deepgram query-param spelling of bools, indexed by the bool itself
+_BOOL_STR = ("false", "true")
+
+
+@dataclass(frozen=True)
 class DeepgramConfig:
-    """Configuration for Deepgram transcription."""
-    model: str = DeepgramModel.NOVA_3.value  # Model to use
+    """Configuration for Deepgram transcription.
+
+    Frozen so the serialized query string can be cached and reused across
+    reconnects; use dataclasses.replace() to derive a modified config.
+    """
+    model: str = DeepgramModel.NOVA_3  # Model to use
     language: str = "en"                     # Language code (en, es, fr, etc.)
     punctuate: bool = True                   # Automatic punctuation
     diarize: bool = False                    # Speaker diarization
     smart_format: bool = True                # Smart formatting (numbers, dates, etc.)
     interim_results: bool = True             # Return interim transcripts
-    utterance_end_ms: int = 1000             # Silence duration to trigger utterance end
+    utterance_end_ms: int = 1000             # Silence duration to trigger utterance end (min 1000)
     vad_events: bool = False                 # Emit VAD events
     profanity_filter: bool = False           # Filter profanity
-    redact: List[str] = field(default_factory=list)  # PII to redact (e.g., ["pci", "ssn"])
-    keywords: List[str] = field(default_factory=list)  # Boost these keywords
+    redact: Tuple[str, ...] = ()             # PII to redact (e.g., ("pci", "ssn"))
+    keywords: Tuple[str, ...] = ()           # Boost these keywords
     sample_rate: int = 16000                 # Audio sample rate
     channels: int = 1                        # Audio channels
     encoding: str = "linear16"               # Audio encoding
-    endpointing: int = 300                   # Endpointing delay (ms)
+    endpointing: int = 150                   # Endpointing delay (ms); lower = faster finals
+    max_send_chunk_bytes: int = 8192         # Coalesce audio up to this size per frame (0 = off)
 
     def to_params(self) -> Dict[str, Any]:
         """Convert to Deepgram API query parameters."""
         params = {
             "model": self.model,
             "language": self.language,
-            "punctuate": str(self.punctuate).lower(),
-            "diarize": str(self.diarize).lower(),
-            "smart_format": str(self.smart_format).lower(),
-            "interim_results": str(self.interim_results).lower(),
+            "punctuate": _BOOL_STR[self.punctuate],
+            "diarize": _BOOL_STR[self.diarize],
+            "smart_format": _BOOL_STR[self.smart_format],
+            "interim_results": _BOOL_STR[self.interim_results],
             "utterance_end_ms": str(self.utterance_end_ms),
-            "vad_events": str(self.vad_events).lower(),
-            "profanity_filter": str(self.profanity_filter).lower(),
+            "vad_events": _BOOL_STR[self.vad_events],
+            "profanity_filter": _BOOL_STR[self.profanity_filter],
             "endpointing": str(self.endpointing),
             "sample_rate": str(self.sample_rate),
             "channels": str(self.channels),
@@ -219,15 +518,20 @@ class DeepgramConfig:
 
         return params
 
+    @cached_property
+    def query_string(self) -> str:
+        """URL-encoded query string for to_params(), built once per config."""
+        return urlencode(self.to_params())
+
 
-@dataclass
+@dataclass(slots=True)
 class UsageStats:
     """Track API usage for monitoring."""
     total_audio_duration_s: float = 0.0      # Total audio processed (seconds)
     total_requests: int = 0                   # Total requests made
     total_errors: int = 0                     # Total errors encountered
-    requests_by_model: Dict[str, int] = field(default_factory=dict)
-    audio_by_model: Dict[str, float] = field(default_factory=dict)
+    requests_by_model: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    audio_by_model: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
     final_transcripts: int = 0                # Final transcript count
     interim_transcripts: int = 0              # Interim transcript count
 
@@ -235,8 +539,8 @@ class UsageStats:
         """Record a transcription request."""
         self.total_audio_duration_s += duration_s
         self.total_requests += 1
-        self.requests_by_model[model] = self.requests_by_model.get(model, 0) + 1
-        self.audio_by_model[model] = self.audio_by_model.get(model, 0.0) + duration_s
+        self.requests_by_model[model] += 1
+        self.audio_by_model[model] += duration_s
 
         if is_final:
             self.final_transcripts += 1
@@ -276,7 +580,7 @@ class UsageStats:
             "total_errors": self.total_errors,
             "final_transcripts": self.final_transcripts,
             "interim_transcripts": self.interim_transcripts,
-            "requests_by_model": self.requests_by_model,
+            "requests_by_model": dict(self.requests_by_model),
             "audio_by_model": {k: round(v, 2) for k, v in self.audio_by_model.items()},
             "estimated_cost_usd": {
                 "pay_as_you_go": round(self.estimate_cost_usd("pay_as_you_go"), 4),
@@ -286,23 +590,82 @@ class UsageStats:
         }
 
 
+# Plausible phrases returned by dry-run transcription
+_MOCK_PHRASES = (
+    "I think they might be a traitor",
+    "We should vote them out",
+    "I trust them completely",
+    "That was definitely suspicious",
+    "Let's work together on this mission",
+    "I have a bad feeling about this",
+    "We need to be strategic here",
+    "I'm not sure who to believe",
+    "This is getting intense",
+    "I think we're making progress",
+)
+
+
+def _build_mock_transcript(phrase: str) -> Tuple[str, Tuple[WordInfo, ...], float]:
+    """Build (text, word timings, end time) for a dry-run phrase."""
+    word_infos = []
+    current_time = 0.0
+
+    for word in phrase.split():
+        word_duration = len(word) * 0.1  # ~0.1s per character
+        word_infos.append(WordInfo(
+            word=word,
+            start=current_time,
+            end=current_time + word_duration,
+            confidence=0.95,
+        ))
+        current_time += word_duration + 0.05  # 50ms gap
+
+    return phrase, tuple(word_infos), current_time
+
+
+def _interim_phrase(phrase: str) -> str:
+    """Truncate a phrase to its first half, as an interim result would be."""
+    words = phrase.split()
+    return " ".join(words[:len(words) // 2])
+
+
+# (final, interim) dry-run transcripts per phrase, built once at import
+_MOCK_TRANSCRIPTS = tuple(
+    (_build_mock_transcript(p), _build_mock_transcript(_interim_phrase(p)))
+    for p in _MOCK_PHRASES
+)
+
+
 class DeepgramClient:
     """Client for Deepgram Speech-to-Text API.
 
     Supports both streaming (WebSocket) and batch (REST) transcription,
     with optional dry-run mode for development.
+
+    With low_latency=True, streams started without an explicit config use
+    100ms endpointing and interim results, trading some mid-sentence
+    finals (a pause can split an utterance) for faster turn-taking.
     """
 
     WEBSOCKET_URL = "wss://api.deepgram.com/v1/listen"
     REST_URL = "https://api.deepgram.com/v1/listen"
 
+    # Sessions for clients created with use_shared_session=True, keyed by
+    # (api_key, id(event loop)) -> [session, number of clients holding it]
+    _SHARED_SESSIONS: Dict[Tuple[Optional[str], int], List[Any]] = {}
+
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = DeepgramModel.NOVA_3.value,
+        model: str = DeepgramModel.NOVA_3,
         language: str = "en",
         dry_run: bool = False,
         log_requests: bool = True,
+        enable_stats: bool = True,
+        pool_size: int = 20,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        low_latency: bool = False,
+        use_shared_session: bool = False,
     ):
         """Initialize the Deepgram client.
 
@@ -312,16 +675,31 @@ class DeepgramClient:
             language: Default language code.
             dry_run: If True, simulate API calls without making them.
             log_requests: Whether to log API requests.
+            enable_stats: Whether to record per-transcript usage stats.
+                Errors are always counted.
+            pool_size: Maximum pooled connections to the Deepgram host.
+            timeout: Session timeout. Defaults to a 10s connect and 30s
+                read timeout with no overall limit.
+            low_latency: Use aggressive endpointing for default stream configs.
+            use_shared_session: Share one connection pool with other clients
+                using the same API key on the same event loop. The first
+                client's pool_size and timeout apply to the shared session.
         """
         self.api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
         self.default_model = model
         self.default_language = language
         self.dry_run = dry_run
         self.log_requests = log_requests
+        self.enable_stats = enable_stats
+        self.low_latency = low_latency
+        self.use_shared_session = use_shared_session
         self.usage_stats = UsageStats()
+        self.pool_size = pool_size
+        self.timeout = timeout or aiohttp.ClientTimeout(total=None, connect=10, sock_read=30)
 
         # Session for async requests
         self._session: Optional[aiohttp.ClientSession] = None
+        self._shared_key: Optional[Tuple[Optional[str], int]] = None
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
 
         # Keep-alive task
@@ -337,14 +715,60 @@ class DeepgramClient:
             )
             self.dry_run = True
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a pooled aiohttp session for this client's API key."""
+        # Pool connections and cache DNS so repeated batch calls and
+        # stream reconnects skip the lookup and TLS handshake
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.pool_size,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Authorization": f"Token {self.api_key}"},
+        )
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={"Authorization": f"Token {self.api_key}"}
-            )
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if not self.use_shared_session:
+            self._session = self._create_session()
+            return self._session
+
+        # Sessions are bound to their event loop, so key on it as well
+        key = (self.api_key, id(asyncio.get_running_loop()))
+        entry = self._SHARED_SESSIONS.get(key)
+        if entry is None or entry[0].closed:
+            entry = self._SHARED_SESSIONS[key] = [self._create_session(), 0]
+        entry[1] += 1
+
+        self._session = entry[0]
+        self._shared_key = key
         return self._session
 
+    async def _release_session(self):
+        """Close this client's session, or drop its hold on a shared one."""
+        session, self._session = self._session, None
+        if session is None:
+            return
+
+        if self._shared_key is not None:
+            key, self._shared_key = self._shared_key, None
+            entry = self._SHARED_SESSIONS.get(key)
+            if entry is not None and entry[0] is session:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del self._SHARED_SESSIONS[key]
+
+        if not session.closed:
+            await session.close()
+
     async def close(self):
         """Close connections and cleanup resources."""
         # Stop keepalive
@@ -360,8 +784,7 @@ class DeepgramClient:
             await self._ws.close()
 
         # Close session
-        if self._session and not self._session.closed:
-            await self._session.close()
+        await self._release_session()
 
     async def _keepalive_loop(self, ws: aiohttp.ClientWebSocketResponse):
         """Send keepalive pings to maintain WebSocket connection."""
@@ -369,7 +792,7 @@ class DeepgramClient:
             while not ws.closed:
                 await asyncio.sleep(5)  # Ping every 5 seconds
                 if not ws.closed:
-                    await ws.send_json({"type": "KeepAlive"})
+                    await ws.send_str(_KEEPALIVE_MESSAGE)
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -397,10 +820,13 @@ class DeepgramClient:
         Yields:
             TranscriptResult for each transcript (interim and final)
         """
-        config = config or DeepgramConfig(
-            model=self.default_model,
-            language=self.default_language,
-        )
+        if config is None:
+            config = DeepgramConfig(
+                model=self.default_model,
+                language=self.default_language,
+            )
+            if self.low_latency:
+                config = replace(config, endpointing=100, interim_results=True)
 
         if self.log_requests:
             logger.info(
@@ -442,51 +868,122 @@ class DeepgramClient:
         session = await self._get_session()
 
         # Build WebSocket URL with query params
-        params = config.to_params()
-        param_str = "&".join(f"{k}={v}" for k, v in params.items())
-        ws_url = f"{self.WEBSOCKET_URL}?{param_str}"
+        ws_url = f"{self.WEBSOCKET_URL}?{config.query_string}"
 
         # Connect WebSocket
         async with session.ws_connect(ws_url) as ws:
             self._ws = ws
 
-            # Start keepalive
-            self._keepalive_task = asyncio.create_task(self._keepalive_loop(ws))
+            # Bounded so a slow consumer pushes back on the reader instead
+            # of piling transcripts up on the event loop. Sender/receiver
+            # failures are forwarded through it rather than by cancelling
+            # the consumer, which may be running its own code between yields
+            results: asyncio.Queue = asyncio.Queue(maxsize=_RESULT_QUEUE_SIZE)
 
-            # Create tasks for sending and receiving
-            send_task = asyncio.create_task(self._send_audio(ws, audio_stream))
-            receive_task = asyncio.create_task(self._receive_transcripts(ws, config))
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop(ws))
+            tasks = (
+                self._keepalive_task,
+                asyncio.create_task(
+                    _forward_errors(self._send_audio(ws, audio_stream, config), results)
+                ),
+                asyncio.create_task(
+                    _forward_errors(self._queue_transcripts(ws, config, results), results)
+                ),
+            )
 
             try:
                 # Process transcripts as they arrive
-                async for result in receive_task:
-                    yield result
+                while (item := await results.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
             finally:
-                # Cleanup
-                send_task.cancel()
-                try:
-                    await send_task
-                except asyncio.CancelledError:
-                    pass
+                # Cleanup: stop feeding the server even if we exit early
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _send_audio(
         self,
         ws: aiohttp.ClientWebSocketResponse,
         audio_stream: AsyncIterator[bytes],
+        config: Optional[DeepgramConfig] = None,
     ):
-        """Send audio chunks to WebSocket."""
+        """Send audio chunks to WebSocket.
+
+        Small chunks are coalesced into frames of up to
+        config.max_send_chunk_bytes. A partially filled buffer is flushed
+        once it has waited _SEND_FLUSH_INTERVAL_S, so batching never adds
+        more than that much latency.
+        """
+        max_bytes = config.max_send_chunk_bytes if config else 0
+        pending = None
+
         try:
-            async for chunk in audio_stream:
-                if ws.closed:
-                    break
-                await ws.send_bytes(chunk)
+            if max_bytes <= 0:
+                async for chunk in audio_stream:
+                    if ws.closed:
+                        break
+                    await ws.send_bytes(chunk)
+            else:
+                loop = asyncio.get_running_loop()
+                chunks = aiter(audio_stream)
+                buf = bytearray()
+                flush_at = 0.0
+
+                while not ws.closed:
+                    # Keep one read in flight across flushes; cancelling
+                    # it would close the caller's async generator
+                    if pending is None:
+                        pending = asyncio.ensure_future(anext(chunks))
+
+                    if buf:
+                        done, _ = await asyncio.wait(
+                            (pending,), timeout=max(0.0, flush_at - loop.time())
+                        )
+                        if not done:
+                            await ws.send_bytes(bytes(buf))
+                            buf.clear()
+                            continue
+
+                    try:
+                        chunk = await pending
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        pending = None
+
+                    if not buf:
+                        flush_at = loop.time() + _SEND_FLUSH_INTERVAL_S
+                    buf += chunk
+
+                    if len(buf) >= max_bytes:
+                        await ws.send_bytes(bytes(buf))
+                        buf.clear()
+
+                if buf and not ws.closed:
+                    await ws.send_bytes(bytes(buf))
 
             # Send close message
             if not ws.closed:
-                await ws.send_json({"type": "CloseStream"})
+                await ws.send_str(_CLOSE_STREAM_MESSAGE)
         except Exception as e:
             logger.error(f"Error sending audio: {e}")
             raise
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _queue_transcripts(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        config: DeepgramConfig,
+        results: asyncio.Queue,
+    ):
+        """Put received transcripts on results, then a None sentinel on close."""
+        async for result in self._receive_transcripts(ws, config):
+            await results.put(result)
+        await results.put(None)
 
     async def _receive_transcripts(
         self,
@@ -494,38 +991,32 @@ class DeepgramClient:
         config: DeepgramConfig,
     ) -> AsyncIterator[TranscriptResult]:
         """Receive and parse transcripts from WebSocket."""
-        try:
-            async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
-
-                    # Parse transcript
-                    if "channel" in data:
-                        channel = data["channel"]
-                        alternatives = channel.get("alternatives", [])
-
-                        if not alternatives:
-                            continue
+        text_type = aiohttp.WSMsgType.TEXT
+        error_type = aiohttp.WSMsgType.ERROR
 
-                        # Determine if final
-                        is_final = data.get("is_final", False)
-                        speech_final = data.get("speech_final", False)
-                        is_final = is_final or speech_final
+        # End time of the last final result, so later frames can report
+        # only the text that hasn't been committed yet
+        committed_end = 0.0
 
-                        # Create result
-                        result = TranscriptResult.from_deepgram(channel, is_final)
+        try:
+            async for msg in ws:
+                msg_type = msg.type
+                if msg_type == text_type:
+                    result = _parse_transcript_frame(msg.data, committed_end)
+                    if result is None:
+                        continue
 
-                        # Skip empty transcripts
-                        if not result.text.strip():
-                            continue
+                    if result.is_final:
+                        committed_end = result.end_time
 
-                        # Record stats
+                    # Record stats
+                    if self.enable_stats:
                         duration = result.end_time - result.start_time
-                        self.usage_stats.record_request(config.model, duration, is_final)
+                        self.usage_stats.record_request(config.model, duration, result.is_final)
 
-                        yield result
+                    yield result
 
-                elif msg.type == aiohttp.WSMsgType.ERROR:
+                elif msg_type == error_type:
                     logger.error(f"WebSocket error: {ws.exception()}")
                     raise DeepgramAPIError(500, f"WebSocket error: {ws.exception()}")
 
@@ -571,20 +1062,26 @@ class DeepgramClient:
         # Dry run mode
         if self.dry_run:
             await asyncio.sleep(0.1)  # Simulate latency
-            self.usage_stats.record_request(config.model, duration_s, True)
+            if self.enable_stats:
+                self.usage_stats.record_request(config.model, duration_s, True)
             return self._generate_mock_transcript(duration_s, config)
 
         # Real API call
         session = await self._get_session()
 
-        params = config.to_params()
-        url = self.REST_URL
+        url = f"{self.REST_URL}?{config.query_string}"
 
         headers = {
             "Content-Type": f"audio/{config.encoding}",
         }
 
-        async with session.post(url, data=audio_data, params=params, headers=headers) as response:
+        # Stream long clips in slices of one buffer rather than as one write
+        if len(audio_data) > _CHUNKED_UPLOAD_MIN_BYTES:
+            body = _iter_chunks(audio_data, _UPLOAD_CHUNK_BYTES)
+        else:
+            body = audio_data
+
+        async with session.post(url, data=body, headers=headers) as response:
             if response.status != 200:
                 error_text = await response.text()
                 logger.error(f"Deepgram API error: {response.status} - {error_text}")
@@ -604,7 +1101,8 @@ class DeepgramClient:
         result = TranscriptResult.from_deepgram(channel, is_final=True)
 
         # Record stats
-        self.usage_stats.record_request(config.model, duration_s, True)
+        if self.enable_stats:
+            self.usage_stats.record_request(config.model, duration_s, True)
 
         return result
 
@@ -679,7 +1177,8 @@ class DeepgramClient:
                     config,
                     is_final=False,
                 )
-                self.usage_stats.record_request(config.model, chunk_duration, False)
+                if self.enable_stats:
+                    self.usage_stats.record_request(config.model, chunk_duration, False)
                 yield result
 
             # Generate final result every ~2 seconds
@@ -689,7 +1188,8 @@ class DeepgramClient:
                     config,
                     is_final=True,
                 )
-                self.usage_stats.record_request(config.model, accumulated_duration, True)
+                if self.enable_stats:
+                    self.usage_stats.record_request(config.model, accumulated_duration, True)
                 yield result
                 accumulated_duration = 0.0
 
@@ -702,54 +1202,37 @@ class DeepgramClient:
         """Generate mock transcript for dry-run mode."""
         self._mock_counter += 1
 
-        # Generate plausible text
-        mock_phrases = [
-            "I think they might be a traitor",
-            "We should vote them out",
-            "I trust them completely",
-            "That was definitely suspicious",
-            "Let's work together on this mission",
-            "I have a bad feeling about this",
-            "We need to be strategic here",
-            "I'm not sure who to believe",
-            "This is getting intense",
-            "I think we're making progress",
-        ]
-
-        phrase = mock_phrases[self._mock_counter % len(mock_phrases)]
-
-        if not is_final:
-            # Truncate for interim results
-            words = phrase.split()
-            phrase = " ".join(words[:len(words) // 2])
-
-        # Generate word timings
-        words = phrase.split()
-        word_infos = []
-        current_time = 0.0
-
-        for word in words:
-            word_duration = len(word) * 0.1  # ~0.1s per character
-            word_infos.append(WordInfo(
-                word=word,
-                start=current_time,
-                end=current_time + word_duration,
-                confidence=0.95,
-            ))
-            current_time += word_duration + 0.05  # 50ms gap
+        final, interim = _MOCK_TRANSCRIPTS[self._mock_counter % len(_MOCK_TRANSCRIPTS)]
+        phrase, word_infos, end_time = final if is_final else interim
 
         return TranscriptResult(
             text=phrase,
             is_final=is_final,
             confidence=0.95,
-            words=word_infos,
+            words=list(word_infos),
             start_time=0.0,
-            end_time=current_time,
+            end_time=end_time,
             language=config.language,
             is_dry_run=True,
+            delta_text=phrase,
         )
 
 
+async def _iter_chunks(data: bytes, size: int) -> AsyncIterator[memoryview]:
+    """Yield zero-copy slices of data for a chunked upload."""
+    view = memoryview(data)
+    for offset in range(0, len(view), size):
+        yield view[offset:offset + size]
+
+
+async def _forward_errors(coro, results: asyncio.Queue):
+    """Await coro, putting any exception it raises on results."""
+    try:
+        await coro
+    except Exception as e:
+        await results.put(e)
+
+
 class DeepgramAPIError(Exception):
     """Exception for Deepgram API errors."""
 
@@ -766,7 +1249,7 @@ class DeepgramAPIError(Exception):
 def create_client(
     api_key: Optional[str] = None,
     dry_run: Optional[bool] = None,
-    model: str = DeepgramModel.NOVA_3.value,
+    model: str = DeepgramModel.NOVA_3,
 ) -> DeepgramClient:
     """Create a Deepgram client with sensible defaults.
 
@@ -791,7 +1274,7 @@ def create_client(
 
 async def quick_transcribe(
     audio_data: bytes,
-    model: str = DeepgramModel.NOVA_3.value,
+    model: str = DeepgramModel.NOVA_3,
     language: str = "en",
     api_key: Optional[str] = None,
 ) -> str:
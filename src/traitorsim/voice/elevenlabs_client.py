@@ -31,15 +31,44 @@ Usage:
 import os
 import asyncio
 import aiohttp
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, AsyncIterator, Union
+import random
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import time
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  (needed for httpx's http2=True)
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 logger = logging.getLogger(__name__)
 
+# Request bodies are encoded up front (orjson when available) and posted
+# as raw bytes rather than through aiohttp's stdlib json= encoding
+_json_dumps = orjson.dumps if HAS_ORJSON else (lambda obj: json.dumps(obj).encode())
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient statuses worth retrying: rate limiting and server-side failures
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest wait between retries, whatever Retry-After asks for
+_MAX_RETRY_DELAY_S = 30.0
+
 
 class ElevenLabsModel(str, Enum):
     """Available ElevenLabs models."""
@@ -55,6 +84,17 @@ class ElevenLabsModel(str, Enum):
     ELEVEN_TURBO_V2_5 = "eleven_turbo_v2_5"      # Balanced quality/latency
 
 
+# Approximate USD cost per credit by plan
+_COST_PER_CREDIT = {
+    "pro": 99 / 500_000,            # $0.000198
+    "scale": 330 / 2_000_000,       # $0.000165
+    "business": 1320 / 11_000_000,  # $0.00012
+}
+
+# Average speaking rate: ~150 words/min = ~750 chars/min
+_SECONDS_PER_CHAR = 60 / 750
+
+
 @dataclass
 class VoiceSettings:
     """Voice synthesis settings for ElevenLabs API."""
@@ -73,6 +113,10 @@ class VoiceSettings:
         }
 
 
+# API form of VoiceSettings(), used whenever a call doesn't pass settings
+_DEFAULT_VOICE_SETTINGS = VoiceSettings().to_dict()
+
+
 @dataclass
 class SynthesisResult:
     """Result from a synthesis request."""
@@ -94,6 +138,8 @@ class UsageStats:
     requests_made: int = 0
     requests_by_model: Dict[str, int] = field(default_factory=dict)
     characters_by_model: Dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0               # Requests answered from the TTS cache
+    credits_saved: int = 0            # Credits those requests would have cost
 
     def record_request(self, model: str, characters: int, credits: int):
         """Record a synthesis request."""
@@ -103,6 +149,11 @@ class UsageStats:
         self.requests_by_model[model] = self.requests_by_model.get(model, 0) + 1
         self.characters_by_model[model] = self.characters_by_model.get(model, 0) + characters
 
+    def record_cache_hit(self, credits: int):
+        """Record a request served from cache instead of the API."""
+        self.cache_hits += 1
+        self.credits_saved += credits
+
     def estimate_cost_usd(self, plan: str = "pro") -> float:
         """Estimate USD cost based on credits used.
 
@@ -112,13 +163,7 @@ class UsageStats:
         Returns:
             Estimated cost in USD
         """
-        # Cost per credit by plan (approximate)
-        cost_per_credit = {
-            "pro": 99 / 500_000,       # $0.000198
-            "scale": 330 / 2_000_000,  # $0.000165
-            "business": 1320 / 11_000_000,  # $0.00012
-        }
-        rate = cost_per_credit.get(plan, cost_per_credit["pro"])
+        rate = _COST_PER_CREDIT.get(plan, _COST_PER_CREDIT["pro"])
         return self.total_credits * rate
 
     def to_dict(self) -> Dict[str, Any]:
@@ -129,6 +174,8 @@ class UsageStats:
             "requests_made": self.requests_made,
             "requests_by_model": self.requests_by_model,
             "characters_by_model": self.characters_by_model,
+            "cache_hits": self.cache_hits,
+            "credits_saved": self.credits_saved,
             "estimated_cost_usd": {
                 "pro": round(self.estimate_cost_usd("pro"), 4),
                 "scale": round(self.estimate_cost_usd("scale"), 4),
@@ -137,6 +184,136 @@ class UsageStats:
         }
 
 
+# One silent MP3 frame (128kbps, 44100Hz, stereo) that players can read;
+# dry-run audio is this frame repeated
+_MOCK_MP3_FRAME = bytes([
+    0xFF, 0xFB,  # Sync word + MPEG Audio Layer 3
+    0x90,        # 128kbps, 44100Hz
+    0x00,        # Additional flags
+]) + b'\x00' * 414  # Silence
+
+
+# (concurrent requests, requests/second) allowed per ElevenLabs plan
+TTS_PLAN_LIMITS: Dict[str, Tuple[int, float]] = {
+    "free": (2, 1.0),
+    "starter": (3, 2.0),
+    "creator": (5, 5.0),
+    "pro": (10, 20.0),
+    "scale": (15, 30.0),
+    "business": (15, 30.0),
+}
+
+
+class TokenBucket:
+    """Async token bucket for pacing API requests.
+
+    Holds up to `capacity` tokens and refills at `refill_per_s`; acquire()
+    waits until a whole token is available. Waiters are served in order.
+    """
+
+    def __init__(self, capacity: int, refill_per_s: float):
+        self.capacity = capacity
+        self.refill_per_s = refill_per_s
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None  # Created inside the loop
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for a refill if the bucket is empty."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.refill_per_s,
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.refill_per_s)
+
+
+class TTSCache:
+    """Content-addressed disk cache for synthesized audio.
+
+    Entries live at cache_dir/key[:2]/key. Once the total size exceeds
+    max_bytes, the least recently used entries are deleted.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = 100 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        # Index entries left by earlier runs, least recently used first
+        existing = []
+        for path in self.cache_dir.glob("??/*"):
+            if len(path.name) == 64:  # Skip in-progress temp files
+                stat = path.stat()
+                existing.append((stat.st_mtime, path.name, stat.st_size))
+        for _, key, size in sorted(existing):
+            self._sizes[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """SHA-256 over the request parameters that determine the audio."""
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        # First 2 chars as subdirectory for better file distribution
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio, or None on a miss."""
+        if key not in self._sizes:
+            return None
+
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            os.utime(path)  # Keep LRU order across runs
+        except OSError:
+            self._total_bytes -= self._sizes.pop(key)
+            return None
+
+        self._sizes.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store audio under key, evicting old entries if over budget."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+            temp_path.write_bytes(audio)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry {path}: {e}")
+            return
+
+        self._total_bytes += len(audio) - self._sizes.pop(key, 0)
+        self._sizes[key] = len(audio)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+
 class ElevenLabsClient:
     """Client for ElevenLabs Text-to-Speech and Text-to-Dialogue APIs.
 
@@ -161,6 +338,16 @@ class ElevenLabsClient:
         dry_run: bool = False,
         default_model: str = ElevenLabsModel.ELEVEN_V3.value,
         log_requests: bool = True,
+        plan: Optional[str] = None,
+        max_retries: int = 3,
+        pool_size: int = 16,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        capacity: int = 5,
+        rate: float = 10.0,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_bytes: int = 100 * 1024 * 1024,
+        transport: str = "aiohttp",
+        metadata_ttl: float = 300.0,
     ):
         """Initialize the ElevenLabs client.
 
@@ -169,19 +356,62 @@ class ElevenLabsClient:
             dry_run: If True, simulate API calls without making them.
             default_model: Default model for synthesis.
             log_requests: Whether to log API requests.
+            plan: ElevenLabs plan (free, starter, creator, pro, scale,
+                business). When given, capacity and rate come from the
+                plan's limits in TTS_PLAN_LIMITS.
+            max_retries: Retries for 429 and 5xx responses before the
+                error is raised.
+            pool_size: Maximum pooled connections to the ElevenLabs host.
+            timeout: Session timeout. Defaults to 60s per request with a 5s
+                connect timeout.
+            capacity: Requests that may start back-to-back before the rate
+                limit applies.
+            rate: Sustained requests per second.
+            cache_dir: Directory for a disk cache of synthesized audio.
+                Repeated requests are served from it without an API call.
+                None disables caching.
+            cache_max_bytes: Size limit for the disk cache.
+            transport: "aiohttp" (HTTP/1.1, one connection per concurrent
+                request) or "httpx" (HTTP/2, concurrent requests multiplexed
+                over one connection; needs httpx[http2]).
+            metadata_ttl: Seconds that voice and subscription lookups are
+                reused before being fetched again.
         """
         self.api_key = api_key or os.environ.get("ELEVENLABS_API_KEY")
         self.dry_run = dry_run
         self.default_model = default_model
         self.log_requests = log_requests
         self.usage_stats = UsageStats()
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.timeout = timeout or aiohttp.ClientTimeout(total=60, sock_connect=5)
 
         # Session for async requests
         self._session: Optional[aiohttp.ClientSession] = None
+        self._http2_client: Optional["httpx.AsyncClient"] = None
+
+        if transport == "httpx" and not HAS_HTTPX:
+            logger.warning(
+                "transport='httpx' needs httpx[http2] installed. "
+                "Using aiohttp."
+            )
+            transport = "aiohttp"
+        self.transport = transport
 
         # Rate limiting
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.1  # 100ms between requests
+        if plan is not None:
+            capacity, rate = TTS_PLAN_LIMITS.get(plan, TTS_PLAN_LIMITS["pro"])
+        self._bucket = TokenBucket(capacity=capacity, refill_per_s=rate)
+
+        # Optional cache of real (non dry-run) synthesis results
+        self._cache = TTSCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+        # Requests currently on the wire, keyed like the cache
+        self._inflight: Dict[str, "asyncio.Task[Tuple[bytes, float]]"] = {}
+
+        # Voice and subscription lookups: key -> (fetched at, data)
+        self.metadata_ttl = metadata_ttl
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
 
         if not self.api_key and not self.dry_run:
             logger.warning(
@@ -193,21 +423,56 @@ class ElevenLabsClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
+            # All traffic goes to one host: keep its connections alive and
+            # cache DNS so back-to-back requests skip the TLS handshake
+            connector = aiohttp.TCPConnector(
+                limit=2 * self.pool_size,
+                limit_per_host=self.pool_size,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
             self._session = aiohttp.ClientSession(
-                headers={"xi-api-key": self.api_key}
+                connector=connector,
+                timeout=self.timeout,
+                headers={"xi-api-key": self.api_key},
             )
         return self._session
 
+    def _get_http2_client(self) -> "httpx.AsyncClient":
+        """Get or create the HTTP/2 client used by transport="httpx"."""
+        if self._http2_client is None or self._http2_client.is_closed:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                headers={"xi-api-key": self.api_key},
+                timeout=httpx.Timeout(self.timeout.total, connect=self.timeout.sock_connect),
+                limits=httpx.Limits(
+                    max_connections=2 * self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+        return self._http2_client
+
     async def close(self):
-        """Close the aiohttp session."""
+        """Close the HTTP session."""
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._http2_client is not None and not self._http2_client.is_closed:
+            await self._http2_client.aclose()
+
+    async def __aenter__(self) -> "ElevenLabsClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     def _calculate_credits(self, text: str, model: str) -> int:
         """Calculate credits for a synthesis request."""
-        chars = len(text)
-        rate = self.CREDITS_PER_CHAR.get(model, 1.0)
-        return int(chars * rate)
+        return self._credits_for_chars(len(text), model)
+
+    def _credits_for_chars(self, chars: int, model: str) -> int:
+        """Calculate credits for a request of chars characters."""
+        return int(chars * self.CREDITS_PER_CHAR.get(model, 1.0))
 
     def _estimate_duration(self, text: str) -> float:
         """Estimate audio duration from text length.
@@ -220,16 +485,135 @@ class ElevenLabsClient:
         Returns:
             Estimated duration in seconds
         """
-        chars = len(text)
-        return (chars / 750) * 60
+        return len(text) * _SECONDS_PER_CHAR
+
+    @staticmethod
+    def _duration_for_chars(chars: int) -> float:
+        """Estimate audio duration for chars characters of text."""
+        return chars * _SECONDS_PER_CHAR
+
+    async def _api_error(self, response: aiohttp.ClientResponse) -> "ElevenLabsAPIError":
+        """Build an ElevenLabsAPIError from a failed response."""
+        error_text = await response.text()
+        return ElevenLabsAPIError(response.status, error_text, _parse_retry_after(response))
+
+    async def _backoff_or_raise(self, error: "ElevenLabsAPIError", attempt: int):
+        """Sleep before retrying a transient error, or raise it."""
+        if error.status_code not in _RETRY_STATUSES or attempt >= self.max_retries:
+            logger.error(f"ElevenLabs API error: {error.status_code} - {error.message}")
+            raise error
+
+        delay = retry_delay(error, attempt)
+        logger.warning(
+            f"ElevenLabs API error {error.detail_status or error.status_code}, "
+            f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+        )
+        await asyncio.sleep(delay)
+
+    async def _post_audio(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        params: Dict[str, Any],
+    ) -> Tuple[bytes, float]:
+        """POST a synthesis request, retrying transient errors.
 
-    async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_request_interval:
-            await asyncio.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        Returns:
+            (audio bytes, latency in ms of the successful attempt)
+        """
+        body = _json_dumps(payload)
+
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            start_time = time.time()
+
+            if self.transport == "httpx":
+                response = await self._get_http2_client().post(
+                    url, content=body, headers=_JSON_HEADERS, params=params
+                )
+                latency_ms = (time.time() - start_time) * 1000
+                if response.status_code == 200:
+                    self._meta_cache.pop("subscription", None)
+                    return response.content, latency_ms
+                error = ElevenLabsAPIError(
+                    response.status_code, response.text, _parse_retry_after(response)
+                )
+            else:
+                session = await self._get_session()
+                async with session.post(
+                    url, data=body, headers=_JSON_HEADERS, params=params
+                ) as response:
+                    latency_ms = (time.time() - start_time) * 1000
+                    if response.status == 200:
+                        self._meta_cache.pop("subscription", None)
+                        return await response.read(), latency_ms
+                    error = await self._api_error(response)
+
+            await self._backoff_or_raise(error, attempt)
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        url: str,
+        body: bytes,
+        params: Dict[str, Any],
+        chunk_size: int,
+        min_first_chunk_bytes: int,
+    ):
+        """POST a streaming request and yield an iterator over its audio.
+
+        Raises ElevenLabsAPIError on entry if the response is not 200.
+        """
+        if self.transport == "httpx":
+            async with self._get_http2_client().stream(
+                "POST", url, content=body, headers=_JSON_HEADERS, params=params
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise ElevenLabsAPIError(
+                        response.status_code, response.text, _parse_retry_after(response)
+                    )
+                yield _rechunk(response.aiter_bytes(), chunk_size, min_first_chunk_bytes)
+        else:
+            session = await self._get_session()
+            async with session.post(
+                url, data=body, headers=_JSON_HEADERS, params=params
+            ) as response:
+                if response.status != 200:
+                    raise await self._api_error(response)
+                yield _read_stream(response.content, chunk_size, min_first_chunk_bytes)
+
+    async def _post_audio_shared(
+        self,
+        key: str,
+        url: str,
+        payload: Dict[str, Any],
+        params: Dict[str, Any],
+    ) -> Tuple[bytes, float, bool]:
+        """POST a synthesis request, joining an identical one in flight.
+
+        The request runs as its own task so a cancelled caller does not
+        cancel it for the others waiting on it.
+
+        Returns:
+            (audio bytes, latency in ms, whether the request was joined)
+        """
+        task = self._inflight.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._post_audio(url, payload, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+
+        audio_data, latency_ms = await asyncio.shield(task)
+        return audio_data, latency_ms, joined
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished request from the in-flight map."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller went away
+            task.exception()
 
     # =========================================================================
     # TEXT-TO-SPEECH (Single Voice)
@@ -258,7 +642,7 @@ class ElevenLabsClient:
             SynthesisResult with audio data and metadata
         """
         model = model or self.default_model
-        voice_settings = voice_settings or VoiceSettings()
+        settings = voice_settings.to_dict() if voice_settings else _DEFAULT_VOICE_SETTINGS
         credits = self._calculate_credits(text, model)
         duration = self._estimate_duration(text)
 
@@ -282,34 +666,49 @@ class ElevenLabsClient:
                 is_dry_run=True,
             )
 
-        # Real API call
-        await self._rate_limit()
-        session = await self._get_session()
+        # Cached audio from an identical earlier request
+        cache_key = TTSCache.make_key(
+            "tts", voice_id, model, output_format,
+            json.dumps(settings, sort_keys=True), text,
+        )
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self.usage_stats.record_cache_hit(credits)
+                return SynthesisResult(
+                    audio_data=cached,
+                    character_count=len(text),
+                    credits_used=0,
+                    model_used=model,
+                    voice_id=voice_id,
+                    duration_estimate_s=duration,
+                    latency_ms=0.0,
+                )
 
+        # Real API call
         url = f"{self.BASE_URL}/text-to-speech/{voice_id}"
         payload = {
             "text": text,
             "model_id": model,
-            "voice_settings": voice_settings.to_dict(),
+            "voice_settings": settings,
         }
         params = {
             "output_format": output_format,
             "optimize_streaming_latency": optimize_streaming_latency,
         }
 
-        start_time = time.time()
-
-        async with session.post(url, json=payload, params=params) as response:
-            latency_ms = (time.time() - start_time) * 1000
-
-            if response.status != 200:
-                error_text = await response.text()
-                logger.error(f"ElevenLabs API error: {response.status} - {error_text}")
-                raise ElevenLabsAPIError(response.status, error_text)
-
-            audio_data = await response.read()
+        audio_data, latency_ms, joined = await self._post_audio_shared(
+            cache_key, url, payload, params
+        )
 
-        self.usage_stats.record_request(model, len(text), credits)
+        # An identical request was already in flight: no extra credits spent
+        if joined:
+            self.usage_stats.record_cache_hit(credits)
+            credits = 0
+        else:
+            self.usage_stats.record_request(model, len(text), credits)
+            if self._cache is not None:
+                self._cache.put(cache_key, audio_data)
 
         return SynthesisResult(
             audio_data=audio_data,
@@ -329,7 +728,8 @@ class ElevenLabsClient:
         model: Optional[str] = None,
         voice_settings: Optional[VoiceSettings] = None,
         optimize_streaming_latency: int = 3,
-        chunk_size: int = 1024,
+        chunk_size: int = 16384,
+        min_first_chunk_bytes: int = 4096,
     ) -> AsyncIterator[bytes]:
         """Stream speech from text for real-time playback.
 
@@ -342,12 +742,15 @@ class ElevenLabsClient:
             voice_settings: Voice configuration
             optimize_streaming_latency: 0-4, higher = lower latency
             chunk_size: Size of audio chunks to yield
+            min_first_chunk_bytes: Until this many bytes have been yielded,
+                chunks are passed on as soon as they arrive (lowest time to
+                first audio); after that they are batched to chunk_size
 
         Yields:
             Audio data chunks (bytes)
         """
         model = model or ElevenLabsModel.ELEVEN_FLASH_V2_5.value
-        voice_settings = voice_settings or VoiceSettings()
+        settings = voice_settings.to_dict() if voice_settings else _DEFAULT_VOICE_SETTINGS
         credits = self._calculate_credits(text, model)
 
         if self.log_requests:
@@ -366,27 +769,34 @@ class ElevenLabsClient:
             return
 
         # Real streaming API call
-        await self._rate_limit()
-        session = await self._get_session()
-
         url = f"{self.BASE_URL}/text-to-speech/{voice_id}/stream"
         payload = {
             "text": text,
             "model_id": model,
-            "voice_settings": voice_settings.to_dict(),
+            "voice_settings": settings,
         }
         params = {
             "output_format": "mp3_44100_128",
             "optimize_streaming_latency": optimize_streaming_latency,
         }
 
-        async with session.post(url, json=payload, params=params) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise ElevenLabsAPIError(response.status, error_text)
+        body = _json_dumps(payload)
 
-            async for chunk in response.content.iter_chunked(chunk_size):
-                yield chunk
+        # Retries are only possible before the first chunk is yielded
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+
+            try:
+                async with self._open_stream(
+                    url, body, params, chunk_size, min_first_chunk_bytes
+                ) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+                break
+            except ElevenLabsAPIError as error:
+                await self._backoff_or_raise(error, attempt)
+
+        self._meta_cache.pop("subscription", None)
 
         self.usage_stats.record_request(model, len(text), credits)
 
@@ -423,22 +833,23 @@ class ElevenLabsClient:
         model = ElevenLabsModel.ELEVEN_V3.value
 
         # Calculate total text and credits
-        total_text = " ".join(seg["text"] for seg in segments)
-        credits = self._calculate_credits(total_text, model)
-        duration = self._estimate_duration(total_text)
+        # Length of the space-joined segment texts, without building it
+        total_chars = sum(len(seg["text"]) for seg in segments) + max(0, len(segments) - 1)
+        credits = self._credits_for_chars(total_chars, model)
+        duration = self._duration_for_chars(total_chars)
 
         if self.log_requests:
             logger.info(
                 f"Dialogue request: {len(segments)} segments, "
-                f"{len(total_text)} chars, credits={credits}"
+                f"{total_chars} chars, credits={credits}"
             )
 
         # Dry run mode
         if self.dry_run:
-            self.usage_stats.record_request(model, len(total_text), credits)
+            self.usage_stats.record_request(model, total_chars, credits)
             return SynthesisResult(
                 audio_data=self._generate_mock_audio(duration),
-                character_count=len(total_text),
+                character_count=total_chars,
                 credits_used=credits,
                 model_used=model,
                 voice_id="multi",
@@ -447,39 +858,56 @@ class ElevenLabsClient:
                 is_dry_run=True,
             )
 
-        # Real API call
-        await self._rate_limit()
-        session = await self._get_session()
+        dialogue = [
+            {
+                "voice_id": seg["voice_id"],
+                "text": seg["text"],
+            }
+            for seg in segments
+        ]
 
+        # Cached audio from an identical earlier request
+        cache_key = TTSCache.make_key(
+            "dialogue", model, output_format, json.dumps(dialogue),
+        )
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self.usage_stats.record_cache_hit(credits)
+                return SynthesisResult(
+                    audio_data=cached,
+                    character_count=total_chars,
+                    credits_used=0,
+                    model_used=model,
+                    voice_id="multi",
+                    duration_estimate_s=duration,
+                    latency_ms=0.0,
+                )
+
+        # Real API call
         url = f"{self.BASE_URL}/text-to-dialogue"
         payload = {
             "model_id": model,
-            "dialogue": [
-                {
-                    "voice_id": seg["voice_id"],
-                    "text": seg["text"],
-                }
-                for seg in segments
-            ],
+            "dialogue": dialogue,
         }
         params = {"output_format": output_format}
 
-        start_time = time.time()
-
-        async with session.post(url, json=payload, params=params) as response:
-            latency_ms = (time.time() - start_time) * 1000
-
-            if response.status != 200:
-                error_text = await response.text()
-                raise ElevenLabsAPIError(response.status, error_text)
-
-            audio_data = await response.read()
+        audio_data, latency_ms, joined = await self._post_audio_shared(
+            cache_key, url, payload, params
+        )
 
-        self.usage_stats.record_request(model, len(total_text), credits)
+        # An identical request was already in flight: no extra credits spent
+        if joined:
+            self.usage_stats.record_cache_hit(credits)
+            credits = 0
+        else:
+            self.usage_stats.record_request(model, total_chars, credits)
+            if self._cache is not None:
+                self._cache.put(cache_key, audio_data)
 
         return SynthesisResult(
             audio_data=audio_data,
-            character_count=len(total_text),
+            character_count=total_chars,
             credits_used=credits,
             model_used=model,
             voice_id="multi",
@@ -492,6 +920,28 @@ class ElevenLabsClient:
     # VOICE MANAGEMENT
     # =========================================================================
 
+    async def _get_json(self, key: str, url: str) -> Any:
+        """GET a JSON resource, reusing a copy fetched within metadata_ttl."""
+        hit = self._meta_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.metadata_ttl:
+            return hit[1]
+
+        session = await self._get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise ElevenLabsAPIError(response.status, error_text)
+
+            data = await response.json()
+
+        self._meta_cache[key] = (time.monotonic(), data)
+        return data
+
+    def invalidate_voices(self):
+        """Forget cached voice lookups, e.g. after adding or editing a voice."""
+        for key in [k for k in self._meta_cache if k == "voices" or k.startswith("voice:")]:
+            del self._meta_cache[key]
+
     async def list_voices(self) -> List[Dict[str, Any]]:
         """Get available voices.
 
@@ -506,16 +956,8 @@ class ElevenLabsClient:
                 {"voice_id": "charlotte", "name": "Charlotte", "category": "premade"},
             ]
 
-        session = await self._get_session()
-        url = f"{self.BASE_URL}/voices"
-
-        async with session.get(url) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise ElevenLabsAPIError(response.status, error_text)
-
-            data = await response.json()
-            return data.get("voices", [])
+        data = await self._get_json("voices", f"{self.BASE_URL}/voices")
+        return data.get("voices", [])
 
     async def get_voice(self, voice_id: str) -> Dict[str, Any]:
         """Get metadata for a specific voice.
@@ -533,15 +975,7 @@ class ElevenLabsClient:
                 "category": "premade",
             }
 
-        session = await self._get_session()
-        url = f"{self.BASE_URL}/voices/{voice_id}"
-
-        async with session.get(url) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise ElevenLabsAPIError(response.status, error_text)
-
-            return await response.json()
+        return await self._get_json(f"voice:{voice_id}", f"{self.BASE_URL}/voices/{voice_id}")
 
     # =========================================================================
     # SUBSCRIPTION & USAGE
@@ -562,15 +996,8 @@ class ElevenLabsClient:
                 "dry_run": True,
             }
 
-        session = await self._get_session()
-        url = f"{self.BASE_URL}/user/subscription"
-
-        async with session.get(url) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise ElevenLabsAPIError(response.status, error_text)
-
-            return await response.json()
+        # Dropped whenever this client spends credits, so counts stay current
+        return await self._get_json("subscription", f"{self.BASE_URL}/user/subscription")
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics for this session.
@@ -594,6 +1021,7 @@ class ElevenLabsClient:
         model: Optional[str] = None,
         use_dialogue_api: bool = True,
         batch_size: int = 10,
+        max_concurrency: int = 5,
     ) -> List[SynthesisResult]:
         """Synthesize a complete DialogueScript.
 
@@ -605,35 +1033,36 @@ class ElevenLabsClient:
             model: Model to use (defaults to ELEVEN_V3 for dialogue)
             use_dialogue_api: Use Text-to-Dialogue (True) or individual TTS (False)
             batch_size: Segments per API call when using dialogue API
+            max_concurrency: Maximum API calls in flight at once (the token
+                bucket still bounds the request rate)
 
         Returns:
-            List of SynthesisResult for each batch/segment
+            List of SynthesisResult for each batch/segment, in script order
         """
-        results = []
         segments = script.segments
 
         if use_dialogue_api and model in (None, ElevenLabsModel.ELEVEN_V3.value):
             # Use Text-to-Dialogue API (batched)
-            for i in range(0, len(segments), batch_size):
-                batch = segments[i:i + batch_size]
-                dialogue_segments = [
+            batches = [
+                [
                     {"voice_id": seg.voice_id, "text": seg.to_tagged_text()}
-                    for seg in batch
+                    for seg in segments[i:i + batch_size]
                 ]
-                result = await self.text_to_dialogue(dialogue_segments)
-                results.append(result)
-        else:
-            # Use individual TTS calls
-            model = model or self.default_model
-            for seg in segments:
-                result = await self.text_to_speech(
-                    text=seg.to_tagged_text(),
-                    voice_id=seg.voice_id,
-                    model=model,
-                )
-                results.append(result)
+                for i in range(0, len(segments), batch_size)
+            ]
+            return await _gather_limited(self.text_to_dialogue, batches, max_concurrency)
 
-        return results
+        # Use individual TTS calls
+        model = model or self.default_model
+
+        async def synthesize_segment(seg) -> SynthesisResult:
+            return await self.text_to_speech(
+                text=seg.to_tagged_text(),
+                voice_id=seg.voice_id,
+                model=model,
+            )
+
+        return await _gather_limited(synthesize_segment, segments, max_concurrency)
 
     # =========================================================================
     # HELPERS
@@ -651,23 +1080,9 @@ class ElevenLabsClient:
         Returns:
             Mock MP3 data bytes
         """
-        # MP3 frame header for 128kbps, 44100Hz, stereo
-        # This creates a valid MP3 that players can read
-        frame_header = bytes([
-            0xFF, 0xFB,  # Sync word + MPEG Audio Layer 3
-            0x90,        # 128kbps, 44100Hz
-            0x00,        # Additional flags
-        ])
-
         # Each frame is ~418 bytes at 128kbps and represents ~26ms
         frames_needed = int((duration_s * 1000) / 26)
-        frame_data = b'\x00' * 414  # Silence
-
-        mock_audio = b''
-        for _ in range(max(1, frames_needed)):
-            mock_audio += frame_header + frame_data
-
-        return mock_audio
+        return _MOCK_MP3_FRAME * max(1, frames_needed)
 
     def estimate_cost(
         self,
@@ -689,14 +1104,7 @@ class ElevenLabsClient:
         chars = len(text)
         credits = self._calculate_credits(text, model)
 
-        # Cost per credit by plan
-        cost_per_credit = {
-            "pro": 99 / 500_000,
-            "scale": 330 / 2_000_000,
-            "business": 1320 / 11_000_000,
-        }
-
-        cost = credits * cost_per_credit.get(plan, cost_per_credit["pro"])
+        cost = credits * _COST_PER_CREDIT.get(plan, _COST_PER_CREDIT["pro"])
 
         return {
             "characters": chars,
@@ -711,11 +1119,118 @@ class ElevenLabsClient:
 class ElevenLabsAPIError(Exception):
     """Exception for ElevenLabs API errors."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
         self.status_code = status_code
         self.message = message
+        self.retry_after = retry_after  # Seconds, from the Retry-After header
         super().__init__(f"ElevenLabs API error {status_code}: {message}")
 
+    @property
+    def detail_status(self) -> Optional[str]:
+        """Error sub-type from the response body's detail.status, if any.
+
+        For 429s this distinguishes "too_many_concurrent_requests" from
+        "system_busy".
+        """
+        try:
+            detail = json.loads(self.message).get("detail")
+        except (ValueError, AttributeError):
+            return None
+        if isinstance(detail, dict):
+            return detail.get("status")
+        return None
+
+
+async def _gather_limited(func, items, limit: int) -> List[Any]:
+    """Await func(item) for every item, at most limit at a time.
+
+    Results keep the order of items. The first failure cancels the
+    remaining calls and is re-raised.
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def run(item):
+        async with sem:
+            return await func(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _read_stream(
+    content: aiohttp.StreamReader,
+    chunk_size: int,
+    min_first_chunk_bytes: int,
+) -> AsyncIterator[bytes]:
+    """Yield an aiohttp body as it arrives, then in chunk_size pieces."""
+    streamed = 0
+    while streamed < min_first_chunk_bytes:
+        chunk = await content.readany()
+        if not chunk:
+            return
+        streamed += len(chunk)
+        yield chunk
+
+    async for chunk in content.iter_chunked(chunk_size):
+        yield chunk
+
+
+async def _rechunk(
+    chunks: AsyncIterator[bytes],
+    chunk_size: int,
+    min_first_chunk_bytes: int,
+) -> AsyncIterator[bytes]:
+    """Pass chunks through as they arrive, then regroup to chunk_size.
+
+    The httpx counterpart of _read_stream: its byte iterator can only be
+    consumed once, so the switch to fixed-size chunks happens here.
+    """
+    streamed = 0
+    buffer = bytearray()
+    async for chunk in chunks:
+        if streamed < min_first_chunk_bytes:
+            streamed += len(chunk)
+            yield chunk
+            continue
+
+        buffer += chunk
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _parse_retry_after(response: Any) -> Optional[float]:
+    """Read a Retry-After header given in seconds."""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def retry_delay(error: ElevenLabsAPIError, attempt: int) -> float:
+    """Seconds to wait before retrying a failed request.
+
+    A Retry-After header takes precedence. "too_many_concurrent_requests"
+    is retried immediately (the token bucket does the pacing); anything
+    else backs off exponentially with jitter. Either way the wait is
+    capped at 30s.
+    """
+    if error.retry_after is not None:
+        return min(error.retry_after, _MAX_RETRY_DELAY_S)
+    if error.detail_status == "too_many_concurrent_requests":
+        return 0.0
+    return min(2 ** attempt + random.random() * 0.5, _MAX_RETRY_DELAY_S)
+
 
 # =============================================================================
 # CONVENIENCE FUNCTIONS
@@ -724,12 +1239,14 @@ class ElevenLabsAPIError(Exception):
 def create_client(
     api_key: Optional[str] = None,
     dry_run: Optional[bool] = None,
+    plan: Optional[str] = None,
 ) -> ElevenLabsClient:
     """Create an ElevenLabs client with sensible defaults.
 
     Args:
         api_key: API key (or use ELEVENLABS_API_KEY env var)
         dry_run: Force dry-run mode (auto-detected if no API key)
+        plan: ElevenLabs plan, to pace requests to its rate limit
 
     Returns:
         Configured ElevenLabsClient
@@ -741,6 +1258,7 @@ def create_client(
     return ElevenLabsClient(
         api_key=api_key,
         dry_run=dry_run,
+        plan=plan,
     )
 
 
@@ -761,9 +1279,6 @@ async def quick_synthesize(
     Returns:
         Audio bytes
     """
-    client = create_client(api_key=api_key)
-    try:
+    async with create_client(api_key=api_key) as client:
         result = await client.text_to_speech(text, voice_id, model)
         return result.audio_data
-    finally:
-        await client.close()
@@ -0,0 +1,372 @@
+"""Tests for audio assembler mixing and ducking."""
+
+import asyncio
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from src.traitorsim.voice.models import DialogueScript, DialogueSegment, SegmentType
+from src.traitorsim.voice.audio_assembler import (
+    AudioTimeline,
+    EpisodeAudioAssembler,
+    MusicLibrary,
+    MusicMood,
+    SidechainCompressor,
+    SidechainConfig,
+    _lookahead_max,
+    _peak_normalize,
+)
+
+
+def _rms(audio: AudioSegment) -> float:
+    """Compute RMS of an AudioSegment's raw samples."""
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
+    return float(np.sqrt(np.mean(samples ** 2)))
+
+
+@pytest.fixture
+def music():
+    """Create a 3 second stereo tone to stand in for a music bed."""
+    return Sine(440).to_audio_segment(duration=3000).set_channels(2) - 6
+
+
+class TestApplyDucking:
+    """Tests for legacy fixed-gain ducking."""
+
+    def test_ducks_only_inside_voice_region(self, music):
+        """Test audio is attenuated during voice and untouched elsewhere."""
+        timeline = AudioTimeline()
+        ducked = timeline._apply_ducking(music, 0, [(1000, 2000)], duck_db=-12.0, fade_ms=100)
+
+        assert len(ducked) == len(music)
+        assert ducked.channels == music.channels
+        assert ducked.frame_rate == music.frame_rate
+
+        ratio = _rms(ducked[1100:1900]) / _rms(music[1100:1900])
+        assert ratio == pytest.approx(10 ** (-12 / 20), rel=0.01)
+        assert _rms(ducked[:800]) == pytest.approx(_rms(music[:800]), rel=0.01)
+        assert _rms(ducked[2200:]) == pytest.approx(_rms(music[2200:]), rel=0.01)
+
+    def test_region_offset_by_track_start(self, music):
+        """Test voice regions are interpreted in timeline time."""
+        timeline = AudioTimeline()
+        ducked = timeline._apply_ducking(music, 5000, [(6000, 7000)], duck_db=-12.0, fade_ms=0)
+
+        assert _rms(ducked[1000:2000]) < _rms(music[1000:2000]) * 0.3
+        assert _rms(ducked[:1000]) == pytest.approx(_rms(music[:1000]), rel=0.01)
+
+    def test_non_overlapping_region_is_noop(self, music):
+        """Test regions outside the track leave audio unchanged."""
+        timeline = AudioTimeline()
+        ducked = timeline._apply_ducking(music, 0, [(4000, 5000)])
+
+        assert ducked.raw_data == music.raw_data
+
+
+class TestSidechainCompressor:
+    """Tests for the sidechain compressor DSP path."""
+
+    def test_lookahead_ducks_before_trigger_onset(self):
+        """Test gain reduction starts ahead of the trigger, without delaying the target."""
+        sample_rate = 8000
+        trigger = np.zeros(sample_rate, dtype=np.float32)
+        trigger[4000:] = 0.8
+        target = np.full(sample_rate, 0.5, dtype=np.float32)
+
+        compressor = SidechainCompressor(SidechainConfig(attack_ms=0.5, lookahead_ms=20.0))
+        result = compressor.process(trigger, target, sample_rate)
+
+        assert len(result) == len(target)
+        assert result[0] == pytest.approx(0.5, rel=1e-3)
+        assert result[3990] < 0.5 * 0.9
+
+    @pytest.mark.parametrize("window", [1, 3, 64, 500])
+    def test_lookahead_max_matches_reference(self, window):
+        """Test the running max covers exactly [i, i + window)."""
+        signal = np.random.default_rng(0).standard_normal(300)
+        expected = np.array([signal[i:i + window].max() for i in range(len(signal))])
+
+        np.testing.assert_allclose(_lookahead_max(signal, window), expected)
+
+
+class TestMixDucking:
+    """Tests for ducking applied during AudioTimeline.mix()."""
+
+    def test_mix_matches_per_track_ducking(self, music):
+        """Test the shared envelope ducks tracks like per-track ducking does."""
+        timeline = AudioTimeline()
+        segment = DialogueSegment(
+            segment_type=SegmentType.DIALOGUE,
+            speaker_id="player_1",
+            text="Test speech",
+            voice_id="test_voice",
+        )
+        timeline.add_voice_segment(segment, AudioSegment.silent(duration=1000), start_ms=2000)
+        timeline.add_track("music_a", music, start_ms=0, duck_under_voice=True)
+        timeline.add_track("music_b", music, start_ms=1500, duck_under_voice=True)
+
+        mixed = timeline.mix(normalize_output=False)
+
+        regions = timeline._calculate_voice_regions()
+        expected = AudioSegment.silent(duration=timeline.duration_ms)
+        expected = expected.overlay(timeline._apply_ducking(music, 0, regions), position=0)
+        expected = expected.overlay(timeline._apply_ducking(music, 1500, regions), position=1500)
+
+        assert len(mixed) == len(expected)
+        assert _rms(mixed[2100:2900]) == pytest.approx(_rms(expected[2100:2900]), rel=0.01)
+        assert _rms(mixed[:1500]) == pytest.approx(_rms(expected[:1500]), rel=0.01)
+
+
+class TestMixToFile:
+    """Tests for streaming the mix to ffmpeg."""
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_matches_in_memory_mix(self, music, tmp_path):
+        """Test the streamed WAV has the same samples as mix()."""
+        timeline = AudioTimeline()
+        segment = DialogueSegment(speaker_id="narrator", voice_id="test_voice", text="Line")
+        timeline.add_voice_segment(segment, Sine(300).to_audio_segment(duration=1000), start_ms=500)
+        timeline.add_track("music_a", music, start_ms=0, duck_under_voice=True)
+
+        path = timeline.mix_to_file(tmp_path / "mix.wav", format="wav", chunk_ms=250)
+
+        assert AudioSegment.from_wav(path).raw_data == timeline.mix().raw_data
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_failed_write_reaps_ffmpeg(self, music, tmp_path, monkeypatch):
+        """Test ffmpeg is killed and waited on when the write loop raises."""
+        timeline = AudioTimeline()
+        timeline.add_track("music_a", music, start_ms=0)
+        processes = []
+        popen = subprocess.Popen
+        clip = np.clip
+
+        def spy_popen(*args, **kwargs):
+            processes.append(popen(*args, **kwargs))
+            return processes[-1]
+
+        def failing_clip(*args, **kwargs):
+            if processes:
+                raise RuntimeError("boom")
+            return clip(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "Popen", spy_popen)
+        monkeypatch.setattr(np, "clip", failing_clip)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            timeline.mix_to_file(tmp_path / "mix.wav", format="wav")
+
+        assert processes[0].stdin.closed
+        assert processes[0].returncode is not None
+
+
+class TestGenerateChapters:
+    """Tests for AudioTimeline.generate_chapters()."""
+
+    def test_phase_and_event_chapters(self):
+        """Test one chapter per phase run plus event chapters."""
+        timeline = AudioTimeline()
+        layout = [
+            ("breakfast", None),
+            ("breakfast", "MURDER"),
+            ("breakfast", None),
+            ("roundtable", None),
+            ("roundtable", "BANISHMENT"),
+        ]
+        for i, (phase, event_type) in enumerate(layout):
+            segment = DialogueSegment(
+                speaker_id="narrator",
+                voice_id="test_voice",
+                text="Line",
+                phase=phase,
+                event_type=event_type,
+            )
+            timeline.add_voice_segment(segment, AudioSegment.silent(duration=20000), start_ms=i * 20000)
+
+        chapters = timeline.generate_chapters(min_duration_ms=0)
+
+        assert [c.title for c in chapters] == [
+            "Breakfast",
+            "Murder Revealed",
+            "Round Table",
+            "Banishment",
+        ]
+        assert [c.start_ms for c in chapters] == [0, 20000, 60000, 80000]
+        assert chapters[-1].end_ms == timeline.duration_ms
+
+
+class TestVoiceRegions:
+    """Tests for AudioTimeline._calculate_voice_regions()."""
+
+    @staticmethod
+    def _segment():
+        return DialogueSegment(speaker_id="narrator", voice_id="test_voice", text="Line")
+
+    def test_merges_overlapping_regions(self):
+        """Test overlapping and touching voice regions are merged."""
+        timeline = AudioTimeline()
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=1000), start_ms=0)
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=1000), start_ms=500)
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=500), start_ms=3000)
+
+        assert timeline._calculate_voice_regions() == [(0, 1500), (3000, 3500)]
+
+    def test_out_of_order_segments_are_sorted(self):
+        """Test explicit start times that go backwards are still merged correctly."""
+        timeline = AudioTimeline()
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=500), start_ms=3000)
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=1000), start_ms=0)
+        timeline.add_voice_segment(self._segment(), AudioSegment.silent(duration=1000), start_ms=500)
+
+        assert timeline._calculate_voice_regions() == [(0, 1500), (3000, 3500)]
+
+
+class TestPeakNormalize:
+    """Tests for the NumPy peak normalizer used by mix()."""
+
+    def test_matches_pydub_normalize(self, music):
+        """Test output matches pydub.effects.normalize to within one LSB."""
+        from pydub.effects import normalize
+
+        quiet = music - 20
+        expected = np.array(normalize(quiet).get_array_of_samples(), dtype=np.int64)
+        actual = np.array(_peak_normalize(quiet).get_array_of_samples(), dtype=np.int64)
+
+        assert np.max(np.abs(expected - actual)) <= 1
+
+    def test_silence_is_returned_unchanged(self):
+        """Test silent audio is passed through."""
+        silence = AudioSegment.silent(duration=100)
+
+        assert _peak_normalize(silence) is silence
+
+
+class TestApplySidechainCompression:
+    """Tests for AudioTimeline.apply_sidechain_compression()."""
+
+    def test_compresses_every_matching_track(self, music):
+        """Test all matching music tracks are ducked and non-matching tracks untouched."""
+        timeline = AudioTimeline()
+        segment = DialogueSegment(speaker_id="narrator", voice_id="test_voice", text="Line")
+        voice = Sine(300).to_audio_segment(duration=1000) - 3
+        timeline.add_voice_segment(segment, voice, start_ms=1000)
+        tracks = [
+            timeline.add_track(f"music_{i}", music, start_ms=0, duck_under_voice=True)
+            for i in range(3)
+        ]
+        sfx = timeline.add_track("sfx_gavel", music, start_ms=0)
+
+        timeline.apply_sidechain_compression(trigger_tracks="voice", duck_tracks="music")
+
+        for track in tracks:
+            assert not track.duck_under_voice
+            assert _rms(track.audio[1200:1800]) < _rms(track.audio[:800]) * 0.5
+        assert sfx.audio is music
+
+    def test_no_matching_duck_tracks_is_noop(self, music):
+        """Test nothing changes when no track matches the duck patterns."""
+        timeline = AudioTimeline()
+        segment = DialogueSegment(speaker_id="narrator", voice_id="test_voice", text="Line")
+        timeline.add_voice_segment(segment, Sine(300).to_audio_segment(duration=1000), start_ms=0)
+        track = timeline.add_track("sfx_gavel", music, start_ms=0)
+
+        timeline.apply_sidechain_compression(trigger_tracks="voice", duck_tracks="music")
+
+        assert track.audio is music
+
+
+class TestMusicLibrary:
+    """Tests for MusicLibrary asset reuse."""
+
+    def test_mood_tracks_are_memoized(self):
+        """Test a mood's source track is loaded once and fitted per call."""
+        library = MusicLibrary()
+
+        track = library.get_for_mood(MusicMood.TENSION)
+
+        assert library.get_for_mood(MusicMood.TENSION) is track
+        assert len(library.get_for_mood(MusicMood.TENSION, 5000)) == 5000
+        assert len(library.get_for_mood(MusicMood.TENSION, 3000)) == 3000
+        assert list(library._mood_tracks) == [MusicMood.TENSION]
+
+
+class TestAddVoiceSegments:
+    """Tests for EpisodeAudioAssembler._add_voice_segments()."""
+
+    def test_concurrent_synthesis_keeps_script_order(self):
+        """Test segments are placed in script order with bounded concurrency."""
+        assembler = EpisodeAudioAssembler(
+            elevenlabs_client=object(), tts_concurrency=2,
+        )
+        script = DialogueScript(segments=[
+            DialogueSegment(speaker_id="narrator", voice_id="test_voice", text=f"Line {i}")
+            for i in range(5)
+        ])
+        in_flight = []
+        peak = []
+
+        async def fake_synthesize(segment):
+            in_flight.append(segment)
+            peak.append(len(in_flight))
+            index = int(segment.text.split()[-1])
+            await asyncio.sleep(0.01 * (5 - index))
+            in_flight.remove(segment)
+            if index == 3:
+                raise RuntimeError("boom")
+            return AudioSegment.silent(duration=100 * (index + 1))
+
+        assembler._synthesize_segment = fake_synthesize
+        timeline = AudioTimeline()
+        asyncio.run(assembler._add_voice_segments(timeline, script))
+
+        assert max(peak) == 2
+        assert [v.segment for v in timeline.voice_segments] == script.segments
+        assert [v.duration_ms for v in timeline.voice_segments] == [100, 200, 300, 500, 500]
+        starts = [v.start_ms for v in timeline.voice_segments]
+        assert starts[0] == assembler.intro_music_ms
+        assert starts[1] == starts[0] + 100 + assembler.segment_gap_ms
+
+    def test_assembler_is_reusable_across_event_loops(self):
+        """Test a second asyncio.run() still synthesizes every segment."""
+        assembler = EpisodeAudioAssembler(elevenlabs_client=object(), tts_concurrency=1)
+        script = DialogueScript(segments=[
+            DialogueSegment(speaker_id="narrator", voice_id="test_voice", text=f"Line {i}")
+            for i in range(4)
+        ])
+
+        async def fake_synthesize(segment):
+            await asyncio.sleep(0.001)
+            return AudioSegment.silent(duration=100)
+
+        assembler._synthesize_segment = fake_synthesize
+        for _ in range(2):
+            timeline = AudioTimeline()
+            asyncio.run(assembler._add_voice_segments(timeline, script))
+
+            assert [v.duration_ms for v in timeline.voice_segments] == [100, 100, 100, 100]
+
+    def test_duplicate_segments_are_synthesized_once(self):
+        """Test repeated (voice, text) segments share one synthesis call."""
+        assembler = EpisodeAudioAssembler(elevenlabs_client=object())
+        script = DialogueScript(segments=[
+            DialogueSegment(speaker_id="p1", voice_id="voice_a", text="I vote for Bob"),
+            DialogueSegment(speaker_id="p2", voice_id="voice_b", text="I vote for Bob"),
+            DialogueSegment(speaker_id="p1", voice_id="voice_a", text="I vote for Bob"),
+        ])
+        calls = []
+
+        async def fake_synthesize(segment):
+            calls.append(segment.voice_id)
+            return AudioSegment.silent(duration=100)
+
+        assembler._synthesize_segment = fake_synthesize
+        timeline = AudioTimeline()
+        asyncio.run(assembler._add_voice_segments(timeline, script))
+
+        assert sorted(calls) == ["voice_a", "voice_b"]
+        assert [v.segment for v in timeline.voice_segments] == script.segments
+        assert timeline.voice_segments[0].audio is timeline.voice_segments[2].audio
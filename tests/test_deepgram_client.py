@@ -0,0 +1,444 @@
+"""Tests for Deepgram STT client parsing and VAD."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from types import SimpleNamespace
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.traitorsim.voice import deepgram_client
+from src.traitorsim.voice.deepgram_client import (
+    DeepgramAPIError,
+    DeepgramClient,
+    DeepgramConfig,
+    TranscriptResult,
+    VADResult,
+    WordInfo,
+    WordTimings,
+)
+
+
+class FakeWebSocket:
+    """Async-iterable stand-in for an aiohttp WebSocket response."""
+
+    def __init__(self, frames=(), hold_open=False):
+        self._messages = [
+            SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data=json.dumps(frame))
+            for frame in frames
+        ]
+        self.hold_open = hold_open
+        self.closed = False
+        self.sent = []
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def send_str(self, data):
+        self.sent.append(data)
+
+    def exception(self):
+        return RuntimeError("connection reset")
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self._messages:
+            yield message
+        if self.hold_open:
+            # Server never closes; only cancellation ends the stream
+            await asyncio.Event().wait()
+
+
+class FakeSession:
+    """Minimal aiohttp session whose ws_connect() yields a FakeWebSocket."""
+
+    closed = False
+
+    def __init__(self, ws):
+        self.ws = ws
+
+    @asynccontextmanager
+    async def ws_connect(self, url):
+        yield self.ws
+
+
+def _frame(transcript, words=(), is_final=False, speech_final=False):
+    return {
+        "channel": {
+            "alternatives": [{
+                "transcript": transcript,
+                "confidence": 0.9,
+                "words": [
+                    {"word": w, "start": i * 0.5, "end": i * 0.5 + 0.4, "confidence": 0.9}
+                    for i, w in enumerate(words)
+                ],
+            }],
+        },
+        "start": 2.0,
+        "duration": 0.5 * len(words),
+        "is_final": is_final,
+        "speech_final": speech_final,
+    }
+
+
+def _receive(frames, **client_kwargs):
+    client = DeepgramClient(dry_run=True, **client_kwargs)
+
+    async def collect():
+        ws = FakeWebSocket(frames)
+        return [r async for r in client._receive_transcripts(ws, DeepgramConfig())]
+
+    return client, asyncio.run(collect())
+
+
+class TestReceiveTranscripts:
+    """Tests for DeepgramClient._receive_transcripts()."""
+
+    def test_parses_final_and_interim_frames(self):
+        """Test final and interim frames become TranscriptResults and count in stats."""
+        client, results = _receive([
+            _frame("I think", ["I", "think"]),
+            _frame("I think they lied", ["I", "think", "they", "lied"], speech_final=True),
+        ])
+
+        assert [r.text for r in results] == ["I think", "I think they lied"]
+        assert [r.is_final for r in results] == [False, True]
+        assert results[1].end_time == 1.9
+        assert [w.word for w in results[1].words] == ["I", "think", "they", "lied"]
+        # Interim frames skip word parsing and use the message time range
+        assert results[0].words == []
+        assert (results[0].start_time, results[0].end_time) == (2.0, 3.0)
+        assert client.usage_stats.final_transcripts == 1
+        assert client.usage_stats.interim_transcripts == 1
+
+    def test_tracks_committed_end_across_frames(self):
+        """Test delta_text drops words already covered by an earlier final."""
+        # Interim re-covers audio from 0.5s, overlapping the final (ends 0.9s)
+        interim = _frame("lied again", ["lied", "again"])
+        interim["start"] = 0.5
+        for word, start in zip(interim["channel"]["alternatives"][0]["words"], (0.5, 1.0)):
+            word["start"] = start
+
+        _, results = _receive([
+            _frame("They lied", ["They", "lied"], is_final=True),
+            interim,
+        ])
+
+        assert results[0].delta_text == "They lied"
+        assert results[1].text == "lied again"
+        assert results[1].delta_text == "again"
+
+    def test_skips_non_transcript_and_empty_frames(self):
+        """Test metadata, empty and blank frames yield no results."""
+        _, results = _receive([
+            {"type": "Metadata", "request_id": "abc"},
+            {"type": "UtteranceEnd", "channel": [0, 1], "last_word_end": 1.5},
+            {"channel": {"alternatives": []}},
+            _frame("   "),
+            _frame("Vote", ["Vote"], is_final=True),
+        ])
+
+        assert [r.text for r in results] == ["Vote"]
+
+    def test_stats_can_be_disabled(self):
+        """Test enable_stats=False leaves usage stats untouched."""
+        client, results = _receive([_frame("Vote", ["Vote"], is_final=True)], enable_stats=False)
+
+        assert len(results) == 1
+        assert client.usage_stats.total_requests == 0
+
+
+def _send(chunks, config, delay=0.0):
+    client = DeepgramClient(dry_run=True)
+    ws = FakeWebSocket()
+
+    async def audio():
+        for chunk in chunks:
+            if delay:
+                await asyncio.sleep(delay)
+            yield chunk
+
+    asyncio.run(client._send_audio(ws, audio(), config))
+    return ws.sent
+
+
+class TestSendAudio:
+    """Tests for DeepgramClient._send_audio() frame coalescing."""
+
+    def test_coalesces_small_chunks(self):
+        """Test small audio chunks are merged into frames near the size limit."""
+        chunks = [bytes([i]) * 640 for i in range(20)]
+
+        sent = _send(chunks, DeepgramConfig(max_send_chunk_bytes=4096))
+
+        assert [len(frame) for frame in sent[:-1]] == [4480, 4480, 3840]
+        assert b"".join(sent[:-1]) == b"".join(chunks)
+        assert json.loads(sent[-1]) == {"type": "CloseStream"}
+
+    def test_flushes_partial_buffer_after_interval(self):
+        """Test a partial buffer is sent once the flush interval passes."""
+        chunks = [b"\x01" * 640, b"\x02" * 640]
+
+        sent = _send(chunks, DeepgramConfig(max_send_chunk_bytes=8192), delay=0.1)
+
+        assert sent[:-1] == chunks
+
+    def test_coalescing_can_be_disabled(self):
+        """Test max_send_chunk_bytes=0 sends each chunk as it arrives."""
+        chunks = [b"\x01" * 640, b"\x02" * 640]
+
+        sent = _send(chunks, DeepgramConfig(max_send_chunk_bytes=0))
+
+        assert sent[:-1] == chunks
+
+
+def _stream(ws, audio_chunks=None, limit=None):
+    client = DeepgramClient(dry_run=True)
+    client._session = FakeSession(ws)
+
+    async def audio():
+        if isinstance(audio_chunks, Exception):
+            raise audio_chunks
+        if audio_chunks is None:
+            while True:
+                await asyncio.sleep(0.01)
+                yield b"\x00" * 640
+        for chunk in audio_chunks:
+            yield chunk
+
+    async def collect():
+        results = []
+        stream = client._stream_transcription_internal(audio(), DeepgramConfig())
+        async for result in stream:
+            results.append(result)
+            if limit and len(results) >= limit:
+                break
+        await stream.aclose()
+        return results
+
+    return asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+
+class TestStreamTranscription:
+    """Tests for DeepgramClient._stream_transcription_internal()."""
+
+    def test_yields_results_until_server_closes(self):
+        """Test results are yielded until the server closes the socket."""
+        ws = FakeWebSocket([
+            _frame("Hello", ["Hello"], is_final=True),
+            _frame("Goodbye", ["Goodbye"], is_final=True),
+        ])
+
+        results = _stream(ws, audio_chunks=[b"\x00" * 640])
+
+        assert [r.text for r in results] == ["Hello", "Goodbye"]
+
+    def test_consumer_can_stop_early(self):
+        """Test breaking out of the stream shuts it down cleanly."""
+        ws = FakeWebSocket([_frame(f"t{i}", [f"t{i}"], is_final=True) for i in range(100)])
+
+        results = _stream(ws, limit=1)
+
+        assert [r.text for r in results] == ["t0"]
+
+    def test_audio_source_error_ends_stream(self):
+        """Test an error from the audio source is raised to the consumer."""
+        ws = FakeWebSocket([_frame("Hello", ["Hello"], is_final=True)], hold_open=True)
+
+        with pytest.raises(OSError, match="mic unplugged"):
+            _stream(ws, audio_chunks=OSError("mic unplugged"))
+
+    def test_websocket_error_is_not_wrapped(self):
+        """Test a websocket error frame raises DeepgramAPIError."""
+        ws = FakeWebSocket([_frame("Hello", ["Hello"], is_final=True)])
+        ws._messages.append(SimpleNamespace(type=aiohttp.WSMsgType.ERROR, data=None))
+
+        with pytest.raises(DeepgramAPIError):
+            _stream(ws)
+
+
+FRAME_PARSERS = [deepgram_client._parse_transcript_json]
+if deepgram_client.HAS_MSGSPEC:
+    FRAME_PARSERS.append(deepgram_client._parse_transcript_msgspec)
+
+
+@pytest.mark.parametrize("parse", FRAME_PARSERS, ids=lambda f: f.__name__)
+class TestParseTranscriptFrame:
+    """Both frame parsers must agree on every Deepgram message shape."""
+
+    def test_final_frame(self, parse):
+        """Test a final frame matches TranscriptResult.from_alternative()."""
+        frame = _frame("They lied", ["They", "lied"], is_final=True)
+        frame["channel"]["detected_language"] = "en"
+
+        result = parse(json.dumps(frame))
+
+        assert result == replace(
+            TranscriptResult.from_alternative(frame["channel"]["alternatives"][0], True, "en"),
+            delta_text="They lied",
+        )
+
+    def test_long_final_frame(self, parse):
+        """Test a long final frame stores its words as WordTimings."""
+        words = [f"w{i}" for i in range(100)]
+        result = parse(json.dumps(_frame(" ".join(words), words, speech_final=True)))
+
+        assert isinstance(result.words, WordTimings)
+        assert [w.word for w in result.words] == words
+        assert result.end_time == 99 * 0.5 + 0.4
+
+    def test_interim_frame(self, parse):
+        """Test an interim frame skips words and uses the message time range."""
+        result = parse(json.dumps(_frame("They", ["They"])).encode())
+
+        assert (result.is_final, result.words) == (False, [])
+        assert (result.start_time, result.end_time) == (2.0, 2.5)
+
+    def test_delta_text_skips_committed_words(self, parse):
+        """Test delta_text starts after committed_end."""
+        frame = _frame("a b c d e f g h", list("abcdefgh"))
+        frame["start"] = 0.0
+        frame["channel"]["alternatives"][0]["words"][6]["punctuated_word"] = "G,"
+
+        overlapping = parse(json.dumps(frame), committed_end=3.0)
+        fresh = parse(json.dumps(frame), committed_end=0.0)
+
+        assert overlapping.text == fresh.text == "a b c d e f g h"
+        assert overlapping.delta_text == "G, h"
+        assert fresh.delta_text == fresh.text
+
+    def test_non_transcript_frames(self, parse):
+        """Test non-transcript and empty frames parse to None."""
+        frames = [
+            {"type": "Metadata", "request_id": "abc"},
+            {"type": "UtteranceEnd", "channel": [0], "last_word_end": 1.5},
+            {"type": "SpeechStarted", "channel": [0], "timestamp": 0.2},
+            {"channel": {"alternatives": []}},
+            _frame("  "),
+        ]
+
+        assert [parse(json.dumps(f)) for f in frames] == [None] * len(frames)
+
+
+class TestSharedSession:
+    """Tests for DeepgramClient(use_shared_session=True)."""
+
+    def test_shared_session_closes_with_last_client(self):
+        """Test the shared session stays open until its last client closes."""
+        async def run():
+            a = DeepgramClient(api_key="key", use_shared_session=True)
+            b = DeepgramClient(api_key="key", use_shared_session=True)
+            solo = DeepgramClient(api_key="key")
+
+            session = await a._get_session()
+            assert await b._get_session() is session
+            assert await solo._get_session() is not session
+
+            await a.close()
+            await a.close()  # Repeated close must not release b's hold
+            assert not session.closed
+
+            await b.close()
+            await solo.close()
+            assert session.closed
+            assert not DeepgramClient._SHARED_SESSIONS
+
+        asyncio.run(run())
+
+
+class TestTranscribeAudio:
+    """Tests for DeepgramClient.transcribe_audio() uploads."""
+
+    def _transcribe(self, audio):
+        received = {}
+
+        async def listen(request):
+            received["chunked"] = request.headers.get("Transfer-Encoding") == "chunked"
+            received["body"] = await request.read()
+            return web.json_response({"results": {"channels": [
+                {"alternatives": [{"transcript": "ok", "confidence": 1.0, "words": []}]}
+            ]}})
+
+        async def run():
+            app = web.Application(client_max_size=4 * 1024 * 1024)
+            app.router.add_post("/v1/listen", listen)
+            async with TestServer(app) as server:
+                client = DeepgramClient(api_key="key", log_requests=False)
+                client.REST_URL = str(server.make_url("/v1/listen"))
+                try:
+                    return await client.transcribe_audio(audio)
+                finally:
+                    await client.close()
+
+        return asyncio.run(run()), received
+
+    def test_small_audio_sent_in_one_body(self):
+        """Test short audio is uploaded as a single request body."""
+        audio = bytes(range(256)) * 64
+
+        result, received = self._transcribe(audio)
+
+        assert result.text == "ok"
+        assert not received["chunked"]
+        assert received["body"] == audio
+
+    def test_long_audio_streamed_chunked(self):
+        """Test long audio is uploaded with chunked transfer encoding."""
+        audio = np.arange(800_000, dtype=np.int16).tobytes()
+
+        result, received = self._transcribe(audio)
+
+        assert result.text == "ok"
+        assert received["chunked"]
+        assert received["body"] == audio
+
+
+class TestTranscriptResult:
+    """Tests for TranscriptResult.from_deepgram()."""
+
+    def test_long_transcript_uses_word_timings(self):
+        """Test long transcripts store their words as WordTimings."""
+        words_data = [
+            {"word": f"w{i}", "start": i * 0.3, "end": i * 0.3 + 0.25,
+             "confidence": 0.9, "speaker": i % 2}
+            for i in range(200)
+        ]
+        channel = {"alternatives": [{"transcript": "...", "words": words_data}]}
+
+        result = TranscriptResult.from_deepgram(channel)
+
+        assert isinstance(result.words, WordTimings)
+        assert len(result.words) == 200
+        assert result.words[10] == WordInfo.from_deepgram(words_data[10])
+        assert [w.word for w in result.words[-2:]] == ["w198", "w199"]
+        assert result.end_time == words_data[-1]["end"]
+
+
+class TestVADResult:
+    """Tests for energy-based VADResult.from_audio()."""
+
+    def test_energy_matches_float_rms(self):
+        """Test energy matches an RMS computed in floating point."""
+        samples = (np.sin(np.linspace(0, 200, 16000)) * 8000).astype(np.int16)
+        expected = np.sqrt(np.mean((samples / 32768.0) ** 2))
+
+        result = VADResult.from_audio(samples.tobytes())
+
+        assert np.isclose(result.energy, expected, rtol=1e-5)
+        assert result.is_speech
+        assert result.duration == 1.0
+
+    def test_silence_and_empty_input(self):
+        """Test silence and empty input are not speech and have zero energy."""
+        silent = VADResult.from_audio(np.zeros(1600, dtype=np.int16).tobytes())
+        empty = VADResult.from_audio(b"")
+
+        assert not silent.is_speech and silent.energy == 0.0
+        assert not empty.is_speech and empty.energy == 0.0
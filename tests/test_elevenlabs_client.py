@@ -0,0 +1,408 @@
+"""Tests for ElevenLabs TTS client helpers."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.traitorsim.voice.elevenlabs_client import (
+    ElevenLabsAPIError,
+    ElevenLabsClient,
+    TokenBucket,
+    TTSCache,
+    VoiceSettings,
+    _rechunk,
+    retry_delay,
+)
+from src.traitorsim.voice.models import DialogueScript, DialogueSegment
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket request rate limiter."""
+
+    def test_burst_then_refill_rate(self):
+        """Test a full bucket allows a burst, then paces at the refill rate."""
+        async def run():
+            bucket = TokenBucket(capacity=3, refill_per_s=20.0)
+            started = time.monotonic()
+            stamps = []
+            for _ in range(5):
+                await bucket.acquire()
+                stamps.append(time.monotonic() - started)
+            return stamps
+
+        stamps = asyncio.run(run())
+
+        # Three requests go out at once, then one every 1/rate seconds
+        assert stamps[2] < 0.04
+        assert stamps[3] >= 0.045
+        assert stamps[4] - stamps[3] >= 0.045
+        assert stamps[4] < 0.5
+
+    def test_concurrent_waiters_share_the_budget(self):
+        """Test concurrent acquirers draw from one shared budget."""
+        async def run():
+            bucket = TokenBucket(capacity=2, refill_per_s=50.0)
+            started = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+            return time.monotonic() - started
+
+        # 2 free + 4 refilled at 50/s
+        assert 0.075 <= asyncio.run(run()) < 0.5
+
+    def test_client_paces_to_plan_limits(self):
+        """Test a plan sets the client's bucket capacity and rate."""
+        client = ElevenLabsClient(api_key="key", plan="scale")
+
+        assert (client._bucket.capacity, client._bucket.refill_per_s) == (15, 30.0)
+
+
+class SlowClient(ElevenLabsClient):
+    """Dry-run client whose TTS calls take time and track concurrency."""
+
+    def __init__(self, fail_on=None):
+        super().__init__(dry_run=True, log_requests=False)
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+
+    async def text_to_speech(self, text, voice_id, model=None, **kwargs):
+        self.started.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if text == self.fail_on:
+                raise RuntimeError(text)
+            return await super().text_to_speech(text, voice_id, model, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+def _script(count):
+    return DialogueScript(segments=[
+        DialogueSegment(speaker_id="narrator", voice_id="daniel", text=f"line {i}")
+        for i in range(count)
+    ])
+
+
+class TestSynthesizeScript:
+    """Tests for ElevenLabsClient.synthesize_script()."""
+
+    def test_individual_tts_runs_concurrently_in_order(self):
+        """Test segments run up to max_concurrency at once, in script order."""
+        client = SlowClient()
+
+        results = asyncio.run(client.synthesize_script(
+            _script(8), model="eleven_flash_v2_5", use_dialogue_api=False, max_concurrency=3,
+        ))
+
+        assert [r.character_count for r in results] == [len(f"line {i}") for i in range(8)]
+        assert client.max_in_flight == 3
+
+    def test_failure_cancels_remaining_segments(self):
+        """Test a failed segment cancels the ones not yet started."""
+        client = SlowClient(fail_on="line 0")
+
+        with pytest.raises(RuntimeError, match="line 0"):
+            asyncio.run(client.synthesize_script(
+                _script(8), model="eleven_flash_v2_5", use_dialogue_api=False, max_concurrency=2,
+            ))
+
+        assert len(client.started) < 8
+
+    def test_dialogue_batches_keep_script_order(self):
+        """Test dialogue batches are returned in script order."""
+        client = ElevenLabsClient(dry_run=True, log_requests=False)
+        script = _script(25)
+
+        results = asyncio.run(client.synthesize_script(script, batch_size=10))
+
+        expected = [
+            len(" ".join(seg.to_tagged_text() for seg in script.segments[i:i + 10]))
+            for i in (0, 10, 20)
+        ]
+        assert [r.character_count for r in results] == expected
+
+
+class TestTTSCache:
+    """Tests for the TTSCache content-addressed disk cache."""
+
+    def test_round_trip_and_lru_eviction(self, tmp_path):
+        """Test entries round-trip and the least recently used is evicted."""
+        cache = TTSCache(tmp_path, max_bytes=250)
+        a, b, c = (TTSCache.make_key(name) for name in "abc")
+
+        cache.put(a, b"a" * 100)
+        cache.put(b, b"b" * 100)
+        assert cache.get(a) == b"a" * 100  # a is now most recent
+        cache.put(c, b"c" * 100)
+
+        assert cache.get(b) is None
+        assert cache.get(a) == b"a" * 100
+        assert cache.get(c) == b"c" * 100
+        assert (tmp_path / c[:2] / c).exists()
+
+    def test_reindexes_existing_entries(self, tmp_path):
+        """Test a new cache finds entries written by an earlier one."""
+        key = TTSCache.make_key("voice", "model", "text")
+        TTSCache(tmp_path).put(key, b"mp3")
+
+        assert TTSCache(tmp_path).get(key) == b"mp3"
+
+
+class TestTextToSpeechCache:
+    """Tests for ElevenLabsClient(cache_dir=...)."""
+
+    def test_repeat_request_served_from_cache(self, tmp_path):
+        """Test a repeated request is served from the cache."""
+        requests = []
+
+        async def tts(request):
+            assert request.content_type == "application/json"
+            requests.append(await request.json())
+            return web.Response(body=b"ID3-audio", content_type="audio/mpeg")
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/v1/text-to-speech/{voice_id}", tts)
+            async with TestServer(app) as server:
+                client = ElevenLabsClient(api_key="key", log_requests=False, cache_dir=tmp_path)
+                client.BASE_URL = str(server.make_url("/v1"))
+                async with client:
+                    first = await client.text_to_speech("The traitors strike.", "daniel")
+                    again = await client.text_to_speech("The traitors strike.", "daniel")
+                    other = await client.text_to_speech("The traitors strike.", "aria")
+                return client, first, again, other
+
+        client, first, again, other = asyncio.run(run())
+
+        assert len(requests) == 2
+        assert requests[0]["voice_settings"] == VoiceSettings().to_dict()
+        assert first.audio_data == again.audio_data == other.audio_data == b"ID3-audio"
+        assert (first.credits_used, again.credits_used) == (20, 0)
+        assert client.usage_stats.cache_hits == 1
+        assert client.usage_stats.credits_saved == 20
+        assert client.usage_stats.total_credits == 40
+
+
+class TestRetries:
+    """Tests for retrying transient API errors."""
+
+    def _run(self, responses, call):
+        """Serve responses in order and return (result or error, hit count)."""
+        hits = []
+
+        async def handler(request):
+            hits.append(request.path)
+            return responses[min(len(hits), len(responses)) - 1]()
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/v1/text-to-speech/{voice_id}", handler)
+            app.router.add_post("/v1/text-to-speech/{voice_id}/stream", handler)
+            async with TestServer(app) as server:
+                client = ElevenLabsClient(api_key="key", log_requests=False)
+                client.BASE_URL = str(server.make_url("/v1"))
+                async with client:
+                    try:
+                        return await call(client)
+                    except ElevenLabsAPIError as e:
+                        return e
+
+        return asyncio.run(run()), len(hits)
+
+    @staticmethod
+    def _busy():
+        return web.Response(status=429, headers={"Retry-After": "0"}, text="busy")
+
+    @staticmethod
+    def _ok():
+        return web.Response(body=b"ID3-audio", content_type="audio/mpeg")
+
+    def test_retries_429_then_succeeds(self):
+        """Test rate-limited and 5xx requests are retried until they succeed."""
+        concurrent = '{"detail": {"status": "too_many_concurrent_requests"}}'
+        result, hits = self._run(
+            [
+                lambda: web.Response(status=429, text=concurrent),
+                lambda: web.Response(status=503, headers={"Retry-After": "0"}),
+                self._ok,
+            ],
+            lambda client: client.text_to_speech("Hello.", "daniel"),
+        )
+
+        assert hits == 3
+        assert result.audio_data == b"ID3-audio"
+
+    def test_client_error_is_not_retried(self):
+        """Test non-retryable 4xx errors are raised on the first response."""
+        result, hits = self._run(
+            [lambda: web.Response(status=400, text="bad voice"), self._ok],
+            lambda client: client.text_to_speech("Hello.", "daniel"),
+        )
+
+        assert hits == 1
+        assert isinstance(result, ElevenLabsAPIError)
+        assert result.status_code == 400
+
+    def test_gives_up_after_max_retries(self):
+        """Test a persistent 429 is raised after max_retries retries."""
+        result, hits = self._run(
+            [self._busy],
+            lambda client: client.text_to_speech("Hello.", "daniel"),
+        )
+
+        assert hits == 4
+        assert result.status_code == 429
+
+    def test_retry_delay_is_capped(self):
+        """Test retry delays never exceed the 30s cap."""
+        assert retry_delay(ElevenLabsAPIError(429, "busy", retry_after=120.0), 0) == 30.0
+        assert retry_delay(ElevenLabsAPIError(503, "down"), 10) == 30.0
+        concurrent = ElevenLabsAPIError(429, '{"detail": {"status": "too_many_concurrent_requests"}}')
+        assert retry_delay(concurrent, 3) == 0.0
+
+    def test_stream_retries_before_first_chunk(self):
+        """Test a stream is retried when it fails before yielding audio."""
+        async def collect(client):
+            return b"".join([chunk async for chunk in client.text_to_speech_stream("Hello.", "daniel")])
+
+        result, hits = self._run([self._busy, self._ok], collect)
+
+        assert hits == 2
+        assert result == b"ID3-audio"
+
+
+class TestSingleFlight:
+    """Tests for joining identical in-flight requests."""
+
+    def test_identical_concurrent_requests_share_one_call(self):
+        """Test identical in-flight requests share one API call."""
+        hits = []
+
+        async def tts(request):
+            hits.append((await request.json())["text"])
+            await asyncio.sleep(0.05)
+            return web.Response(body=b"ID3-audio", content_type="audio/mpeg")
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/v1/text-to-speech/{voice_id}", tts)
+            async with TestServer(app) as server:
+                client = ElevenLabsClient(api_key="key", log_requests=False)
+                client.BASE_URL = str(server.make_url("/v1"))
+                async with client:
+                    results = await asyncio.gather(
+                        client.text_to_speech("Banished.", "daniel"),
+                        client.text_to_speech("Banished.", "daniel"),
+                        client.text_to_speech("Murdered.", "daniel"),
+                    )
+                    assert client._inflight == {}
+                return client, results
+
+        client, results = asyncio.run(run())
+
+        assert sorted(hits) == ["Banished.", "Murdered."]
+        assert [r.audio_data for r in results] == [b"ID3-audio"] * 3
+        assert sorted(r.credits_used for r in results) == [0, 9, 9]
+        assert client.usage_stats.cache_hits == 1
+
+
+class TestTextToSpeechStream:
+    """Tests for ElevenLabsClient.text_to_speech_stream."""
+
+    def test_first_bytes_arrive_before_bulk_chunks(self):
+        """Test the first bytes are yielded before the bulk of the stream."""
+        first_received = None
+
+        async def stream(request):
+            response = web.StreamResponse(headers={"Content-Type": "audio/mpeg"})
+            await response.prepare(request)
+            await response.write(b"F" * 418)
+            await first_received.wait()
+            await response.write(b"A" * 40000)
+            await response.write_eof()
+            return response
+
+        async def run():
+            nonlocal first_received
+            first_received = asyncio.Event()
+            app = web.Application()
+            app.router.add_post("/v1/text-to-speech/{voice_id}/stream", stream)
+            async with TestServer(app) as server:
+                client = ElevenLabsClient(api_key="key", log_requests=False)
+                client.BASE_URL = str(server.make_url("/v1"))
+                chunks = []
+                async with client:
+                    async for chunk in client.text_to_speech_stream(
+                        "Hello.", "daniel", min_first_chunk_bytes=400,
+                    ):
+                        chunks.append(chunk)
+                        first_received.set()
+                return chunks
+
+        chunks = asyncio.run(run())
+
+        assert chunks[0] == b"F" * 418
+        assert b"".join(chunks[1:]) == b"A" * 40000
+        assert max(len(c) for c in chunks[1:]) == 16384
+
+    def test_rechunk_passes_first_bytes_then_regroups(self):
+        """Test _rechunk yields early bytes as-is, then fixed-size chunks."""
+        async def arrivals():
+            for size in (300, 300, 5000, 5000, 5000):
+                yield b"x" * size
+
+        async def run():
+            return [len(c) async for c in _rechunk(arrivals(), 4096, 500)]
+
+        assert asyncio.run(run()) == [300, 300, 4096, 4096, 4096, 2712]
+
+
+class TestMetadataCache:
+    """Tests for cached voice and subscription lookups."""
+
+    def test_lookups_reused_until_invalidated(self):
+        """Test voice and subscription lookups are reused until invalidated."""
+        hits = []
+
+        async def voices(request):
+            hits.append(request.path)
+            return web.json_response({"voices": [{"voice_id": "daniel"}]})
+
+        async def subscription(request):
+            hits.append(request.path)
+            return web.json_response({"character_count": len(hits)})
+
+        async def tts(request):
+            return web.Response(body=b"ID3-audio", content_type="audio/mpeg")
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v1/voices", voices)
+            app.router.add_get("/v1/user/subscription", subscription)
+            app.router.add_post("/v1/text-to-speech/{voice_id}", tts)
+            async with TestServer(app) as server:
+                client = ElevenLabsClient(api_key="key", log_requests=False)
+                client.BASE_URL = str(server.make_url("/v1"))
+                async with client:
+                    await client.list_voices()
+                    await client.list_voices()
+                    client.invalidate_voices()
+                    assert await client.list_voices() == [{"voice_id": "daniel"}]
+
+                    before = await client.get_subscription_info()
+                    assert await client.get_subscription_info() == before
+                    await client.text_to_speech("Hello.", "daniel")
+                    after = await client.get_subscription_info()
+                return before, after
+
+        before, after = asyncio.run(run())
+
+        assert hits.count("/v1/voices") == 2
+        assert hits.count("/v1/user/subscription") == 2
+        assert after["character_count"] > before["character_count"]